@@ -0,0 +1,77 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Decoding parsed candles: one Aggregation per bar with per-field parsing vs. CandleArray columns,
+and the cost of resampling the ONE_MINUTE series locally to every coarser granularity.
+
+Run from the repository root after `pip install -e .[candles]`: python benchmarks/bench_candles.py
+"""
+
+import json
+import time
+import timeit
+from datetime import datetime
+
+from intx_sdk.candles import CandleArray, resample_all
+from intx_sdk.services.model import Aggregation
+
+BARS = 100_000
+REPEAT = 5
+
+START = 1_704_067_200
+
+
+def payload() -> list:
+    aggregations = [
+        {
+            "start": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(START + 60 * i)),
+            "open": f"{65000 + i % 100:.1f}",
+            "high": f"{65010 + i % 100:.1f}",
+            "low": f"{64990 + i % 100:.1f}",
+            "close": f"{65005 + i % 100:.1f}",
+            "volume": f"{i % 17 * 0.25:.2f}",
+        }
+        for i in range(BARS)
+    ]
+    # Both paths start from the same decoded JSON, so only the per-bar work is compared
+    return json.loads(json.dumps({"aggregations": aggregations}))["aggregations"]
+
+
+def per_object(aggregations: list):
+    bars = [Aggregation(**a) for a in aggregations]
+    return [(datetime.fromisoformat(b.start), float(b.open), float(b.high), float(b.low), float(b.close),
+             float(b.volume)) for b in bars]
+
+
+def columnar(aggregations: list):
+    return CandleArray.from_aggregations(aggregations)
+
+
+def main():
+    aggregations = payload()
+    per_object_time = min(timeit.repeat(lambda: per_object(aggregations), number=1, repeat=REPEAT))
+    columnar_time = min(timeit.repeat(lambda: columnar(aggregations), number=1, repeat=REPEAT))
+
+    print(f"{'Aggregation + float()':<24} {per_object_time * 1e3:8.1f} ms / {BARS} bars")
+    print(f"{'CandleArray':<24} {columnar_time * 1e3:8.1f} ms / {BARS} bars")
+    print(f"speedup: {per_object_time / columnar_time:.2f}x")
+
+    candles = columnar(aggregations)
+    resample_time = min(timeit.repeat(lambda: resample_all(candles), number=1, repeat=REPEAT))
+    print(f"{'resample_all':<24} {resample_time * 1e3:8.1f} ms / {BARS} bars to 7 granularities")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Building response models: the previous Model(**data) path vs. Decoder's compiled constructors.
+
+Model(**data) leaves enum fields as raw strings and raises on unknown keys; the decoder converts
+enums, tolerates new keys and optionally builds the slotted compact models, which are compared
+with calling the compact class directly. The numeric modes are
+compared with converting every Numeric field to Decimal in user code after Model(**data).
+
+Run from the repository root after `pip install -e .`: python benchmarks/bench_decoder.py
+"""
+
+import dataclasses
+import timeit
+from decimal import Decimal
+from typing import Optional, get_type_hints
+
+from intx_sdk.decoder import Decoder, NUMERIC_DECIMAL, NUMERIC_FLOAT, UNKNOWN_IGNORE
+from intx_sdk.services import compact_model
+from intx_sdk.services.model import Numeric, Order, PortfolioFill
+
+ITERATIONS = 200_000
+REPEAT = 5
+
+ORDER = {
+    "order_id": 2984729347230000,
+    "order_uuid": "018ea1c5-8b24-7c4e-a5a4-8e3e0cf0f0f8",
+    "client_order_id": "bench-0001",
+    "side": "BUY",
+    "instrument_id": 149264167780483072,
+    "instrument_uuid": "b3469e0b-222c-4f8a-9f68-1f9e44d7e5e0",
+    "symbol": "BTC-PERP",
+    "portfolio_id": 5189861793641175,
+    "portfolio_uuid": "018ea1c5-8b24-7c4e-a5a4-8e3e0cf0f0f7",
+    "type": "LIMIT",
+    "price": "65000",
+    "size": "0.0125",
+    "tif": "GTC",
+    "stp_mode": "BOTH",
+    "event_type": "NEW",
+    "order_status": "WORKING",
+    "leaves_qty": "0.0125",
+    "exec_qty": "0",
+    "avg_price": "0",
+    "fee": "0",
+    "post_only": False,
+    "close_only": False,
+    "reduce_only": False,
+}
+
+FILL = {
+    "portfolio_id": "5189861793641175",
+    "portfolio_uuid": "018ea1c5-8b24-7c4e-a5a4-8e3e0cf0f0f7",
+    "fill_id": "2984729347239847",
+    "symbol": "BTC-PERP",
+    "fill_price": "65012.5",
+    "fill_qty": "0.0125",
+    "side": "BUY",
+    "event_time": "2024-06-01T12:00:00.123Z",
+    "order_id": "2984729347230000",
+    "client_order_id": "bench-0001",
+    "fee": "0.40633",
+    "liquidity_indicator": "TAKER",
+}
+
+
+def numeric_fields(cls):
+    hints = get_type_hints(cls)
+    return [f.name for f in dataclasses.fields(cls) if hints[f.name] in (Numeric, Optional[Numeric])]
+
+
+def to_decimal_in_user_code(cls, data, names):
+    obj = cls(**data)
+    for name in names:
+        value = getattr(obj, name)
+        if value is not None:
+            setattr(obj, name, Decimal(str(value)))
+    return obj
+
+
+def main():
+    decoders = (("Decoder()", Decoder()), ("Decoder(unknown='ignore')", Decoder(unknown=UNKNOWN_IGNORE)),
+                ("Decoder(compact=True)", Decoder(compact=True)),
+                ("Decoder(numeric='float')", Decoder(numeric=NUMERIC_FLOAT)),
+                ("Decoder(numeric='decimal')", Decoder(numeric=NUMERIC_DECIMAL)))
+    for cls, data in ((Order, ORDER), (PortfolioFill, FILL)):
+        data = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        names = numeric_fields(cls)
+        compact_cls = compact_model.COMPACT_MODELS[cls]
+        variants = [(f"{cls.__name__}(**data)", lambda: cls(**data)),
+                    (f"compact {cls.__name__}(**data)", lambda: compact_cls(**data)),
+                    ("**data, then Decimal(...)", lambda: to_decimal_in_user_code(cls, data, names))]
+        variants += [(name, lambda decoder=decoder: decoder.decode(cls, data)) for name, decoder in decoders]
+        # Interleave the repeats so that drift on a busy machine affects every variant alike
+        best = {name: float("inf") for name, _ in variants}
+        for _ in range(REPEAT):
+            for name, variant in variants:
+                best[name] = min(best[name], timeit.timeit(variant, number=ITERATIONS))
+
+        print(cls.__name__)
+        baseline = best[variants[0][0]]
+        for name, seconds in best.items():
+            print(f"  {name:<30} {seconds / ITERATIONS * 1e9:8.1f} ns/object  {baseline / seconds:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
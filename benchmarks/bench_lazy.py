@@ -0,0 +1,70 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Decoding a list_instruments payload and reading two fields per item: eager vs. lazy models.
+
+The lazy models keep the decoded JSON dict and convert a field only when it is read, so the cost
+per item is one object instead of a copy of every field. Both variants hold on to about the same
+memory afterwards: the eager models own a copy of each dict, the lazy ones the dict itself.
+
+Run from the repository root after `pip install -e .`: python benchmarks/bench_lazy.py
+"""
+
+import gc
+import timeit
+import tracemalloc
+
+from intx_sdk.decoder import Decoder
+from intx_sdk.services.model import InstrumentDetails
+
+INSTRUMENTS = 1_000
+REPEAT = 7
+
+
+def instrument(i):
+    data = {f: "0" for f in InstrumentDetails.__dataclass_fields__}
+    data.update(instrument_id=str(i), symbol=f"SYM{i}-PERP", quote_increment="0.1", quote={"mark_price": "1"})
+    return data
+
+
+def read_two_fields(decoder, payload):
+    return [(i.symbol, i.quote_increment) for i in decoder.decode_list(InstrumentDetails, payload)]
+
+
+def measure_allocations(decoder, payload) -> float:
+    gc.collect()
+    tracemalloc.start()
+    read_two_fields(decoder, payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / len(payload)
+
+
+def main():
+    payload = [instrument(i) for i in range(INSTRUMENTS)]
+    variants = (("eager", Decoder()), ("lazy", Decoder(lazy=True)))
+    best = {name: float("inf") for name, _ in variants}
+    for _ in range(REPEAT):
+        for name, decoder in variants:
+            best[name] = min(best[name], timeit.timeit(lambda: read_two_fields(decoder, payload), number=10))
+
+    print(f"list_instruments, {INSTRUMENTS} items, {len(InstrumentDetails.__dataclass_fields__)} fields each")
+    for name, decoder in variants:
+        print(f"  {name:<6} {best[name] / 10 / INSTRUMENTS * 1e9:8.1f} ns/item "
+              f"{measure_allocations(decoder, payload):8.1f} peak bytes/item")
+
+
+if __name__ == "__main__":
+    main()
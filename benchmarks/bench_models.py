@@ -0,0 +1,101 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Memory and construction time of response models: plain dataclass vs. slotted vs. frozen slotted.
+
+Run from the repository root after `pip install -e .`: python benchmarks/bench_models.py
+"""
+
+import gc
+import timeit
+import tracemalloc
+
+from intx_sdk.services import compact_model
+from intx_sdk.services.model import Order, PortfolioFill
+
+INSTANCES = 100_000
+REPEAT = 5
+
+FILL = {
+    "portfolio_id": "5189861793641175",
+    "portfolio_uuid": "018ea1c5-8b24-7c4e-a5a4-8e3e0cf0f0f7",
+    "fill_id": "2984729347239847",
+    "symbol": "BTC-PERP",
+    "fill_price": "65012.5",
+    "fill_qty": "0.0125",
+    "side": "BUY",
+    "event_time": "2024-06-01T12:00:00.123Z",
+    "order_id": "2984729347230000",
+    "client_order_id": "bench-0001",
+    "instrument_id": "149264167780483072",
+    "instrument_uuid": "b3469e0b-222c-4f8a-9f68-1f9e44d7e5e0",
+    "fee": "0.40633",
+    "liquidity_indicator": "TAKER",
+}
+
+ORDER = {
+    "order_id": 2984729347230000,
+    "order_uuid": "018ea1c5-8b24-7c4e-a5a4-8e3e0cf0f0f8",
+    "client_order_id": "bench-0001",
+    "side": "BUY",
+    "instrument_id": 149264167780483072,
+    "instrument_uuid": "b3469e0b-222c-4f8a-9f68-1f9e44d7e5e0",
+    "symbol": "BTC-PERP",
+    "portfolio_id": 5189861793641175,
+    "portfolio_uuid": "018ea1c5-8b24-7c4e-a5a4-8e3e0cf0f0f7",
+    "type": "LIMIT",
+    "price": "65000",
+    "size": "0.0125",
+    "tif": "GTC",
+    "stp_mode": "BOTH",
+    "event_type": "NEW",
+    "order_status": "WORKING",
+    "leaves_qty": "0.0125",
+    "exec_qty": "0",
+    "avg_price": "0",
+    "fee": "0",
+    "post_only": False,
+    "close_only": False,
+    "reduce_only": False,
+}
+
+
+def measure_memory(cls, data) -> float:
+    gc.collect()
+    tracemalloc.start()
+    instances = [cls(**data) for _ in range(INSTANCES)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return size / INSTANCES
+
+
+def measure_construction(cls, data) -> float:
+    return min(timeit.repeat(lambda: cls(**data), number=INSTANCES, repeat=REPEAT)) / INSTANCES
+
+
+def main():
+    for cls, data in ((PortfolioFill, FILL), (Order, ORDER)):
+        data = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        variants = (("dataclass", cls), ("slotted", compact_model.slotted(cls)),
+                    ("frozen slotted", compact_model.slotted(cls, frozen=True)))
+        print(cls.__name__)
+        for name, variant in variants:
+            print(f"  {name:<16} {measure_memory(variant, data):8.1f} bytes/instance "
+                  f"{measure_construction(variant, data) * 1e9:8.1f} ns/construct")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-request signing cost: uncached key/headers vs. Client's pre-keyed HMAC and base headers.
+
+Run from the repository root after `pip install -e .`: python benchmarks/bench_signing.py
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+import timeit
+
+from intx_sdk.client import Client
+from intx_sdk.credentials import Credentials
+
+ITERATIONS = 200_000
+
+CREDENTIALS = Credentials(
+    access_key="benchmark_access_key",
+    passphrase="benchmark_passphrase",
+    signing_key=base64.b64encode(b"x" * 64).decode(),
+)
+BODY = {
+    "client_order_id": "bench-0001",
+    "side": "BUY",
+    "size": "0.01",
+    "tif": "GTC",
+    "instrument": "BTC-PERP",
+    "type": "LIMIT",
+    "price": "65000.5",
+}
+
+
+def uncached_sign(credentials: Credentials, message: str) -> str:
+    h = hmac.new(base64.b64decode(credentials.signing_key), message.encode(), hashlib.sha256)
+    return base64.b64encode(h.digest()).decode()
+
+
+def uncached_generate_headers(credentials: Credentials, method: str, path: str, body):
+    # Equivalent of the previous implementation: decode the key and rebuild every header per request
+    timestamp = str(int(time.time()))
+    body_string = json.dumps(body) if body else ""
+    message = f"{timestamp}{method}{path}{body_string}"
+    signature = uncached_sign(credentials, message)
+    return {
+        "Accept": "application/json",
+        "CB-ACCESS-KEY": credentials.access_key,
+        "CB-ACCESS-PASSPHRASE": credentials.passphrase,
+        "CB-ACCESS-SIGN": signature,
+        "CB-ACCESS-TIMESTAMP": timestamp,
+        "Content-Type": "application/json",
+    }
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<28} {seconds / ITERATIONS * 1e6:8.3f} us/request")
+
+
+def main():
+    client = Client(CREDENTIALS)
+    path = "/api/v1/orders"
+
+    message = f"{int(time.time())}POST{path}{json.dumps(BODY)}"
+
+    uncached_sign_time = timeit.timeit(lambda: uncached_sign(CREDENTIALS, message), number=ITERATIONS)
+    cached_sign_time = timeit.timeit(lambda: client.sign(message), number=ITERATIONS)
+    uncached_headers_time = timeit.timeit(lambda: uncached_generate_headers(CREDENTIALS, "POST", path, BODY),
+                                          number=ITERATIONS)
+    cached_headers_time = timeit.timeit(lambda: client.generate_headers("POST", path, BODY), number=ITERATIONS)
+
+    report("uncached sign", uncached_sign_time)
+    report("cached sign", cached_sign_time)
+    print(f"sign speedup: {uncached_sign_time / cached_sign_time:.2f}x")
+    report("uncached generate_headers", uncached_headers_time)
+    report("cached generate_headers", cached_headers_time)
+    print(f"generate_headers speedup: {uncached_headers_time / cached_headers_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
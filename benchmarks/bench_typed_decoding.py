@@ -0,0 +1,85 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Cost of typed decoding on top of JSON parsing for the endpoints that used to return raw dicts.
+
+For each payload: parsing the body only (what list_instruments, get_index_composition and
+list_fee_rate_tiers used to return), parsing plus eager decoding into the models, and parsing plus
+lazy decoding. Uses orjson when it is installed, like the client.
+
+Run from the repository root after `pip install -e .`: python benchmarks/bench_typed_decoding.py
+"""
+
+import timeit
+
+from intx_sdk.decoder import Decoder
+from intx_sdk.json_codec import default_json_codec
+from intx_sdk.services.model import FeeTier, IndexComposition, InstrumentDetails
+
+REPEAT = 7
+
+
+def instrument(i):
+    data = {f: "0" for f in InstrumentDetails.__dataclass_fields__}
+    data.update(instrument_id=str(i), symbol=f"SYM{i}-PERP", price_band_percent=0.05, quote={"mark_price": "1"})
+    return data
+
+
+def constituent(i):
+    return {"symbol": f"C{i}", "name": f"Coin {i}", "rank": i, "cap_factor": "1", "amount": "100.5",
+            "market_cap": "1000000", "index_market_cap": "900000", "weight": "0.02", "running_weight": "0.5"}
+
+
+def fee_tier(i):
+    return {"fee_tier_type": "REGULAR", "instrument_type": "PERP", "fee_tier_id": i, "fee_tier_name": f"Tier {i}",
+            "maker_fee_rate": "0.0002", "taker_fee_rate": "0.0005", "min_balance": "0", "min_volume": "1000000",
+            "require_balance_and_volume": False}
+
+
+PAYLOADS = (
+    ("list_instruments (300 items)", InstrumentDetails, True, [instrument(i) for i in range(300)]),
+    ("get_index_composition (50 constituents)", IndexComposition, False,
+     {"product_id": "COIN50", "divisor": "1.5", "timestamp": "t", "inception_timestamp": "t", "last_rebalance": "t",
+      "constituents": [constituent(i) for i in range(50)]}),
+    ("list_fee_rate_tiers (10 items)", FeeTier, True, [fee_tier(i) for i in range(10)]),
+)
+
+
+def main():
+    codec = default_json_codec()
+    eager, lazy = Decoder(), Decoder(lazy=True)
+    for title, cls, is_list, payload in PAYLOADS:
+        body = codec.dumps(payload)
+
+        def decode(decoder):
+            data = codec.loads(body)
+            return decoder.decode_list(cls, data) if is_list else decoder.decode(cls, data)
+
+        variants = (("raw dicts", lambda: codec.loads(body)), ("typed", lambda: decode(eager)),
+                    ("typed, lazy", lambda: decode(lazy)))
+        number = max(1, 2_000_000 // len(body))
+        best = {name: float("inf") for name, _ in variants}
+        for _ in range(REPEAT):
+            for name, variant in variants:
+                best[name] = min(best[name], timeit.timeit(variant, number=number))
+
+        print(f"{title}, {len(body)} bytes")
+        baseline = best["raw dicts"]
+        for name, seconds in best.items():
+            print(f"  {name:<12} {seconds / number * 1e6:9.1f} us/response  {seconds / baseline:5.2f}x raw")
+
+
+if __name__ == "__main__":
+    main()
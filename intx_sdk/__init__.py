@@ -13,14 +13,48 @@
 #  limitations under the License.
 
 from intx_sdk.client_services import IntxServicesClient
+from intx_sdk.async_client_services import AsyncIntxServicesClient
 from intx_sdk.credentials import Credentials
 from intx_sdk.client import Client
+from intx_sdk.async_client import AsyncClient
 from intx_sdk.constants import PRODUCTION_BASE_URL, SANDBOX_BASE_URL
+from intx_sdk.transport import TransportConfig
+from intx_sdk.rate_limit import RateLimiter, RateLimit, EndpointClass
+from intx_sdk.retry import RetryPolicy
+from intx_sdk.errors import (
+    IntxError,
+    ValidationError,
+    PreTradeValidationError,
+    AuthenticationError,
+    NotFoundError,
+    RateLimitedError,
+    ServerError,
+    IntxTimeoutError,
+    IntxConnectionError,
+    DecodeError,
+)
 
 __all__ = [
     "IntxServicesClient",
+    "AsyncIntxServicesClient",
     "Credentials",
     "Client",
+    "AsyncClient",
+    "TransportConfig",
+    "RateLimiter",
+    "RateLimit",
+    "EndpointClass",
+    "RetryPolicy",
+    "IntxError",
+    "ValidationError",
+    "PreTradeValidationError",
+    "AuthenticationError",
+    "NotFoundError",
+    "RateLimitedError",
+    "ServerError",
+    "IntxTimeoutError",
+    "IntxConnectionError",
+    "DecodeError",
     "PRODUCTION_BASE_URL",
     "SANDBOX_BASE_URL",
 ]
\ No newline at end of file
@@ -0,0 +1,135 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised only without the async extra
+    aiohttp = None
+
+from intx_sdk.client import Client
+from intx_sdk.credentials import Credentials
+from intx_sdk.constants import DEFAULT_V1_API_BASE_URL
+from intx_sdk.json_codec import JsonCodec, default_json_codec
+from intx_sdk.transport import TransportConfig
+from intx_sdk.rate_limit import RateLimiter
+from intx_sdk.decoder import Decoder
+from intx_sdk.retry import RetryPolicy, parse_retry_after
+
+# One event loop keeps far more requests in flight than a thread pool, so the async pool is larger by default
+DEFAULT_ASYNC_POOL_MAXSIZE = 100
+
+
+class AsyncResponse:
+    """Fully read HTTP response, exposing the subset of requests.Response used by the services."""
+
+    def __init__(self, status_code: int, headers: Mapping[str, str], content: bytes,
+                 loads: Optional[Callable[[bytes], Any]] = None):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.loads = loads if loads else default_json_codec().loads
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return self.loads(self.content)
+
+
+class AsyncClient(Client):
+    def __init__(
+            self,
+            credentials: Credentials,
+            http_client: Optional["aiohttp.ClientSession"] = None,
+            base_url: Optional[str] = None,
+            json_codec: Optional[JsonCodec] = None,
+            transport: Optional[TransportConfig] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            decoder: Optional[Decoder] = None
+    ):
+        if aiohttp is None:
+            raise ImportError("AsyncClient requires aiohttp; install it with `pip install intx-sdk-py[async]`")
+        self.http_base_url = base_url if base_url else DEFAULT_V1_API_BASE_URL
+        self.credentials = credentials
+        self.transport = transport if transport else TransportConfig(pool_maxsize=DEFAULT_ASYNC_POOL_MAXSIZE)
+        self.json_codec = json_codec if json_codec else default_json_codec()
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy if retry_policy else RetryPolicy()
+        self.decoder = decoder if decoder else Decoder()
+        # The session is created on first use so that it binds to the running event loop
+        self.http_client = http_client
+        self._owns_http_client = http_client is None
+        self.init_signing()
+
+    def _session(self) -> "aiohttp.ClientSession":
+        if self.http_client is None or self.http_client.closed:
+            transport = self.transport
+            # aiohttp enables SO_KEEPALIVE on its sockets itself; idle pooled connections expire after max_idle_time
+            connector = aiohttp.TCPConnector(
+                limit=transport.pool_connections * transport.pool_maxsize,
+                limit_per_host=transport.pool_maxsize,
+                keepalive_timeout=transport.max_idle_time if transport.max_idle_time is not None else 15.0,
+            )
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=transport.connect_timeout,
+                                            sock_read=transport.read_timeout)
+            self.http_client = aiohttp.ClientSession(connector=connector, timeout=timeout)
+            self._owns_http_client = True
+        return self.http_client
+
+    async def request(self, method: str, path: str, query: Optional[str] = "", body: Optional[Dict] = None,
+                      allowed_status_codes: Optional[List[int]] = None, idempotent: bool = False) -> AsyncResponse:
+        if allowed_status_codes is None:
+            allowed_status_codes = [200]
+        full_path = f"{self.http_base_url}{path}"
+        url = f"{full_path}?{query}" if query else full_path
+
+        body_bytes = self.encode_body(body)
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async(method, path)
+
+            headers = self.generate_headers(method, f"/api/v1{path}", body_bytes)
+            try:
+                async with self._session().request(method, url, headers=headers, data=body_bytes) as http_response:
+                    content = await http_response.read()
+                    response = AsyncResponse(http_response.status, http_response.headers, content,
+                                             self.json_codec.loads)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if not self.retry_policy.is_retryable(method, attempt, idempotent):
+                    raise self.transport_error(e, isinstance(e, asyncio.TimeoutError), method, path,
+                                               time.perf_counter() - started) from e
+                await asyncio.sleep(self.retry_policy.backoff(attempt))
+                continue
+
+            if response.status_code not in allowed_status_codes and \
+                    self.retry_policy.is_retryable(method, attempt, idempotent, response.status_code):
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                await asyncio.sleep(self.retry_policy.backoff(attempt, retry_after))
+                continue
+
+            self.check_response(response, allowed_status_codes, method, path, time.perf_counter() - started)
+            return response
+
+    async def close(self) -> None:
+        if self._owns_http_client and self.http_client is not None and not self.http_client.closed:
+            await self.http_client.close()
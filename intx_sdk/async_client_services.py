@@ -0,0 +1,75 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+from typing import Optional
+from intx_sdk.async_client import AsyncClient
+from intx_sdk.client_services import lazy_service
+from intx_sdk.credentials import Credentials
+from intx_sdk.constants import PRODUCTION_BASE_URL
+from intx_sdk.json_codec import JsonCodec
+from intx_sdk.transport import TransportConfig
+from intx_sdk.rate_limit import RateLimiter
+from intx_sdk.decoder import Decoder
+from intx_sdk.retry import RetryPolicy
+
+
+class AsyncIntxServicesClient:
+    def __init__(self, credentials: Credentials, base_url: Optional[str] = None,
+                 json_codec: Optional[JsonCodec] = None, transport: Optional[TransportConfig] = None,
+                 rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None,
+                 decoder: Optional[Decoder] = None):
+        self._client = AsyncClient(credentials, base_url=base_url, json_codec=json_codec, transport=transport,
+                                   rate_limiter=rate_limiter, retry_policy=retry_policy, decoder=decoder)
+
+    @classmethod
+    def from_env(cls, variable_name: str = 'INTX_CREDENTIALS',
+                 base_url: Optional[str] = None,
+                 json_codec: Optional[JsonCodec] = None,
+                 transport: Optional[TransportConfig] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 decoder: Optional[Decoder] = None) -> 'AsyncIntxServicesClient':
+        credentials = Credentials.from_env(variable_name)
+
+        # Same base_url resolution as IntxServicesClient.from_env
+        if base_url is None:
+            base_url = os.getenv('INTX_BASE_URL', PRODUCTION_BASE_URL)
+
+        return cls(credentials, base_url, json_codec=json_codec, transport=transport, rate_limiter=rate_limiter,
+                   retry_policy=retry_policy, decoder=decoder)
+
+    @property
+    def client(self) -> AsyncClient:
+        return self._client
+
+    async def close(self) -> None:
+        await self._client.close()
+
+    async def __aenter__(self) -> 'AsyncIntxServicesClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    # Import services dynamically to avoid circular imports
+    portfolios = lazy_service(lambda: __import__('intx_sdk.services.portfolios', fromlist=['AsyncPortfoliosService']).AsyncPortfoliosService)
+    rankings = lazy_service(lambda: __import__('intx_sdk.services.rankings', fromlist=['AsyncRankingsService']).AsyncRankingsService)
+    positionoffsets = lazy_service(lambda: __import__('intx_sdk.services.positionoffsets', fromlist=['AsyncPositionOffsetsService']).AsyncPositionOffsetsService)
+    transfers = lazy_service(lambda: __import__('intx_sdk.services.transfers', fromlist=['AsyncTransfersService']).AsyncTransfersService)
+    orders = lazy_service(lambda: __import__('intx_sdk.services.orders', fromlist=['AsyncOrdersService']).AsyncOrdersService)
+    index = lazy_service(lambda: __import__('intx_sdk.services.index', fromlist=['AsyncIndexService']).AsyncIndexService)
+    instruments = lazy_service(lambda: __import__('intx_sdk.services.instruments', fromlist=['AsyncInstrumentsService']).AsyncInstrumentsService)
+    assets = lazy_service(lambda: __import__('intx_sdk.services.assets', fromlist=['AsyncAssetsService']).AsyncAssetsService)
+    feerates = lazy_service(lambda: __import__('intx_sdk.services.feerates', fromlist=['AsyncFeeRatesService']).AsyncFeeRatesService)
+    addressbook = lazy_service(lambda: __import__('intx_sdk.services.addressbook', fromlist=['AsyncAddressBookService']).AsyncAddressBookService)
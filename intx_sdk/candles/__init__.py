@@ -0,0 +1,33 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from .columnar import CandleArray, concat
+from .fetcher import chunk_ranges, fetch_candle_range, fetch_candle_range_async
+from .resample import resample, resample_all
+from .store import CandleStore
+from .timeframes import GRANULARITY_SECONDS, granularity_seconds
+
+__all__ = [
+    "CandleArray",
+    "concat",
+    "chunk_ranges",
+    "fetch_candle_range",
+    "fetch_candle_range_async",
+    "resample",
+    "resample_all",
+    "CandleStore",
+    "GRANULARITY_SECONDS",
+    "granularity_seconds",
+]
@@ -0,0 +1,122 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass, fields
+from operator import attrgetter, itemgetter
+from typing import Any, Iterable, List
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def require_numpy() -> None:
+    if np is None:
+        raise ImportError("Columnar candles require numpy; install it with `pip install intx-sdk-py[candles]`")
+
+
+def parse_start(values: List[Any]) -> "np.ndarray":
+    """Parse candle start times, given as ISO 8601 strings or epoch seconds, to datetime64[s]"""
+    if not values:
+        return np.empty(0, dtype="datetime64[s]")
+    if str(values[0]).isdigit():
+        return np.array(values, dtype=np.int64).astype("datetime64[s]")
+    # numpy rejects the UTC designator, and stripping it per string is cheaper than np.char
+    return np.array([value.rstrip("Z") for value in values], dtype="datetime64[s]")
+
+
+@dataclass
+class CandleArray:
+    """OHLCV candles stored column-wise: start is datetime64[s], prices and volume are float64.
+
+    Missing volumes are NaN. Build one from API aggregations with from_aggregations(), which parses
+    each column in a single vectorized pass instead of creating an Aggregation object per bar.
+    """
+    start: "np.ndarray"
+    open: "np.ndarray"
+    high: "np.ndarray"
+    low: "np.ndarray"
+    close: "np.ndarray"
+    volume: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @classmethod
+    def empty(cls) -> "CandleArray":
+        require_numpy()
+        return cls(np.empty(0, dtype="datetime64[s]"), *(np.empty(0) for _ in PRICE_COLUMNS))
+
+    @classmethod
+    def from_aggregations(cls, aggregations: Iterable[Any]) -> "CandleArray":
+        """Build from decoded aggregation dicts or from Aggregation objects (all one kind)"""
+        require_numpy()
+        rows = aggregations if isinstance(aggregations, list) else list(aggregations)
+        if not rows:
+            return cls.empty()
+        count = len(rows)
+        getter = itemgetter if isinstance(rows[0], dict) else attrgetter
+        # Each column goes from the decoded rows to float64 without an intermediate list or dict per bar
+        prices = [np.fromiter(map(float, map(getter(name), rows)), dtype=np.float64, count=count)
+                  for name in PRICE_COLUMNS[:-1]]
+        # volume is optional in the API payload; a missing or null volume is NaN
+        volumes = [row.get("volume") for row in rows] if getter is itemgetter else list(map(getter("volume"), rows))
+        if None in volumes:
+            volumes = [np.nan if volume is None else volume for volume in volumes]
+        volume = np.fromiter(map(float, volumes), dtype=np.float64, count=count)
+        return cls(parse_start(list(map(getter("start"), rows))), *prices, volume)
+
+    @property
+    def epoch_seconds(self) -> "np.ndarray":
+        return self.start.astype(np.int64)
+
+    def take(self, index) -> "CandleArray":
+        """Select bars by slice, integer array or boolean mask"""
+        return CandleArray(*(getattr(self, f.name)[index] for f in fields(self)))
+
+    def to_aggregations(self) -> List[dict]:
+        """Convert back to aggregation dicts in the API's string format"""
+        starts = np.datetime_as_string(self.start, unit="s")
+        return [
+            {"start": f"{s}Z", "open": repr(o), "high": repr(h), "low": repr(lo), "close": repr(c),
+             "volume": None if v != v else repr(v)}
+            for s, o, h, lo, c, v in zip(starts, *(getattr(self, name).tolist() for name in PRICE_COLUMNS))
+        ]
+
+    def to_pandas(self):
+        """Return a pandas DataFrame indexed by start"""
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("CandleArray.to_pandas requires pandas; install it with `pip install pandas`")
+        return pd.DataFrame({name: getattr(self, name) for name in PRICE_COLUMNS},
+                            index=pd.DatetimeIndex(self.start, name="start"))
+
+    def to_arrow(self):
+        """Return a pyarrow Table with a timestamp[s] start column"""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("CandleArray.to_arrow requires pyarrow; install it with `pip install pyarrow`")
+        return pa.table({f.name: getattr(self, f.name) for f in fields(self)})
+
+
+def concat(arrays: Iterable[CandleArray]) -> CandleArray:
+    arrays = list(arrays)
+    if not arrays:
+        return CandleArray.empty()
+    return CandleArray(*(np.concatenate([getattr(a, f.name) for a in arrays]) for f in fields(CandleArray)))
@@ -0,0 +1,75 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Iterable, List, Optional, Tuple
+from intx_sdk.enums import Granularity
+from .columnar import CandleArray, concat, np
+from .timeframes import TimeLike, floor_to, format_epoch_seconds, granularity_seconds, to_epoch_seconds
+
+DEFAULT_MAX_BARS_PER_REQUEST = 300
+DEFAULT_MAX_WORKERS = 4
+
+# fetch(start, end) -> bars for one chunk; the API may include the bar starting at `end`
+FetchChunk = Callable[[str, str], CandleArray]
+AsyncFetchChunk = Callable[[str, str], Awaitable[CandleArray]]
+
+
+def chunk_ranges(start: TimeLike, end: Optional[TimeLike], granularity: Granularity,
+                 max_bars: int = DEFAULT_MAX_BARS_PER_REQUEST) -> List[Tuple[int, int]]:
+    """Split [start, end) into epoch-second chunks of at most max_bars bars, aligned to the granularity"""
+    step = granularity_seconds(granularity)
+    start_seconds = floor_to(to_epoch_seconds(start), step)
+    end_seconds = to_epoch_seconds(end) if end is not None else int(time.time())
+    span = step * max_bars
+    return [(chunk_start, min(chunk_start + span, end_seconds))
+            for chunk_start in range(start_seconds, end_seconds, span)]
+
+
+def stitch(chunks: Iterable[CandleArray], start: int, end: int) -> CandleArray:
+    """Concatenate chunk results into one series sorted by start, without duplicates, within [start, end)"""
+    candles = concat(chunks)
+    seconds = candles.epoch_seconds
+    candles = candles.take((seconds >= start) & (seconds < end))
+    return candles.take(np.unique(candles.epoch_seconds, return_index=True)[1])
+
+
+def fetch_candle_range(fetch: FetchChunk, start: TimeLike, end: Optional[TimeLike], granularity: Granularity,
+                       max_bars: int = DEFAULT_MAX_BARS_PER_REQUEST,
+                       max_workers: int = DEFAULT_MAX_WORKERS) -> CandleArray:
+    """Fetch any range in per-call-sized chunks on up to max_workers threads and stitch the results"""
+    chunks = chunk_ranges(start, end, granularity, max_bars)
+    if not chunks:
+        return CandleArray.empty()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(lambda chunk: fetch(*map(format_epoch_seconds, chunk)), chunks))
+    return stitch(results, chunks[0][0], chunks[-1][1])
+
+
+async def fetch_candle_range_async(fetch: AsyncFetchChunk, start: TimeLike, end: Optional[TimeLike],
+                                   granularity: Granularity, max_bars: int = DEFAULT_MAX_BARS_PER_REQUEST,
+                                   max_workers: int = DEFAULT_MAX_WORKERS) -> CandleArray:
+    chunks = chunk_ranges(start, end, granularity, max_bars)
+    if not chunks:
+        return CandleArray.empty()
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def fetch_chunk(chunk: Tuple[int, int]) -> CandleArray:
+        async with semaphore:
+            return await fetch(*map(format_epoch_seconds, chunk))
+
+    results = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+    return stitch(results, chunks[0][0], chunks[-1][1])
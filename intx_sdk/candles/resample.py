@@ -0,0 +1,71 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Dict, Iterable, Union
+from intx_sdk.enums import Granularity
+from .columnar import CandleArray, np
+from .timeframes import granularity_seconds
+
+
+def resample(candles: Union[CandleArray, Iterable[Any]], granularity: Granularity,
+             source_granularity: Granularity = Granularity.ONE_MINUTE) -> CandleArray:
+    """Aggregate finer bars into `granularity` bars aligned to the epoch (so ONE_DAY starts at 00:00 UTC).
+
+    Each output bar takes the open of its first input bar, the close of its last, the max high, the
+    min low and the summed volume; it is NaN only if every input volume is. Input may be a CandleArray
+    or aggregations in any order; buckets with no input bars are omitted, and the last bucket may be
+    partial if the input ends mid-period.
+    """
+    if not isinstance(candles, CandleArray):
+        candles = CandleArray.from_aggregations(candles)
+    step = granularity_seconds(granularity)
+    source_step = granularity_seconds(source_granularity)
+    if step < source_step or step % source_step:
+        raise ValueError(f"Cannot resample {Granularity(source_granularity).value} bars "
+                         f"to {Granularity(granularity).value}")
+    if not len(candles):
+        return CandleArray.empty()
+
+    seconds = candles.epoch_seconds
+    if np.any(seconds[1:] < seconds[:-1]):
+        order = np.argsort(seconds, kind="stable")
+        candles, seconds = candles.take(order), seconds[order]
+
+    buckets = seconds - seconds % step
+    firsts = np.concatenate(([0], np.flatnonzero(buckets[1:] != buckets[:-1]) + 1))
+    lasts = np.append(firsts[1:], len(buckets)) - 1
+
+    missing_volume = np.isnan(candles.volume)
+    volume = np.add.reduceat(np.where(missing_volume, 0.0, candles.volume), firsts)
+    volume[np.logical_and.reduceat(missing_volume, firsts)] = np.nan
+
+    return CandleArray(
+        buckets[firsts].astype("datetime64[s]"),
+        candles.open[firsts],
+        np.maximum.reduceat(candles.high, firsts),
+        np.minimum.reduceat(candles.low, firsts),
+        candles.close[lasts],
+        volume,
+    )
+
+
+def resample_all(candles: Union[CandleArray, Iterable[Any]],
+                 source_granularity: Granularity = Granularity.ONE_MINUTE) -> Dict[Granularity, CandleArray]:
+    """Derive every coarser granularity from one base series"""
+    if not isinstance(candles, CandleArray):
+        candles = CandleArray.from_aggregations(candles)
+    source_step = granularity_seconds(source_granularity)
+    return {granularity: resample(candles, granularity, source_granularity)
+            for granularity in Granularity
+            if granularity_seconds(granularity) > source_step and granularity_seconds(granularity) % source_step == 0}
@@ -0,0 +1,170 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import time
+from typing import Callable, List, Optional, Tuple
+from intx_sdk.enums import Granularity
+from .columnar import CandleArray, PRICE_COLUMNS, np, require_numpy
+from .timeframes import TimeLike, floor_to, format_epoch_seconds, granularity_seconds, to_epoch_seconds
+
+INSTRUMENT_SOURCE = "instruments"
+INDEX_SOURCE = "index"
+
+# fetch(start, end) -> bars whose start lies in [start, end)
+FetchCandles = Callable[[str, str], CandleArray]
+
+
+def bar_dtype():
+    return np.dtype([("start", "<i8")] + [(name, "<f8") for name in PRICE_COLUMNS])
+
+
+def merge_intervals(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_intervals(start: int, end: int, covered: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Parts of [start, end) not inside any of the merged `covered` intervals"""
+    missing = []
+    for covered_start, covered_end in covered:
+        if covered_end <= start or covered_start >= end:
+            continue
+        if covered_start > start:
+            missing.append((start, covered_start))
+        start = max(start, covered_end)
+    if start < end:
+        missing.append((start, end))
+    return missing
+
+
+class CandleStore:
+    """Local append-only candle history, one file per source, instrument or index, and granularity.
+
+    Bars are stored as fixed-width records sorted by start and read back through np.memmap, so range
+    queries touch only the pages they need and never hit the network. A sidecar file records which
+    time ranges have already been fetched; sync() downloads only what is missing from a requested
+    range, including holes left by earlier interrupted or partial syncs. Bars that are still forming
+    (start after the last complete bar) are never stored. The store expects one writer at a time.
+    """
+
+    def __init__(self, root: str, clock: Callable[[], float] = time.time):
+        require_numpy()
+        self.root = os.path.expanduser(root)
+        self.clock = clock
+
+    def path(self, source: str, name: str, granularity: Granularity) -> str:
+        return os.path.join(self.root, source, name.replace(os.sep, "_"), f"{Granularity(granularity).value}.bars")
+
+    def bars(self, source: str, name: str, granularity: Granularity) -> "np.ndarray":
+        path = self.path(source, name, granularity)
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return np.empty(0, dtype=bar_dtype())
+        return np.memmap(path, dtype=bar_dtype(), mode="r")
+
+    def read(self, source: str, name: str, granularity: Granularity,
+             start: Optional[TimeLike] = None, end: Optional[TimeLike] = None) -> CandleArray:
+        """Stored bars with start in [start, end), read from disk only"""
+        bars = self.bars(source, name, granularity)
+        lo = 0 if start is None else np.searchsorted(bars["start"], to_epoch_seconds(start), "left")
+        hi = len(bars) if end is None else np.searchsorted(bars["start"], to_epoch_seconds(end), "left")
+        selected = np.array(bars[lo:hi])
+        return CandleArray(selected["start"].astype("datetime64[s]"),
+                           *(selected[name] for name in PRICE_COLUMNS))
+
+    def last_start(self, source: str, name: str, granularity: Granularity) -> Optional["np.datetime64"]:
+        bars = self.bars(source, name, granularity)
+        return bars["start"][-1].astype("datetime64[s]") if len(bars) else None
+
+    def coverage(self, source: str, name: str, granularity: Granularity) -> List[Tuple[int, int]]:
+        path = self.path(source, name, granularity) + ".coverage"
+        if not os.path.exists(path):
+            return []
+        with open(path) as f:
+            return [tuple(interval) for interval in json.load(f)]
+
+    def gaps(self, source: str, name: str, granularity: Granularity,
+             start: TimeLike, end: Optional[TimeLike] = None) -> List[Tuple[int, int]]:
+        """Epoch-second [start, end) ranges of complete bars that have not been fetched yet"""
+        step = granularity_seconds(granularity)
+        last_complete = floor_to(int(self.clock()), step)
+        start_seconds = floor_to(to_epoch_seconds(start), step)
+        end_seconds = last_complete if end is None else min(to_epoch_seconds(end), last_complete)
+        return subtract_intervals(start_seconds, end_seconds, self.coverage(source, name, granularity))
+
+    def write(self, source: str, name: str, granularity: Granularity, candles: CandleArray,
+              start: int, end: int) -> int:
+        """Store the bars of `candles` within [start, end) and mark that range fetched; returns bars written"""
+        new = np.empty(len(candles), dtype=bar_dtype())
+        new["start"] = candles.epoch_seconds
+        for column in PRICE_COLUMNS:
+            new[column] = getattr(candles, column)
+        new = new[(new["start"] >= start) & (new["start"] < end)]
+        new = new[np.unique(new["start"], return_index=True)[1]]
+
+        path = self.path(source, name, granularity)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        existing = self.bars(source, name, granularity)
+        if len(new) and (not len(existing) or new["start"][0] > existing["start"][-1]):
+            with open(path, "ab") as f:
+                f.write(new.tobytes())
+        elif len(new):
+            # Backfilling behind the last stored bar: merge, letting fresh bars win, and swap the file
+            combined = np.concatenate([new, np.array(existing)])
+            del existing
+            combined = combined[np.unique(combined["start"], return_index=True)[1]]
+            with open(path + ".tmp", "wb") as f:
+                f.write(combined.tobytes())
+            os.replace(path + ".tmp", path)
+
+        coverage = merge_intervals(self.coverage(source, name, granularity) + [(start, end)])
+        with open(path + ".coverage.tmp", "w") as f:
+            json.dump(coverage, f)
+        os.replace(path + ".coverage.tmp", path + ".coverage")
+        return len(new)
+
+    def sync(self, source: str, name: str, granularity: Granularity, fetch: FetchCandles,
+             start: TimeLike, end: Optional[TimeLike] = None) -> int:
+        """Fetch only the missing parts of [start, end) (default: up to the last complete bar); returns bars written"""
+        written = 0
+        for gap_start, gap_end in self.gaps(source, name, granularity, start, end):
+            candles = fetch(format_epoch_seconds(gap_start), format_epoch_seconds(gap_end))
+            written += self.write(source, name, granularity, candles, gap_start, gap_end)
+        return written
+
+    def sync_instrument(self, service, instrument: str, granularity: Granularity,
+                        start: TimeLike, end: Optional[TimeLike] = None) -> int:
+        from intx_sdk.services.instruments import GetAggregatedCandlesRequest
+
+        def fetch(range_start: str, range_end: str) -> CandleArray:
+            return service.get_aggregated_candles_range(GetAggregatedCandlesRequest(
+                instrument=instrument, granularity=granularity, start=range_start, end=range_end))
+
+        return self.sync(INSTRUMENT_SOURCE, instrument, granularity, fetch, start, end)
+
+    def sync_index(self, service, index: str, granularity: Granularity,
+                   start: TimeLike, end: Optional[TimeLike] = None) -> int:
+        from intx_sdk.services.index import GetIndexCandlesRequest
+
+        def fetch(range_start: str, range_end: str) -> CandleArray:
+            return service.get_index_candles_range(GetIndexCandlesRequest(
+                index=index, granularity=granularity, start=range_start, end=range_end))
+
+        return self.sync(INDEX_SOURCE, index, granularity, fetch, start, end)
@@ -0,0 +1,56 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from datetime import datetime, timezone
+from typing import Union
+from intx_sdk.enums import Granularity
+
+GRANULARITY_SECONDS = {
+    Granularity.ONE_MINUTE: 60,
+    Granularity.FIVE_MINUTE: 5 * 60,
+    Granularity.FIFTEEN_MINUTE: 15 * 60,
+    Granularity.THIRTY_MINUTE: 30 * 60,
+    Granularity.ONE_HOUR: 60 * 60,
+    Granularity.TWO_HOUR: 2 * 60 * 60,
+    Granularity.SIX_HOUR: 6 * 60 * 60,
+    Granularity.ONE_DAY: 24 * 60 * 60,
+}
+
+TimeLike = Union[str, int, datetime]
+
+
+def granularity_seconds(granularity: Granularity) -> int:
+    return GRANULARITY_SECONDS[Granularity(granularity)]
+
+
+def to_epoch_seconds(value: TimeLike) -> int:
+    """Convert an ISO 8601 string, epoch seconds or datetime (naive means UTC) to epoch seconds"""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        if value.isdigit():
+            return int(value)
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def format_epoch_seconds(seconds: int) -> str:
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def floor_to(seconds: int, step: int) -> int:
+    return seconds - seconds % step
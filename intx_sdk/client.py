@@ -13,14 +13,23 @@
 #  limitations under the License.
 
 import time
-import json
+import threading
 import hmac
 import hashlib
 import base64
-from typing import Optional, Dict, List
+import binascii
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Optional, Dict, List, Mapping, Union
 import requests
 
 from intx_sdk.credentials import Credentials
+from intx_sdk.json_codec import JsonCodec, default_json_codec
+from intx_sdk.transport import TransportConfig, configure_session
+from intx_sdk.rate_limit import RateLimiter
+from intx_sdk.decoder import Decoder
+from intx_sdk.retry import RetryPolicy, parse_retry_after
+from intx_sdk.errors import IntxError, IntxConnectionError, IntxTimeoutError, RateLimitedError, error_class_for_status
 from intx_sdk.constants import PRODUCTION_BASE_URL, SANDBOX_BASE_URL, DEFAULT_V1_API_BASE_URL
 
 
@@ -29,46 +38,147 @@ class Client:
             self,
             credentials: Credentials,
             http_client: Optional[requests.Session] = None,
-            base_url: Optional[str] = None
+            base_url: Optional[str] = None,
+            json_codec: Optional[JsonCodec] = None,
+            transport: Optional[TransportConfig] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            decoder: Optional[Decoder] = None
     ):
         self.http_base_url = base_url if base_url else DEFAULT_V1_API_BASE_URL
         self.credentials = credentials
-        self.http_client = http_client if http_client else requests.Session()
+        self.transport = transport if transport else TransportConfig()
+        # A caller-supplied session keeps its own adapters unless a transport is given explicitly
+        if http_client is None or transport is not None:
+            http_client = configure_session(http_client if http_client else requests.Session(), self.transport)
+        self.http_client = http_client
+        self.json_codec = json_codec if json_codec else default_json_codec()
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy if retry_policy else RetryPolicy()
+        self.decoder = decoder if decoder else Decoder()
+        self.last_request_time: Optional[float] = None
+        self.idle_lock = threading.Lock()
+        self.init_signing()
 
-    def generate_headers(self, method: str, path: str, body: Optional[Dict] = None) -> Dict[str, str]:
-        timestamp = str(int(time.time()))
-        body_string = json.dumps(body) if body else ""
-        message = f"{timestamp}{method}{path}{body_string}"
-        signature = self.sign(message)
-
-        return {
+    def init_signing(self) -> None:
+        # Static headers are built once here and the signing key is decoded once into a pre-keyed HMAC
+        # that sign() copies per request. Call again if self.credentials is replaced. A key that is not
+        # valid base64 still builds a client, as before; sign() raises for it instead.
+        try:
+            signing_key = base64.b64decode(self.credentials.signing_key)
+        except binascii.Error:
+            signing_key = None
+        self.signing_hmac: Optional[hmac.HMAC] = \
+            hmac.new(signing_key, digestmod=hashlib.sha256) if signing_key is not None else None
+        self.base_headers: Mapping[str, str] = MappingProxyType({
             "Accept": "application/json",
             "CB-ACCESS-KEY": self.credentials.access_key,
             "CB-ACCESS-PASSPHRASE": self.credentials.passphrase,
-            "CB-ACCESS-SIGN": signature,
-            "CB-ACCESS-TIMESTAMP": timestamp,
             "Content-Type": "application/json",
-        }
+        })
+
+    def encode_body(self, body: Optional[Dict]) -> Optional[bytes]:
+        return self.json_codec.dumps(body) if body is not None else None
+
+    def generate_headers(self, method: str, path: str, body: Optional[Union[Dict, bytes]] = None) -> Dict[str, str]:
+        timestamp = str(int(time.time()))
+        if isinstance(body, dict):
+            body = self.encode_body(body)
+        message = f"{timestamp}{method}{path}".encode()
+        if body:
+            message += body
+
+        headers = dict(self.base_headers)
+        headers["CB-ACCESS-SIGN"] = self.sign(message)
+        headers["CB-ACCESS-TIMESTAMP"] = timestamp
+        return headers
 
-    def sign(self, message: str) -> str:
-        h = hmac.new(base64.b64decode(self.credentials.signing_key), message.encode(), hashlib.sha256)
+    def sign(self, message: Union[str, bytes]) -> str:
+        if self.signing_hmac is None:
+            raise ValueError("credentials.signing_key is not valid base64")
+        h = self.signing_hmac.copy()
+        h.update(message if isinstance(message, bytes) else message.encode())
         return base64.b64encode(h.digest()).decode()
 
     def request(self, method: str, path: str, query: Optional[str] = "", body: Optional[Dict] = None,
-                allowed_status_codes: Optional[List[int]] = None) -> requests.Response:
+                allowed_status_codes: Optional[List[int]] = None, idempotent: bool = False) -> requests.Response:
         if allowed_status_codes is None:
             allowed_status_codes = [200]
         full_path = f"{self.http_base_url}{path}"
         url = f"{full_path}?{query}" if query else full_path
 
-        headers = self.generate_headers(method, f"/api/v1{path}", body)
-        response = self.http_client.request(method, url, headers=headers, json=body)
+        # Encode once so the signed bytes are exactly the bytes on the wire
+        body_bytes = self.encode_body(body)
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter:
+                self.rate_limiter.acquire(method, path)
 
-        if response.status_code not in allowed_status_codes:
+            # Every attempt is re-signed so retries never reuse a stale timestamp
+            headers = self.generate_headers(method, f"/api/v1{path}", body_bytes)
+            self.evict_idle_connections()
             try:
-                error_details = response.json()
-                error_message = error_details.get('message', response.text)
-            except ValueError:
-                error_message = response.text
-            raise Exception(f"Request failed with status {response.status_code}: {error_message}")
-        return response
+                response = self.http_client.request(method, url, headers=headers, data=body_bytes,
+                                                    timeout=self.transport.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not self.retry_policy.is_retryable(method, attempt, idempotent):
+                    raise self.transport_error(e, isinstance(e, requests.Timeout), method, path,
+                                               time.perf_counter() - started) from e
+                time.sleep(self.retry_policy.backoff(attempt))
+                continue
+
+            if response.status_code not in allowed_status_codes and \
+                    self.retry_policy.is_retryable(method, attempt, idempotent, response.status_code):
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                time.sleep(self.retry_policy.backoff(attempt, retry_after))
+                continue
+
+            # Decode with the client's codec instead of requests' built-in json
+            response.json = partial(self.json_codec.loads, response.content)
+            self.check_response(response, allowed_status_codes, method, path, time.perf_counter() - started)
+            return response
+
+    def evict_idle_connections(self) -> None:
+        max_idle_time = self.transport.max_idle_time
+        with self.idle_lock:
+            now = time.monotonic()
+            idle = max_idle_time is not None and self.last_request_time is not None \
+                and now - self.last_request_time > max_idle_time
+            self.last_request_time = now
+            if idle:
+                # Drop only the pooled connections; connections checked out by other threads finish their
+                # request and are discarded on release, and the pools refill lazily
+                for adapter in self.http_client.adapters.values():
+                    pool_manager = getattr(adapter, "poolmanager", None)
+                    if pool_manager is not None:
+                        pool_manager.clear()
+
+    def check_response(self, response, allowed_status_codes: List[int], method: Optional[str] = None,
+                       path: Optional[str] = None, elapsed: Optional[float] = None) -> None:
+        if response.status_code in allowed_status_codes:
+            return
+        try:
+            error_body: Any = response.json()
+        except ValueError:
+            error_body = None
+        error_message = response.text
+        error_code = None
+        if isinstance(error_body, dict):
+            error_message = error_body.get('message') or error_body.get('detail') or error_body.get('title') \
+                or error_message
+            error_code = error_body.get('code') or error_body.get('title')
+
+        error_class = error_class_for_status(response.status_code)
+        kwargs = dict(status_code=response.status_code, error_code=error_code, error_body=error_body,
+                      method=method, path=path, elapsed=elapsed)
+        if error_class is RateLimitedError:
+            kwargs["retry_after"] = parse_retry_after(response.headers.get("Retry-After"))
+        raise error_class(f"Request failed with status {response.status_code}: {error_message}", **kwargs)
+
+    def transport_error(self, error: Exception, timed_out: bool, method: str, path: str,
+                        elapsed: float) -> IntxError:
+        error_class = IntxTimeoutError if timed_out else IntxConnectionError
+        reason = "timed out" if timed_out else "failed to connect"
+        return error_class(f"Request {reason}: {error}", method=method, path=path, elapsed=elapsed)
@@ -16,6 +16,11 @@ from typing import Optional, Any, Callable, Type
 from intx_sdk.client import Client
 from intx_sdk.credentials import Credentials
 from intx_sdk.constants import PRODUCTION_BASE_URL, SANDBOX_BASE_URL
+from intx_sdk.json_codec import JsonCodec
+from intx_sdk.transport import TransportConfig
+from intx_sdk.rate_limit import RateLimiter
+from intx_sdk.decoder import Decoder
+from intx_sdk.retry import RetryPolicy
 
 
 class LazyProperty:
@@ -55,12 +60,21 @@ def lazy_service(service_factory):
 
 
 class IntxServicesClient:
-    def __init__(self, credentials: Credentials, base_url: Optional[str] = None):
-        self._client = Client(credentials, base_url=base_url)
+    def __init__(self, credentials: Credentials, base_url: Optional[str] = None,
+                 json_codec: Optional[JsonCodec] = None, transport: Optional[TransportConfig] = None,
+                 rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None,
+                 decoder: Optional[Decoder] = None):
+        self._client = Client(credentials, base_url=base_url, json_codec=json_codec, transport=transport,
+                              rate_limiter=rate_limiter, retry_policy=retry_policy, decoder=decoder)
 
     @classmethod
     def from_env(cls, variable_name: str = 'INTX_CREDENTIALS',
-                 base_url: Optional[str] = None) -> 'IntxServicesClient':
+                 base_url: Optional[str] = None,
+                 json_codec: Optional[JsonCodec] = None,
+                 transport: Optional[TransportConfig] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 decoder: Optional[Decoder] = None) -> 'IntxServicesClient':
         credentials = Credentials.from_env(variable_name)
 
         # Priority order for base_url:
@@ -70,7 +84,8 @@ class IntxServicesClient:
         if base_url is None:
             base_url = os.getenv('INTX_BASE_URL', PRODUCTION_BASE_URL)
 
-        return cls(credentials, base_url)
+        return cls(credentials, base_url, json_codec=json_codec, transport=transport, rate_limiter=rate_limiter,
+                   retry_policy=retry_policy, decoder=decoder)
 
     @property
     def client(self) -> Client:
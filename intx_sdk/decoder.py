@@ -0,0 +1,358 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+import threading
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union, get_args, get_origin, get_type_hints
+from intx_sdk.errors import DecodeError
+from intx_sdk.services.model import Numeric
+
+T = TypeVar("T")
+
+UNKNOWN_IGNORE = "ignore"
+UNKNOWN_CAPTURE = "capture"
+
+NUMERIC_RAW = "raw"
+NUMERIC_FLOAT = "float"
+NUMERIC_DECIMAL = "decimal"
+
+NUMERIC_ERRORS = (TypeError, ValueError, ArithmeticError)
+
+
+def extras_of(obj: Any) -> Dict[str, Any]:
+    """Response keys that the model has no field for, as captured by a Decoder"""
+    return getattr(obj, "extras", None) or {}
+
+
+def raw_of(obj: Any) -> Optional[dict]:
+    """The decoded JSON dict behind a lazy model, or None for an eagerly built one"""
+    return getattr(obj, "_raw", None)
+
+
+def decimal_parser(cache_size: int = 4096) -> Callable[[Any], Decimal]:
+    """Decimal(value) with a bounded cache, since prices, increments and zero amounts repeat across responses.
+
+    Floats are converted through repr, so 0.1 becomes Decimal("0.1") rather than its binary expansion.
+    Building a Decimal from a string is exact whatever the active context, so no context is involved.
+    """
+    cache: Dict[Any, Decimal] = {}
+
+    def parse(value: Any) -> Decimal:
+        number = cache.get(value)
+        if number is None:
+            number = Decimal(value if value.__class__ is str else repr(value))
+            if len(cache) >= cache_size:
+                cache.clear()
+            cache[value] = number
+        return number
+    return parse
+
+
+class LazyField:
+    """Reads one field from the raw dict on first access and caches it in the instance __dict__"""
+
+    __slots__ = ("name", "default", "factory", "convert")
+
+    def __init__(self, name: str, default: Any, factory: Optional[Callable[[], Any]],
+                 convert: Optional[Callable[[Any], Any]]):
+        self.name = name
+        self.default = default
+        self.factory = factory
+        self.convert = convert
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        raw = obj._raw
+        if self.name in raw:
+            value = raw[self.name]
+            if value is not None and self.convert is not None:
+                value = self.convert(value)
+        else:
+            value = self.factory() if self.factory is not None else self.default
+        # A non-data descriptor: once cached, lookups hit the instance __dict__ and never return here
+        obj.__dict__[self.name] = value
+        return value
+
+
+class LazyExtras:
+    __slots__ = ("known",)
+
+    def __init__(self, known: frozenset):
+        self.known = known
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        extras = {k: v for k, v in obj._raw.items() if k not in self.known}
+        obj.__dict__["extras"] = extras
+        return extras
+
+
+def enum_error(enum: type, value: Any, field: Optional[str] = None) -> DecodeError:
+    where = f" for field {field!r}" if field else ""
+    return DecodeError(f"{value!r} is not a valid {enum.__name__} value{where}")
+
+
+def enum_converter(enum: type) -> Callable[[Any], Any]:
+    lookup = enum._value2member_map_.get
+
+    def convert(value):
+        try:
+            return lookup(value, value)
+        except TypeError:
+            # An unhashable value, such as a dict or a list, cannot be a member
+            raise enum_error(enum, value) from None
+    return convert
+
+
+def _reduce_lazy(obj):
+    # Pickle and copy as the eager model, since the lazy classes are built at runtime
+    cls = type(obj).__mro__[1]
+    return _rebuild, (cls, {f.name: getattr(obj, f.name) for f in dataclasses.fields(cls)})
+
+
+def _new_lazy(lazy, *args, **kwargs):
+    # Calling a lazy class, as dataclasses.replace does, builds the eager model it stands in for
+    cls = lazy.__mro__[1]
+    obj = object.__new__(cls)
+    obj.__init__(*args, **kwargs)
+    return obj
+
+
+def _rebuild(cls, values):
+    obj = object.__new__(cls)
+    obj.__dict__.update(values)
+    return obj
+
+
+class Decoder:
+    """Builds response models from decoded JSON without failing on fields the SDK does not know yet.
+
+    The first time a class is decoded its fields are compiled into a constructor that reads each key
+    with a default, converts enum values through a cached lookup (values the enum does not define are
+    kept as they are, while an object or a list there raises DecodeError), and decodes nested
+    dataclasses and lists of them. Missing keys become the field default, or None for required
+    fields. With unknown="capture" keys that are not fields are kept in the instance's `extras` dict
+    (see extras_of); with "ignore" they are dropped. compact=True builds the __slots__ variants from
+    intx_sdk.services.compact_model instead of the plain models.
+
+    Fields typed Numeric (prices, sizes, amounts) are kept as the API sent them with numeric="raw",
+    or converted with numeric="float" or numeric="decimal"; a value that does not parse, such as an
+    empty string, is kept as sent.
+
+    lazy=True instead returns a subclass of each model that keeps a reference to the decoded dict and
+    converts a field only when it is first read, so reading a few fields of a wide model such as
+    InstrumentDetails costs one small allocation per item. Lazy instances only compare equal to
+    instances of the same lazy class, and pickle, copy and dataclasses.replace() to the plain model.
+    """
+
+    def __init__(self, unknown: str = UNKNOWN_CAPTURE, compact: bool = False, lazy: bool = False,
+                 numeric: str = NUMERIC_RAW):
+        if unknown not in (UNKNOWN_IGNORE, UNKNOWN_CAPTURE):
+            raise ValueError(f"unknown must be '{UNKNOWN_IGNORE}' or '{UNKNOWN_CAPTURE}'")
+        if numeric not in (NUMERIC_RAW, NUMERIC_FLOAT, NUMERIC_DECIMAL):
+            raise ValueError(f"numeric must be '{NUMERIC_RAW}', '{NUMERIC_FLOAT}' or '{NUMERIC_DECIMAL}'")
+        if compact and lazy:
+            raise ValueError("compact and lazy cannot be combined")
+        self.unknown = unknown
+        self.compact = compact
+        self.lazy = lazy
+        self.numeric = numeric
+        self.number_type = {NUMERIC_FLOAT: float, NUMERIC_DECIMAL: Decimal}.get(numeric)
+        self.number = decimal_parser() if numeric == NUMERIC_DECIMAL else self.number_type
+        self.constructors: Dict[type, Callable[[dict], Any]] = {}
+        self.lock = threading.Lock()
+
+    def decode(self, cls: Type[T], data: Any) -> T:
+        """Decode one object; anything that is not a dict is returned unchanged"""
+        if not isinstance(data, dict):
+            return data
+        constructor = self.constructors.get(cls)
+        if constructor is None:
+            constructor = self.compile(cls)
+        return constructor(data)
+
+    def decode_list(self, cls: Type[T], items: Optional[List[Any]]) -> List[T]:
+        """Decode each dict in a list; anything that is not a list is returned unchanged"""
+        if not isinstance(items, list):
+            return items
+        constructor = self.constructors.get(cls) or self.compile(cls)
+        return [constructor(item) if isinstance(item, dict) else item for item in items]
+
+    def target(self, cls: type) -> type:
+        if not self.compact:
+            return cls
+        from intx_sdk.services.compact_model import COMPACT_MODELS
+        return COMPACT_MODELS.get(cls, cls)
+
+    def compile(self, cls: type) -> Callable[[dict], Any]:
+        with self.lock:
+            if cls not in self.constructors:
+                self.constructors[cls] = self.build_constructor(cls)
+            return self.constructors[cls]
+
+    def build_lazy_constructor(self, cls: type) -> Callable[[dict], Any]:
+        hints = get_type_hints(cls)
+        fields = dataclasses.fields(cls)
+        namespace = {"__slots__": ("_raw",), "__module__": cls.__module__, "__doc__": cls.__doc__,
+                     "__reduce__": _reduce_lazy, "__new__": _new_lazy}
+        for f in fields:
+            factory = None if f.default_factory is dataclasses.MISSING else f.default_factory
+            default = None if f.default is dataclasses.MISSING else f.default
+            namespace[f.name] = LazyField(f.name, default, factory, self.converter(hints.get(f.name, Any)))
+        if self.unknown == UNKNOWN_CAPTURE:
+            namespace["extras"] = LazyExtras(frozenset(f.name for f in fields))
+        lazy = type(f"Lazy{cls.__name__}", (cls,), namespace)
+        new = object.__new__
+
+        def construct(data):
+            obj = new(lazy)
+            obj._raw = data
+            return obj
+        return construct
+
+    def build_constructor(self, cls: type) -> Callable[[dict], Any]:
+        if self.lazy:
+            return self.build_lazy_constructor(cls)
+        target = self.target(cls)
+        hints = get_type_hints(cls)
+        fields = dataclasses.fields(cls)
+        missing = object()
+        namespace = {"new": object.__new__, "target": target, "setattr": object.__setattr__,
+                     "known": frozenset(f.name for f in fields), "missing": missing,
+                     "number": self.number, "number_type": self.number_type, "number_errors": NUMERIC_ERRORS,
+                     "enum_error": enum_error}
+        for i, f in enumerate(fields):
+            if f.default_factory is not dataclasses.MISSING:
+                namespace[f"factory_{i}"] = f.default_factory
+        if "__slots__" in vars(target):
+            lines = self.slotted_lines(target, fields, hints, namespace)
+        else:
+            lines = self.dict_lines(target, fields, hints, namespace)
+        exec("\n".join(["def construct(data):"] + lines + ["    return obj"]), namespace)
+        return namespace["construct"]
+
+    def dict_lines(self, target: type, fields, hints: Dict[str, Any], namespace: Dict[str, Any]) -> List[str]:
+        missing = namespace["missing"]
+        defaults = {f.name: missing if f.default_factory is not dataclasses.MISSING
+                    else None if f.default is dataclasses.MISSING else f.default for f in fields}
+        namespace["defaults"] = defaults
+        # Merging onto the defaults happens in C; only a response with unknown keys grows the dict
+        lines = ["    values = {**defaults, **data}",
+                 "    extras = None",
+                 f"    if len(values) != {len(defaults)}:",
+                 "        values = {**defaults, **{k: v for k, v in data.items() if k in known}}"]
+        if self.unknown == UNKNOWN_CAPTURE:
+            lines.append("        extras = {k: v for k, v in data.items() if k not in known}")
+        for i, f in enumerate(fields):
+            name = repr(f.name)
+            if f.default_factory is not dataclasses.MISSING:
+                lines.append(f"    if values[{name}] is missing: values[{name}] = factory_{i}()")
+            conversion = self.conversion_lines(i, f.name, hints.get(f.name, Any), namespace)
+            if conversion:
+                lines += [f"    value = values[{name}]"] + conversion + [f"    values[{name}] = value"]
+        # Filling __dict__ directly skips the keyword binding in __init__
+        lines.append("    obj = new(target)")
+        if target.__dataclass_params__.frozen:
+            lines.append("    setattr(obj, '__dict__', values)")
+        else:
+            lines.append("    obj.__dict__ = values")
+        if self.unknown == UNKNOWN_CAPTURE:
+            lines += ["    if extras:", "        setattr(obj, 'extras', extras)"]
+        return lines
+
+    def slotted_lines(self, target: type, fields, hints: Dict[str, Any], namespace: Dict[str, Any]) -> List[str]:
+        # Every slot is written anyway, so read each key straight from the response instead of merging dicts
+        frozen = target.__dataclass_params__.frozen
+        lines = ["    get = data.get", "    obj = new(target)"]
+        for i, f in enumerate(fields):
+            name = repr(f.name)
+            if f.default_factory is not dataclasses.MISSING:
+                lines += [f"    value = get({name}, missing)", f"    if value is missing: value = factory_{i}()"]
+            elif f.default is dataclasses.MISSING or f.default is None:
+                lines.append(f"    value = get({name})")
+            else:
+                namespace[f"default_{i}"] = f.default
+                lines.append(f"    value = get({name}, default_{i})")
+            lines += self.conversion_lines(i, f.name, hints.get(f.name, Any), namespace)
+            if frozen:
+                # The slot descriptors write past a frozen class's __setattr__
+                namespace[f"set_{i}"] = vars(target)[f.name].__set__
+                lines.append(f"    set_{i}(obj, value)")
+            else:
+                lines.append(f"    obj.{f.name} = value")
+        if self.unknown == UNKNOWN_CAPTURE and "extras" in target.__slots__:
+            lines += ["    if not known.issuperset(data):",
+                      "        setattr(obj, 'extras', {k: v for k, v in data.items() if k not in known})"]
+        return lines
+
+    def conversion_lines(self, i: int, name: str, hint: Any, namespace: Dict[str, Any]) -> List[str]:
+        """Statements that convert the local `value` of field `name` in place, or none if it is kept as is"""
+        hint = self.unwrap_optional(hint)
+        if isinstance(hint, type) and issubclass(hint, Enum):
+            # Inlined lookup; None and values the enum does not define fall through unchanged
+            namespace[f"lookup_{i}"] = hint._value2member_map_.get
+            namespace[f"enum_{i}"] = hint
+            return ["    try:",
+                    f"        value = lookup_{i}(value, value)",
+                    "    except TypeError:",
+                    f"        raise enum_error(enum_{i}, value, {name!r}) from None"]
+        if hint is Numeric:
+            if self.number is None:
+                return []
+            return ["    if value is not None and value.__class__ is not number_type:",
+                    "        try:",
+                    "            value = number(value)",
+                    "        except number_errors:",
+                    "            pass"]
+        converter = self.converter(hint)
+        if converter is None:
+            return []
+        namespace[f"convert_{i}"] = converter
+        return [f"    if value is not None: value = convert_{i}(value)"]
+
+    @staticmethod
+    def unwrap_optional(hint: Any) -> Any:
+        if get_origin(hint) is Union:
+            args = [a for a in get_args(hint) if a is not type(None)]
+            return args[0] if len(args) == 1 else Any
+        return hint
+
+    def converter(self, hint: Any) -> Optional[Callable[[Any], Any]]:
+        hint = self.unwrap_optional(hint)
+        origin = get_origin(hint)
+        if origin in (list, List):
+            args = get_args(hint)
+            item_converter = self.converter(args[0]) if args else None
+            if item_converter is None:
+                return None
+            return lambda items: [item_converter(i) for i in items] if isinstance(items, list) else items
+        if isinstance(hint, type) and issubclass(hint, Enum):
+            return enum_converter(hint)
+        if dataclasses.is_dataclass(hint):
+            return lambda value: self.decode(hint, value)
+        if hint is Numeric and self.number is not None:
+            return self.convert_number
+        return None
+
+    def convert_number(self, value: Any) -> Any:
+        if value.__class__ is self.number_type:
+            return value
+        try:
+            return self.number(value)
+        except NUMERIC_ERRORS:
+            return value
@@ -0,0 +1,94 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Optional
+
+
+class IntxError(Exception):
+    """Base class for every error raised by the SDK for a failed request.
+
+    status_code is None when the request never produced an HTTP response (timeouts, connection
+    failures, client-side limits). elapsed is the wall time in seconds spent on the request,
+    including any retries.
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None, error_code: Optional[str] = None,
+                 error_body: Any = None, method: Optional[str] = None, path: Optional[str] = None,
+                 elapsed: Optional[float] = None):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.error_code = error_code
+        self.error_body = error_body
+        self.method = method
+        self.path = path
+        self.elapsed = elapsed
+
+
+class ValidationError(IntxError):
+    """The request was rejected as malformed or invalid (400, 422)"""
+
+
+class PreTradeValidationError(ValidationError):
+    """An order failed local pre-trade validation and was not sent; error_code names the failed check"""
+
+
+class AuthenticationError(IntxError):
+    """The credentials or signature were rejected (401, 403)"""
+
+
+class NotFoundError(IntxError):
+    """The requested resource does not exist (404)"""
+
+
+class RateLimitedError(IntxError):
+    """The request was throttled (429); retry_after is in seconds when known"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None, **kwargs):
+        super().__init__(message, **kwargs)
+        self.retry_after = retry_after
+
+
+class ServerError(IntxError):
+    """The exchange failed to process the request (5xx)"""
+
+
+class IntxTimeoutError(IntxError, TimeoutError):
+    """The request timed out before a response was received"""
+
+
+class IntxConnectionError(IntxError, ConnectionError):
+    """The connection could not be established or was reset"""
+
+
+class DecodeError(IntxError, ValueError):
+    """A response value could not be decoded into the SDK's models"""
+
+
+STATUS_ERRORS = {
+    400: ValidationError,
+    401: AuthenticationError,
+    403: AuthenticationError,
+    404: NotFoundError,
+    422: ValidationError,
+    429: RateLimitedError,
+}
+
+
+def error_class_for_status(status_code: int) -> type:
+    if status_code in STATUS_ERRORS:
+        return STATUS_ERRORS[status_code]
+    if status_code >= 500:
+        return ServerError
+    return IntxError
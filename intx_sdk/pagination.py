@@ -0,0 +1,130 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Generic, Iterator, List, Optional, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+
+# fetch_page(result_offset, ref_datetime) -> (items, ref_datetime reported by the page), optionally
+# followed by the result_limit the server applied, which may be lower than the page size requested
+Page = Union[Tuple[List[T], Optional[str]], Tuple[List[T], Optional[str], Optional[int]]]
+FetchPage = Callable[[int, Optional[str]], Page]
+AsyncFetchPage = Callable[[int, Optional[str]], Awaitable[Page]]
+
+
+def unpack_page(page: Page, page_size: int) -> Tuple[List[T], Optional[str], bool]:
+    """Items, ref_datetime and whether another page may follow.
+
+    A page is the last one when it is empty or shorter than the server's result_limit, or than
+    page_size when the page does not report one. Comparing with what the server applied rather
+    than what was asked keeps a server-side cap on result_limit from ending the walk after one page.
+    """
+    items, ref_datetime = page[0], page[1]
+    limit = page[2] if len(page) > 2 and page[2] else page_size
+    return items, ref_datetime, bool(items) and len(items) >= int(limit)
+
+
+@dataclass
+class PaginationCheckpoint:
+    """Position of an offset-paginated walk; ref_datetime pins the snapshot the offsets refer to."""
+    result_offset: int = 0
+    ref_datetime: Optional[str] = None
+
+
+class OffsetPageIterator(Generic[T]):
+    """Lazily walks result_offset one page at a time, yielding single items.
+
+    At most one page is held in memory, plus the next one when prefetch is enabled, which fetches it
+    on a background thread while the current page is consumed. `checkpoint` always points just past
+    the last item yielded, so a new iterator created from it resumes where this one stopped.
+    """
+
+    def __init__(self, fetch_page: FetchPage, page_size: int = DEFAULT_PAGE_SIZE,
+                 checkpoint: Optional[PaginationCheckpoint] = None, prefetch: bool = False):
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        start = checkpoint if checkpoint else PaginationCheckpoint()
+        self.checkpoint = PaginationCheckpoint(start.result_offset, start.ref_datetime)
+        self.prefetch = prefetch
+
+    def __iter__(self) -> Iterator[T]:
+        executor = ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+        try:
+            offset = self.checkpoint.result_offset
+            page = self.fetch_page(offset, self.checkpoint.ref_datetime)
+            while True:
+                items, ref_datetime, has_more = unpack_page(page, self.page_size)
+                if self.checkpoint.ref_datetime is None:
+                    self.checkpoint.ref_datetime = ref_datetime
+                offset += len(items)
+
+                next_page = None
+                if executor and has_more:
+                    next_page = executor.submit(self.fetch_page, offset, self.checkpoint.ref_datetime)
+
+                for item in items:
+                    self.checkpoint.result_offset += 1
+                    yield item
+
+                if not has_more:
+                    return
+                page = next_page.result() if next_page else self.fetch_page(offset, self.checkpoint.ref_datetime)
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+
+class AsyncOffsetPageIterator(Generic[T]):
+    """Async counterpart of OffsetPageIterator; prefetching runs the next page as a task on the loop."""
+
+    def __init__(self, fetch_page: AsyncFetchPage, page_size: int = DEFAULT_PAGE_SIZE,
+                 checkpoint: Optional[PaginationCheckpoint] = None, prefetch: bool = False):
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        start = checkpoint if checkpoint else PaginationCheckpoint()
+        self.checkpoint = PaginationCheckpoint(start.result_offset, start.ref_datetime)
+        self.prefetch = prefetch
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        next_page = None
+        try:
+            offset = self.checkpoint.result_offset
+            page = await self.fetch_page(offset, self.checkpoint.ref_datetime)
+            while True:
+                items, ref_datetime, has_more = unpack_page(page, self.page_size)
+                if self.checkpoint.ref_datetime is None:
+                    self.checkpoint.ref_datetime = ref_datetime
+                offset += len(items)
+
+                if self.prefetch and has_more:
+                    next_page = asyncio.ensure_future(self.fetch_page(offset, self.checkpoint.ref_datetime))
+
+                for item in items:
+                    self.checkpoint.result_offset += 1
+                    yield item
+
+                if not has_more:
+                    return
+                if next_page:
+                    page, next_page = await next_page, None
+                else:
+                    page = await self.fetch_page(offset, self.checkpoint.ref_datetime)
+        finally:
+            if next_page:
+                next_page.cancel()
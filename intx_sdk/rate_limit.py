@@ -0,0 +1,156 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Dict, Optional
+from intx_sdk.errors import RateLimitedError
+
+
+class EndpointClass(Enum):
+    """Groups of endpoints that share a client-side rate limit"""
+    ORDER_ENTRY = "ORDER_ENTRY"
+    PRIVATE = "PRIVATE"
+    PUBLIC = "PUBLIC"
+
+
+PUBLIC_PATH_PREFIXES = ("/instruments", "/index", "/assets", "/fee-rate-tiers")
+
+
+def classify_endpoint(method: str, path: str) -> EndpointClass:
+    if path.startswith("/orders") and method != "GET":
+        return EndpointClass.ORDER_ENTRY
+    if path.startswith(PUBLIC_PATH_PREFIXES):
+        return EndpointClass.PUBLIC
+    return EndpointClass.PRIVATE
+
+
+class RateLimitExceeded(RateLimitedError):
+    """Raised locally, before anything is sent, when a non-blocking RateLimiter has no token"""
+
+    def __init__(self, endpoint_class: EndpointClass, retry_after: float):
+        super().__init__(f"Client-side rate limit exceeded for {endpoint_class.value} endpoints; "
+                         f"retry in {retry_after:.3f}s", retry_after=retry_after)
+        self.endpoint_class = endpoint_class
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at `rate` tokens per second up to `capacity`.
+
+    `capacity` defaults to one second's worth of tokens, and at least one.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity is not None and capacity < 1:
+            raise ValueError("burst capacity must be at least 1")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1)
+        self.tokens = self.capacity
+        self.clock = clock
+        self.updated_at = clock()
+        self.lock = threading.Lock()
+
+    def refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """Take tokens if available; return 0.0 on success, otherwise the seconds until they will be."""
+        if tokens > self.capacity:
+            # They would never become available, so blocking acquires would wait forever
+            raise ValueError(f"cannot acquire {tokens} tokens from a bucket of capacity {self.capacity}")
+        with self.lock:
+            self.refill()
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return 0.0
+            return (tokens - self.tokens) / self.rate
+
+    def time_until_available(self, tokens: float = 1) -> float:
+        with self.lock:
+            self.refill()
+            return max(0.0, (tokens - self.tokens) / self.rate)
+
+    def acquire(self, tokens: float = 1, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else self.clock() + timeout
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait == 0.0:
+                return True
+            if not blocking or (deadline is not None and self.clock() + wait > deadline):
+                return False
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1, blocking: bool = True, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else self.clock() + timeout
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait == 0.0:
+                return True
+            if not blocking or (deadline is not None and self.clock() + wait > deadline):
+                return False
+            await asyncio.sleep(wait)
+
+
+@dataclass
+class RateLimit:
+    """Sustained requests per second and the burst allowed on top of it (defaults to one second's worth, at least 1)"""
+    rate: float
+    burst: Optional[float] = None
+
+
+# Conservative defaults; configure to the limits of your API key
+DEFAULT_RATE_LIMITS = {
+    EndpointClass.ORDER_ENTRY: RateLimit(rate=50),
+    EndpointClass.PRIVATE: RateLimit(rate=25),
+    EndpointClass.PUBLIC: RateLimit(rate=10),
+}
+
+
+class RateLimiter:
+    """Per-endpoint-class token buckets, shareable between clients, threads and event loops.
+
+    In blocking mode acquire() waits (up to `timeout` seconds) for a token; otherwise, or when the
+    timeout would be exceeded, it raises RateLimitExceeded without sending the request.
+    """
+
+    def __init__(self, limits: Optional[Dict[EndpointClass, RateLimit]] = None, blocking: bool = True,
+                 timeout: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        limits = {**DEFAULT_RATE_LIMITS, **(limits or {})}
+        self.buckets = {
+            endpoint_class: TokenBucket(limit.rate, limit.burst, clock=clock)
+            for endpoint_class, limit in limits.items()
+        }
+        self.blocking = blocking
+        self.timeout = timeout
+
+    def bucket_for(self, method: str, path: str) -> TokenBucket:
+        return self.buckets[classify_endpoint(method, path)]
+
+    def acquire(self, method: str, path: str) -> None:
+        bucket = self.bucket_for(method, path)
+        if not bucket.acquire(blocking=self.blocking, timeout=self.timeout):
+            raise RateLimitExceeded(classify_endpoint(method, path), bucket.time_until_available())
+
+    async def acquire_async(self, method: str, path: str) -> None:
+        bucket = self.bucket_for(method, path)
+        if not await bucket.acquire_async(blocking=self.blocking, timeout=self.timeout):
+            raise RateLimitExceeded(classify_endpoint(method, path), bucket.time_until_available())
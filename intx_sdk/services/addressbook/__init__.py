@@ -13,10 +13,12 @@
 # limitations under the License.
 
 from .service import AddressBookService
+from .async_service import AsyncAddressBookService
 from .get_address_book import GetAddressBookRequest, GetAddressBookResponse
 
 __all__ = [
     "AddressBookService",
+    "AsyncAddressBookService",
     "GetAddressBookRequest",
     "GetAddressBookResponse",
 ]
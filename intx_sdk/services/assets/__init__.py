@@ -13,12 +13,14 @@
 # limitations under the License.
 
 from .service import AssetsService
+from .async_service import AsyncAssetsService
 from .list_assets import ListAssetsRequest, ListAssetsResponse
 from .get_asset_details import GetAssetDetailsRequest, GetAssetDetailsResponse
 from .get_supported_networks import GetSupportedNetworksRequest, GetSupportedNetworksResponse
 
 __all__ = [
     "AssetsService",
+    "AsyncAssetsService",
     "ListAssetsRequest",
     "ListAssetsResponse",
     "GetAssetDetailsRequest",
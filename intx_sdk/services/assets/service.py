@@ -27,16 +27,16 @@ class AssetsService:
         path = "/assets"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return ListAssetsResponse(assets=[Asset(**a) for a in data])
+        return ListAssetsResponse(assets=self.client.decoder.decode_list(Asset, data))
 
     def get_asset_details(self, request: GetAssetDetailsRequest) -> GetAssetDetailsResponse:
         path = f"/assets/{request.asset}"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return GetAssetDetailsResponse(asset=Asset(**data))
+        return GetAssetDetailsResponse(asset=self.client.decoder.decode(Asset, data))
 
     def get_supported_networks(self, request: GetSupportedNetworksRequest) -> GetSupportedNetworksResponse:
         path = f"/assets/{request.asset}/networks"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return GetSupportedNetworksResponse(networks=[SupportedNetwork(**n) for n in data])
+        return GetSupportedNetworksResponse(networks=self.client.decoder.decode_list(SupportedNetwork, data))
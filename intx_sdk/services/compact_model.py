@@ -0,0 +1,86 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Slotted variants of the response models in intx_sdk.services.model.
+
+Every model class, and every response class that subclasses one such as CreateOrderResponse, is
+available here under the same name, with the same fields, defaults and dataclass behaviour (repr,
+eq, asdict, replace), but with __slots__ instead of a per-instance __dict__, which removes most of
+the per-instance overhead (see benchmarks/bench_models.py). They are separate classes, so
+isinstance checks against the original models do not match them. slotted(cls, frozen=True)
+returns an immutable, hashable variant named Frozen<Model>; it is noticeably slower to construct,
+as with any frozen dataclass.
+"""
+
+import dataclasses
+import inspect
+from functools import lru_cache
+from intx_sdk.services import model
+from intx_sdk.services.instruments import get_instrument_details, get_quote_per_instrument
+from intx_sdk.services.orders import cancel_order, create_order, get_order_details, modify_open_order
+
+
+def _frozen_getstate(self):
+    return [getattr(self, f.name) for f in dataclasses.fields(self)]
+
+
+def _frozen_setstate(self, state):
+    for f, value in zip(dataclasses.fields(self), state):
+        object.__setattr__(self, f.name, value)
+
+
+def slotted(cls: type, frozen: bool = False) -> type:
+    """Return a __slots__ copy of dataclass `cls`, optionally frozen; results are cached per class"""
+    return _slotted(cls, bool(frozen))
+
+
+# Keyed on normalized positional arguments, so every call form shares one class per (cls, frozen)
+@lru_cache(maxsize=None)
+def _slotted(cls: type, frozen: bool) -> type:
+    name = f"Frozen{cls.__name__}" if frozen else cls.__name__
+    base = dataclasses.dataclass(frozen=frozen)(type(name, (), {
+        "__module__": __name__,
+        "__qualname__": name,
+        "__doc__": cls.__doc__,
+        "__annotations__": {f.name: f.type for f in dataclasses.fields(cls)},
+        **{f.name: dataclasses.field(default=f.default, default_factory=f.default_factory)
+           for f in dataclasses.fields(cls) if f.default is not dataclasses.MISSING
+           or f.default_factory is not dataclasses.MISSING},
+    }))
+    names = tuple(f.name for f in dataclasses.fields(base))
+    namespace = {k: v for k, v in base.__dict__.items() if k not in names + ("__dict__", "__weakref__")}
+    # extras holds unknown response keys captured by intx_sdk.decoder.Decoder
+    namespace["__slots__"] = names + ("extras",)
+    if frozen:
+        # Unpickling assigns attributes directly, which a frozen class would refuse
+        namespace["__getstate__"] = _frozen_getstate
+        namespace["__setstate__"] = _frozen_setstate
+    compact = type(base)(base.__name__, base.__bases__, namespace)
+    if getattr(model, cls.__name__, None) is cls or cls in RESPONSE_MODELS:
+        # Register under its own name so instances pickle by reference
+        globals().setdefault(name, compact)
+    return compact
+
+
+MODELS = [cls for _, cls in inspect.getmembers(model, inspect.isclass)
+          if dataclasses.is_dataclass(cls) and cls.__module__ == model.__name__]
+
+# Services decode these directly, so compact decoding needs their own slotted variants
+RESPONSE_MODELS = [cancel_order.CancelOrderResponse, create_order.CreateOrderResponse,
+                   get_instrument_details.GetInstrumentDetailsResponse, get_order_details.GetOrderDetailsResponse,
+                   get_quote_per_instrument.GetQuotePerInstrumentResponse, modify_open_order.ModifyOpenOrderResponse]
+
+COMPACT_MODELS = {cls: slotted(cls) for cls in MODELS + RESPONSE_MODELS}
+
+__all__ = ["slotted"] + [cls.__name__ for cls in MODELS + RESPONSE_MODELS]
@@ -13,10 +13,12 @@
 # limitations under the License.
 
 from .service import FeeRatesService
+from .async_service import AsyncFeeRatesService
 from .list_fee_rate_tiers import ListFeeRateTiersRequest, ListFeeRateTiersResponse
 
 __all__ = [
     "FeeRatesService",
+    "AsyncFeeRatesService",
     "ListFeeRateTiersRequest",
     "ListFeeRateTiersResponse",
 ]
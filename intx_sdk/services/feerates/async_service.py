@@ -0,0 +1,27 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from intx_sdk.async_client import AsyncClient
+from intx_sdk.services.model import FeeTier
+from .list_fee_rate_tiers import ListFeeRateTiersRequest, ListFeeRateTiersResponse
+
+
+class AsyncFeeRatesService:
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def list_fee_rate_tiers(self, request: ListFeeRateTiersRequest) -> ListFeeRateTiersResponse:
+        path = "/fee-rate-tiers"
+        response = await self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
+        return ListFeeRateTiersResponse(fee_tiers=self.client.decoder.decode_list(FeeTier, response.json()))
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from intx_sdk.client import Client
+from intx_sdk.services.model import FeeTier
 from .list_fee_rate_tiers import ListFeeRateTiersRequest, ListFeeRateTiersResponse
 
 
@@ -23,4 +24,4 @@ class FeeRatesService:
     def list_fee_rate_tiers(self, request: ListFeeRateTiersRequest) -> ListFeeRateTiersResponse:
         path = "/fee-rate-tiers"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
-        return ListFeeRateTiersResponse(fee_tiers=response.json())
+        return ListFeeRateTiersResponse(fee_tiers=self.client.decoder.decode_list(FeeTier, response.json()))
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from .service import IndexService
+from .async_service import AsyncIndexService
 from .get_index_candles import GetIndexCandlesRequest, GetIndexCandlesResponse
 from .get_index_composition import GetIndexCompositionRequest, GetIndexCompositionResponse
 from .get_index_composition_history import GetIndexCompositionHistoryRequest, GetIndexCompositionHistoryResponse
@@ -20,6 +21,7 @@ from .get_index_price import GetIndexPriceRequest, GetIndexPriceResponse
 
 __all__ = [
     "IndexService",
+    "AsyncIndexService",
     "GetIndexCandlesRequest",
     "GetIndexCandlesResponse",
     "GetIndexCompositionRequest",
@@ -0,0 +1,76 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import replace
+from typing import Any
+from intx_sdk.async_client import AsyncClient
+from intx_sdk.candles import CandleArray
+from intx_sdk.candles.fetcher import DEFAULT_MAX_BARS_PER_REQUEST, DEFAULT_MAX_WORKERS, fetch_candle_range_async
+from intx_sdk.utils import append_query_param, append_pagination_params
+from intx_sdk.services.model import Aggregation, IndexComposition, IndexPrice
+from .get_index_candles import GetIndexCandlesRequest, GetIndexCandlesResponse
+from .get_index_composition import GetIndexCompositionRequest, GetIndexCompositionResponse
+from .get_index_composition_history import GetIndexCompositionHistoryRequest, GetIndexCompositionHistoryResponse
+from .get_index_price import GetIndexPriceRequest, GetIndexPriceResponse
+
+
+class AsyncIndexService:
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def get_index_candles(self, request: GetIndexCandlesRequest) -> GetIndexCandlesResponse:
+        data = await self._get_index_candles_json(request)
+        if isinstance(data, dict):
+            return self.client.decoder.decode(GetIndexCandlesResponse, data)
+        return GetIndexCandlesResponse(aggregations=self.client.decoder.decode_list(Aggregation, data))
+
+    async def get_index_candles_array(self, request: GetIndexCandlesRequest) -> CandleArray:
+        """Like get_index_candles, but decodes the bars straight into a columnar CandleArray"""
+        data = await self._get_index_candles_json(request)
+        return CandleArray.from_aggregations(data['aggregations'] if isinstance(data, dict) else data)
+
+    async def _get_index_candles_json(self, request: GetIndexCandlesRequest) -> Any:
+        path = f"/index/{request.index}/candles"
+        query_params = append_query_param("", 'granularity', request.granularity)
+        query_params = append_query_param(query_params, 'start', request.start)
+        if request.end:
+            query_params = append_query_param(query_params, 'end', request.end)
+        response = await self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
+        return response.json()
+
+    async def get_index_candles_range(self, request: GetIndexCandlesRequest, max_bars: int = DEFAULT_MAX_BARS_PER_REQUEST,
+                                      max_workers: int = DEFAULT_MAX_WORKERS) -> CandleArray:
+        """Fetch request.start to request.end (default now) in concurrent per-call-sized chunks as one series"""
+        async def fetch(start: str, end: str) -> CandleArray:
+            return await self.get_index_candles_array(replace(request, start=start, end=end))
+
+        return await fetch_candle_range_async(fetch, request.start, request.end, request.granularity,
+                                              max_bars, max_workers)
+
+    async def get_index_composition(self, request: GetIndexCompositionRequest) -> GetIndexCompositionResponse:
+        path = f"/index/{request.index}/composition"
+        response = await self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
+        return GetIndexCompositionResponse(composition=self.client.decoder.decode(IndexComposition, response.json()))
+
+    async def get_index_composition_history(self, request: GetIndexCompositionHistoryRequest) -> GetIndexCompositionHistoryResponse:
+        path = f"/index/{request.index}/composition-history"
+        query_params = append_query_param("", 'time_from', request.time_from)
+        query_params = append_pagination_params(query_params, request.pagination)
+        response = await self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
+        return GetIndexCompositionHistoryResponse(compositions=response.json())
+
+    async def get_index_price(self, request: GetIndexPriceRequest) -> GetIndexPriceResponse:
+        path = f"/index/{request.index}/price"
+        response = await self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
+        return GetIndexPriceResponse(price=self.client.decoder.decode(IndexPrice, response.json()))
@@ -12,8 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from dataclasses import replace
+from typing import Any
 from intx_sdk.client import Client
+from intx_sdk.candles import CandleArray
+from intx_sdk.candles.fetcher import DEFAULT_MAX_BARS_PER_REQUEST, DEFAULT_MAX_WORKERS, fetch_candle_range
 from intx_sdk.utils import append_query_param, append_pagination_params
+from intx_sdk.services.model import Aggregation, IndexComposition, IndexPrice
 from .get_index_candles import GetIndexCandlesRequest, GetIndexCandlesResponse
 from .get_index_composition import GetIndexCompositionRequest, GetIndexCompositionResponse
 from .get_index_composition_history import GetIndexCompositionHistoryRequest, GetIndexCompositionHistoryResponse
@@ -25,18 +30,37 @@ class IndexService:
         self.client = client
 
     def get_index_candles(self, request: GetIndexCandlesRequest) -> GetIndexCandlesResponse:
+        data = self._get_index_candles_json(request)
+        if isinstance(data, dict):
+            return self.client.decoder.decode(GetIndexCandlesResponse, data)
+        return GetIndexCandlesResponse(aggregations=self.client.decoder.decode_list(Aggregation, data))
+
+    def get_index_candles_array(self, request: GetIndexCandlesRequest) -> CandleArray:
+        """Like get_index_candles, but decodes the bars straight into a columnar CandleArray"""
+        data = self._get_index_candles_json(request)
+        return CandleArray.from_aggregations(data['aggregations'] if isinstance(data, dict) else data)
+
+    def _get_index_candles_json(self, request: GetIndexCandlesRequest) -> Any:
         path = f"/index/{request.index}/candles"
         query_params = append_query_param("", 'granularity', request.granularity)
         query_params = append_query_param(query_params, 'start', request.start)
         if request.end:
             query_params = append_query_param(query_params, 'end', request.end)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return GetIndexCandlesResponse(aggregations=response.json())
+        return response.json()
+
+    def get_index_candles_range(self, request: GetIndexCandlesRequest, max_bars: int = DEFAULT_MAX_BARS_PER_REQUEST,
+                                max_workers: int = DEFAULT_MAX_WORKERS) -> CandleArray:
+        """Fetch request.start to request.end (default now) in concurrent per-call-sized chunks as one series"""
+        def fetch(start: str, end: str) -> CandleArray:
+            return self.get_index_candles_array(replace(request, start=start, end=end))
+
+        return fetch_candle_range(fetch, request.start, request.end, request.granularity, max_bars, max_workers)
 
     def get_index_composition(self, request: GetIndexCompositionRequest) -> GetIndexCompositionResponse:
         path = f"/index/{request.index}/composition"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
-        return GetIndexCompositionResponse(composition=response.json())
+        return GetIndexCompositionResponse(composition=self.client.decoder.decode(IndexComposition, response.json()))
 
     def get_index_composition_history(self, request: GetIndexCompositionHistoryRequest) -> GetIndexCompositionHistoryResponse:
         path = f"/index/{request.index}/composition-history"
@@ -48,4 +72,4 @@ class IndexService:
     def get_index_price(self, request: GetIndexPriceRequest) -> GetIndexPriceResponse:
         path = f"/index/{request.index}/price"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
-        return GetIndexPriceResponse(price=response.json())
+        return GetIndexPriceResponse(price=self.client.decoder.decode(IndexPrice, response.json()))
@@ -13,15 +13,18 @@
 # limitations under the License.
 
 from .service import InstrumentsService
+from .async_service import AsyncInstrumentsService
 from .get_aggregated_candles import GetAggregatedCandlesRequest, GetAggregatedCandlesResponse
 from .get_daily_trading_volumes import GetDailyTradingVolumesRequest, GetDailyTradingVolumesResponse
 from .get_historical_funding_rates import GetHistoricalFundingRatesRequest, GetHistoricalFundingRatesResponse
 from .get_instrument_details import GetInstrumentDetailsRequest, GetInstrumentDetailsResponse
 from .get_quote_per_instrument import GetQuotePerInstrumentRequest, GetQuotePerInstrumentResponse
 from .list_instruments import ListInstrumentsRequest, ListInstrumentsResponse
+from .registry import InstrumentRegistry
 
 __all__ = [
     "InstrumentsService",
+    "AsyncInstrumentsService",
     "GetAggregatedCandlesRequest",
     "GetAggregatedCandlesResponse",
     "GetDailyTradingVolumesRequest",
@@ -34,4 +37,5 @@ __all__ = [
     "GetQuotePerInstrumentResponse",
     "ListInstrumentsRequest",
     "ListInstrumentsResponse",
+    "InstrumentRegistry",
 ]
@@ -0,0 +1,86 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import replace
+from typing import Any
+from intx_sdk.async_client import AsyncClient
+from intx_sdk.candles import CandleArray
+from intx_sdk.candles.fetcher import DEFAULT_MAX_BARS_PER_REQUEST, DEFAULT_MAX_WORKERS, fetch_candle_range_async
+from intx_sdk.utils import append_query_param, append_pagination_params
+from intx_sdk.services.model import InstrumentDetails
+from .get_aggregated_candles import GetAggregatedCandlesRequest, GetAggregatedCandlesResponse
+from .get_daily_trading_volumes import GetDailyTradingVolumesRequest, GetDailyTradingVolumesResponse
+from .get_historical_funding_rates import GetHistoricalFundingRatesRequest, GetHistoricalFundingRatesResponse
+from .get_instrument_details import GetInstrumentDetailsRequest, GetInstrumentDetailsResponse
+from .get_quote_per_instrument import GetQuotePerInstrumentRequest, GetQuotePerInstrumentResponse
+from .list_instruments import ListInstrumentsRequest, ListInstrumentsResponse
+
+
+class AsyncInstrumentsService:
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def get_aggregated_candles(self, request: GetAggregatedCandlesRequest) -> GetAggregatedCandlesResponse:
+        return self.client.decoder.decode(GetAggregatedCandlesResponse, await self._get_aggregated_candles_json(request))
+
+    async def get_aggregated_candles_array(self, request: GetAggregatedCandlesRequest) -> CandleArray:
+        """Like get_aggregated_candles, but decodes the bars straight into a columnar CandleArray"""
+        return CandleArray.from_aggregations((await self._get_aggregated_candles_json(request))['aggregations'])
+
+    async def _get_aggregated_candles_json(self, request: GetAggregatedCandlesRequest) -> Any:
+        path = f"/instruments/{request.instrument}/candles"
+        query_params = append_query_param("", 'granularity', request.granularity)
+        query_params = append_query_param(query_params, 'start', request.start)
+        query_params = append_query_param(query_params, 'end', request.end)
+        response = await self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
+        return response.json()
+
+    async def get_aggregated_candles_range(self, request: GetAggregatedCandlesRequest, max_bars: int = DEFAULT_MAX_BARS_PER_REQUEST,
+                                           max_workers: int = DEFAULT_MAX_WORKERS) -> CandleArray:
+        """Fetch request.start to request.end (default now) in concurrent per-call-sized chunks as one series"""
+        async def fetch(start: str, end: str) -> CandleArray:
+            return await self.get_aggregated_candles_array(replace(request, start=start, end=end))
+
+        return await fetch_candle_range_async(fetch, request.start, request.end, request.granularity,
+                                              max_bars, max_workers)
+
+    async def get_daily_trading_volumes(self, request: GetDailyTradingVolumesRequest) -> GetDailyTradingVolumesResponse:
+        path = "/instruments/volumes/daily"
+        query_params = append_pagination_params("", request.pagination)
+        query_params = append_query_param(query_params, 'instruments', request.instruments)
+        query_params = append_query_param(query_params, 'time_from', request.time_from)
+        query_params = append_query_param(query_params, 'show_other', request.show_other)
+        response = await self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
+        return self.client.decoder.decode(GetDailyTradingVolumesResponse, response.json())
+
+    async def get_historical_funding_rates(self, request: GetHistoricalFundingRatesRequest) -> GetHistoricalFundingRatesResponse:
+        path = f"/instruments/{request.instrument}/funding"
+        query_params = append_pagination_params("", request.pagination)
+        response = await self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
+        return self.client.decoder.decode(GetHistoricalFundingRatesResponse, response.json())
+
+    async def get_instrument_details(self, request: GetInstrumentDetailsRequest) -> GetInstrumentDetailsResponse:
+        path = f"/instruments/{request.instrument}"
+        response = await self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
+        return self.client.decoder.decode(GetInstrumentDetailsResponse, response.json())
+
+    async def get_quote_per_instrument(self, request: GetQuotePerInstrumentRequest) -> GetQuotePerInstrumentResponse:
+        path = f"/instruments/{request.instrument}/quote"
+        response = await self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
+        return self.client.decoder.decode(GetQuotePerInstrumentResponse, response.json())
+
+    async def list_instruments(self, request: ListInstrumentsRequest) -> ListInstrumentsResponse:
+        path = "/instruments"
+        response = await self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
+        return ListInstrumentsResponse(instruments=self.client.decoder.decode_list(InstrumentDetails, response.json()))
@@ -0,0 +1,111 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Union
+from intx_sdk.services.model import InstrumentDetails
+from .get_instrument_details import GetInstrumentDetailsRequest
+from .list_instruments import ListInstrumentsRequest
+
+
+class InstrumentRegistry:
+    """Opt-in cache of instrument metadata keyed by symbol, instrument_id and instrument_uuid.
+
+    The first lookup loads every instrument with one list_instruments call. Once the data is older
+    than `ttl` seconds, lookups keep answering from the stale copy while a background thread
+    reloads it; if that reload fails the stale copy is kept for another `ttl`. A key that is not
+    cached, such as a newly listed instrument, is fetched with get_instrument_details and added.
+    """
+
+    def __init__(self, service, ttl: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        self.service = service
+        self.ttl = ttl
+        self.clock = clock
+        self.instruments: Dict[str, InstrumentDetails] = {}
+        self.expires_at: Optional[float] = None
+        self.refreshing = False
+        self.last_error: Optional[Exception] = None
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        # Held across the first load so concurrent lookups on a cold registry wait for one list call
+        self.load_lock = threading.Lock()
+
+    def get(self, key: Union[str, int]) -> InstrumentDetails:
+        """Look up an instrument by symbol, instrument_id or instrument_uuid"""
+        self.ensure_fresh()
+        key = str(key)
+        instrument = self.instruments.get(key)
+        with self.lock:
+            if instrument is not None:
+                self.hits += 1
+                return instrument
+            self.misses += 1
+        instrument = self.service.get_instrument_details(GetInstrumentDetailsRequest(instrument=key))
+        with self.lock:
+            self.instruments = {**self.instruments, **self.index([instrument])}
+        return instrument
+
+    def all(self) -> List[InstrumentDetails]:
+        self.ensure_fresh()
+        return list({id(i): i for i in self.instruments.values()}.values())
+
+    def ensure_fresh(self) -> None:
+        if self.expires_at is None:
+            with self.load_lock:
+                if self.expires_at is None:
+                    self.refresh()
+            return
+        if self.clock() < self.expires_at:
+            return
+        with self.lock:
+            if self.refreshing:
+                return
+            self.refreshing = True
+        threading.Thread(target=self.refresh_in_background, daemon=True).start()
+
+    def refresh(self) -> None:
+        """Reload every instrument now, blocking the caller"""
+        response = self.service.list_instruments(ListInstrumentsRequest())
+        instruments = self.index(response.instruments)
+        with self.lock:
+            self.instruments = instruments
+            self.expires_at = self.clock() + self.ttl
+            self.last_error = None
+
+    def refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            with self.lock:
+                self.last_error = e
+                self.expires_at = self.clock() + self.ttl
+        finally:
+            self.refreshing = False
+
+    def invalidate(self) -> None:
+        """Drop the cached data so the next lookup reloads it"""
+        with self.lock:
+            self.instruments = {}
+            self.expires_at = None
+
+    @staticmethod
+    def index(instruments) -> Dict[str, InstrumentDetails]:
+        by_key = {}
+        for instrument in instruments:
+            for key in (instrument.symbol, instrument.instrument_id, instrument.instrument_uuid):
+                if key is not None:
+                    by_key[str(key)] = instrument
+        return by_key
@@ -12,8 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from dataclasses import replace
+from typing import Any
 from intx_sdk.client import Client
+from intx_sdk.candles import CandleArray
+from intx_sdk.candles.fetcher import DEFAULT_MAX_BARS_PER_REQUEST, DEFAULT_MAX_WORKERS, fetch_candle_range
 from intx_sdk.utils import append_query_param, append_pagination_params
+from intx_sdk.services.model import InstrumentDetails
 from .get_aggregated_candles import GetAggregatedCandlesRequest, GetAggregatedCandlesResponse
 from .get_daily_trading_volumes import GetDailyTradingVolumesRequest, GetDailyTradingVolumesResponse
 from .get_historical_funding_rates import GetHistoricalFundingRatesRequest, GetHistoricalFundingRatesResponse
@@ -27,12 +32,27 @@ class InstrumentsService:
         self.client = client
 
     def get_aggregated_candles(self, request: GetAggregatedCandlesRequest) -> GetAggregatedCandlesResponse:
+        return self.client.decoder.decode(GetAggregatedCandlesResponse, self._get_aggregated_candles_json(request))
+
+    def get_aggregated_candles_array(self, request: GetAggregatedCandlesRequest) -> CandleArray:
+        """Like get_aggregated_candles, but decodes the bars straight into a columnar CandleArray"""
+        return CandleArray.from_aggregations((self._get_aggregated_candles_json(request))['aggregations'])
+
+    def _get_aggregated_candles_json(self, request: GetAggregatedCandlesRequest) -> Any:
         path = f"/instruments/{request.instrument}/candles"
         query_params = append_query_param("", 'granularity', request.granularity)
         query_params = append_query_param(query_params, 'start', request.start)
         query_params = append_query_param(query_params, 'end', request.end)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return GetAggregatedCandlesResponse(**response.json())
+        return response.json()
+
+    def get_aggregated_candles_range(self, request: GetAggregatedCandlesRequest, max_bars: int = DEFAULT_MAX_BARS_PER_REQUEST,
+                                     max_workers: int = DEFAULT_MAX_WORKERS) -> CandleArray:
+        """Fetch request.start to request.end (default now) in concurrent per-call-sized chunks as one series"""
+        def fetch(start: str, end: str) -> CandleArray:
+            return self.get_aggregated_candles_array(replace(request, start=start, end=end))
+
+        return fetch_candle_range(fetch, request.start, request.end, request.granularity, max_bars, max_workers)
 
     def get_daily_trading_volumes(self, request: GetDailyTradingVolumesRequest) -> GetDailyTradingVolumesResponse:
         path = "/instruments/volumes/daily"
@@ -41,25 +61,25 @@ class InstrumentsService:
         query_params = append_query_param(query_params, 'time_from', request.time_from)
         query_params = append_query_param(query_params, 'show_other', request.show_other)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return GetDailyTradingVolumesResponse(**response.json())
+        return self.client.decoder.decode(GetDailyTradingVolumesResponse, response.json())
 
     def get_historical_funding_rates(self, request: GetHistoricalFundingRatesRequest) -> GetHistoricalFundingRatesResponse:
         path = f"/instruments/{request.instrument}/funding"
         query_params = append_pagination_params("", request.pagination)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return GetHistoricalFundingRatesResponse(**response.json())
+        return self.client.decoder.decode(GetHistoricalFundingRatesResponse, response.json())
 
     def get_instrument_details(self, request: GetInstrumentDetailsRequest) -> GetInstrumentDetailsResponse:
         path = f"/instruments/{request.instrument}"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
-        return GetInstrumentDetailsResponse(**response.json())
+        return self.client.decoder.decode(GetInstrumentDetailsResponse, response.json())
 
     def get_quote_per_instrument(self, request: GetQuotePerInstrumentRequest) -> GetQuotePerInstrumentResponse:
         path = f"/instruments/{request.instrument}/quote"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
-        return GetQuotePerInstrumentResponse(**response.json())
+        return self.client.decoder.decode(GetQuotePerInstrumentResponse, response.json())
 
     def list_instruments(self, request: ListInstrumentsRequest) -> ListInstrumentsResponse:
         path = "/instruments"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
-        return ListInstrumentsResponse(instruments=response.json())
+        return ListInstrumentsResponse(instruments=self.client.decoder.decode_list(InstrumentDetails, response.json()))
@@ -13,9 +13,13 @@
 # limitations under the License.
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, NewType, Optional
 from intx_sdk.enums import OrderSide, OrderType, TimeInForce, EventType, OrderStatus, StpMode, AlgoStrategy, TransferType, TransferStatus
 
+# A price, size, rate or amount. The API sends these as decimal strings (a few as JSON numbers); the
+# client's Decoder keeps them as sent, or converts them to float or Decimal depending on its numeric mode.
+Numeric = NewType("Numeric", str)
+
 
 @dataclass
 class Portfolio:
@@ -23,8 +27,8 @@ class Portfolio:
     portfolio_uuid: str
     name: str
     user_uuid: str
-    maker_fee_rate: str
-    taker_fee_rate: str
+    maker_fee_rate: Numeric
+    taker_fee_rate: Numeric
     trading_lock: bool
     withdrawal_lock: bool
     borrow_disabled: bool
@@ -44,8 +48,8 @@ class Portfolio:
 class AssetLoan:
     portfolio_id: str
     asset_id: str
-    delta: float
-    total: float
+    delta: Numeric
+    total: Numeric
     asset_uuid: str
     portfolio_uuid: str
 
@@ -55,20 +59,20 @@ class AssetBalance:
     asset_id: str
     asset_name: str
     asset_uuid: str
-    quantity: float
-    hold: float
-    hold_available_for_collateral: float
-    transfer_hold: float
-    collateral_value: float
-    max_withdraw_amount: float
-    loan: float
-    loan_collateral_requirement: float
-    pledged_collateral_quantity: float
-    loan_initial_margin_contribution: float
-    collateral_backed_overdraft_loan: float
-    user_requested_loan: float
-    unreconciled_amount: Optional[float] = None
-    max_undelegate_amount: Optional[float] = None
+    quantity: Numeric
+    hold: Numeric
+    hold_available_for_collateral: Numeric
+    transfer_hold: Numeric
+    collateral_value: Numeric
+    max_withdraw_amount: Numeric
+    loan: Numeric
+    loan_collateral_requirement: Numeric
+    pledged_collateral_quantity: Numeric
+    loan_initial_margin_contribution: Numeric
+    collateral_backed_overdraft_loan: Numeric
+    user_requested_loan: Numeric
+    unreconciled_amount: Optional[Numeric] = None
+    max_undelegate_amount: Optional[Numeric] = None
 
 
 @dataclass
@@ -89,15 +93,15 @@ class Asset:
     asset_uuid: str
     asset_name: str
     status: str
-    collateral_weight: str
+    collateral_weight: Numeric
     supported_networks_enabled: bool
     ecosystem_collateral_limit_breached: bool
-    min_borrow_qty: Optional[str] = None
-    max_borrow_qty: Optional[str] = None
-    loan_collateral_requirement_multiplier: Optional[str] = None
-    loan_initial_margin: Optional[str] = None
-    max_loan_leverage: Optional[str] = None
-    account_collateral_limit: Optional[str] = None
+    min_borrow_qty: Optional[Numeric] = None
+    max_borrow_qty: Optional[Numeric] = None
+    loan_collateral_requirement_multiplier: Optional[Numeric] = None
+    loan_initial_margin: Optional[Numeric] = None
+    max_loan_leverage: Optional[Numeric] = None
+    account_collateral_limit: Optional[Numeric] = None
 
 
 @dataclass
@@ -106,8 +110,8 @@ class SupportedNetwork:
     asset_uuid: str
     asset_name: str
     network_arn_id: str
-    min_withdrawal_amt: str
-    max_withdrawal_amt: str
+    min_withdrawal_amt: Numeric
+    max_withdrawal_amt: Numeric
     network_confirms: int
     processing_time: str
     is_default: bool
@@ -121,21 +125,21 @@ class FeeTier:
     instrument_type: str
     fee_tier_id: int
     fee_tier_name: str
-    maker_fee_rate: float
-    taker_fee_rate: float
-    min_balance: float
-    min_volume: float
+    maker_fee_rate: Numeric
+    taker_fee_rate: Numeric
+    min_balance: Numeric
+    min_volume: Numeric
     require_balance_and_volume: bool
 
 
 @dataclass
 class Aggregation:
     start: str
-    open: str
-    high: str
-    low: str
-    close: str
-    volume: Optional[str] = None
+    open: Numeric
+    high: Numeric
+    low: Numeric
+    close: Numeric
+    volume: Optional[Numeric] = None
 
 
 @dataclass
@@ -143,22 +147,22 @@ class IndexConstituent:
     symbol: str
     name: str
     rank: int
-    cap_factor: str
-    amount: str
-    market_cap: str
-    index_market_cap: str
-    weight: str
-    running_weight: str
+    cap_factor: Numeric
+    amount: Numeric
+    market_cap: Numeric
+    index_market_cap: Numeric
+    weight: Numeric
+    running_weight: Numeric
 
 
 @dataclass
 class IndexComposition:
     product_id: str
-    divisor: float
+    divisor: Numeric
     timestamp: str
     inception_timestamp: str
     last_rebalance: str
-    constituents: list
+    constituents: List[IndexConstituent]
 
 
 @dataclass
@@ -166,8 +170,8 @@ class IndexPrice:
     product_id: str
     status: str
     timestamp: str
-    price: str
-    price_24hr_change: str
+    price: Numeric
+    price_24hr_change: Numeric
 
 
 @dataclass
@@ -179,48 +183,48 @@ class Pagination:
 @dataclass
 class InstrumentVolume:
     symbol: str
-    volume: str
-    notional: str
+    volume: Numeric
+    notional: Numeric
 
 
 @dataclass
 class VolumeTotals:
-    total_instruments_volume: str
-    total_instruments_notional: str
-    total_exchange_volume: str
-    total_exchange_notional: str
+    total_instruments_volume: Numeric
+    total_instruments_notional: Numeric
+    total_exchange_volume: Numeric
+    total_exchange_notional: Numeric
 
 
 @dataclass
 class DailyVolume:
     timestamp: str
-    instruments: list
-    totals: dict
+    instruments: List[InstrumentVolume]
+    totals: VolumeTotals
 
 
 @dataclass
 class FundingRate:
     instrument_id: str
-    funding_rate: str
-    mark_price: str
+    funding_rate: Numeric
+    mark_price: Numeric
     event_time: str
 
 
 @dataclass
 class Quote:
-    best_bid_price: str
-    best_bid_size: str
-    best_ask_size: str
-    trade_price: str
-    trade_qty: str
-    index_price: str
-    mark_price: str
-    settlement_price: str
-    limit_up: str
-    limit_down: str
-    predicted_funding: str
+    best_bid_price: Numeric
+    best_bid_size: Numeric
+    best_ask_size: Numeric
+    trade_price: Numeric
+    trade_qty: Numeric
+    index_price: Numeric
+    mark_price: Numeric
+    settlement_price: Numeric
+    limit_up: Numeric
+    limit_down: Numeric
+    predicted_funding: Numeric
     timestamp: str
-    best_ask_price: Optional[str] = None
+    best_ask_price: Optional[Numeric] = None
 
 
 @dataclass
@@ -236,33 +240,33 @@ class InstrumentDetails:
     quote_asset_id: str
     quote_asset_uuid: str
     quote_asset_name: str
-    base_increment: str
-    quote_increment: str
-    price_band_percent: float
-    market_order_percent: float
-    qty_24hr: str
-    notional_24hr: str
-    avg_daily_qty: str
-    avg_daily_notional: str
-    avg_30day_notional: str
-    avg_30day_qty: str
-    previous_day_qty: str
-    open_interest: str
-    position_limit_qty: str
-    position_limit_adq_pct: float
-    replacement_cost: str
-    base_imf: float
-    min_notional_value: str
-    min_quantity: str
+    base_increment: Numeric
+    quote_increment: Numeric
+    price_band_percent: Numeric
+    market_order_percent: Numeric
+    qty_24hr: Numeric
+    notional_24hr: Numeric
+    avg_daily_qty: Numeric
+    avg_daily_notional: Numeric
+    avg_30day_notional: Numeric
+    avg_30day_qty: Numeric
+    previous_day_qty: Numeric
+    open_interest: Numeric
+    position_limit_qty: Numeric
+    position_limit_adq_pct: Numeric
+    replacement_cost: Numeric
+    base_imf: Numeric
+    min_notional_value: Numeric
+    min_quantity: Numeric
     funding_interval: str
     trading_state: str
     quote: dict
-    base_asset_multiplier: str
+    base_asset_multiplier: Numeric
     underlying_type: str
-    rfq_maker_fee_rate: str
-    position_notional_limit: Optional[str] = None
-    open_interest_notional_limit: Optional[str] = None
-    default_imf: Optional[float] = None
+    rfq_maker_fee_rate: Numeric
+    position_notional_limit: Optional[Numeric] = None
+    open_interest_notional_limit: Optional[Numeric] = None
+    default_imf: Optional[Numeric] = None
 
 
 @dataclass
@@ -277,22 +281,22 @@ class Order:
     portfolio_id: int
     portfolio_uuid: str
     type: OrderType
-    size: float
+    size: Numeric
     tif: TimeInForce
     order_status: OrderStatus
-    leaves_qty: str
-    exec_qty: str
-    avg_price: str
-    fee: str
+    leaves_qty: Numeric
+    exec_qty: Numeric
+    avg_price: Numeric
+    fee: Numeric
     post_only: bool
     close_only: bool
     reduce_only: bool
     event_type: Optional[EventType] = None
     event_time: Optional[str] = None
     submit_time: Optional[str] = None
-    price: Optional[float] = None
-    stop_price: Optional[float] = None
-    stop_limit_price: Optional[float] = None
+    price: Optional[Numeric] = None
+    stop_price: Optional[Numeric] = None
+    stop_limit_price: Optional[Numeric] = None
     expire_time: Optional[str] = None
     stp_mode: Optional[StpMode] = None
     algo_strategy: Optional[AlgoStrategy] = None
@@ -301,7 +305,7 @@ class Order:
 
 @dataclass
 class LoanAvailability:
-    available: str
+    available: Numeric
 
 
 @dataclass
@@ -310,14 +314,14 @@ class PortfolioLoan:
     asset_id: str
     asset_uuid: str
     asset: str
-    total_loan: str
-    collateral_backed_overdraft_loan: str
-    user_requested_loan: str
-    collateral_requirement: str
-    initial_margin_contribution: str
-    initial_margin_requirement: str
-    current_interest_rate: str
-    pending_interest_charge: str
+    total_loan: Numeric
+    collateral_backed_overdraft_loan: Numeric
+    user_requested_loan: Numeric
+    collateral_requirement: Numeric
+    initial_margin_contribution: Numeric
+    initial_margin_requirement: Numeric
+    current_interest_rate: Numeric
+    pending_interest_charge: Numeric
 
 
 @dataclass
@@ -325,37 +329,37 @@ class OpenPositionLimit:
     symbol: str
     instrument_id: str
     instrument_uuid: str
-    open_position_notional_limit: str
+    open_position_notional_limit: Numeric
 
 
 @dataclass
 class PortfolioSummary:
-    collateral: str
-    unrealized_pnl: str
-    unrealized_pnl_percent: str
-    position_notional: str
-    open_position_notional: str
-    pending_fees: str
-    borrow: str
-    accrued_interest: str
-    rolling_debt: str
-    balance: str
-    buying_power: str
-    portfolio_initial_margin: float
-    portfolio_current_margin: float
-    portfolio_maintenance_margin: float
-    portfolio_close_out_margin: float
+    collateral: Numeric
+    unrealized_pnl: Numeric
+    unrealized_pnl_percent: Numeric
+    position_notional: Numeric
+    open_position_notional: Numeric
+    pending_fees: Numeric
+    borrow: Numeric
+    accrued_interest: Numeric
+    rolling_debt: Numeric
+    balance: Numeric
+    buying_power: Numeric
+    portfolio_initial_margin: Numeric
+    portfolio_current_margin: Numeric
+    portfolio_maintenance_margin: Numeric
+    portfolio_close_out_margin: Numeric
     in_liquidation: bool
-    unrealized_pnl_notional: Optional[float] = None
-    portfolio_initial_margin_notional: Optional[float] = None
-    portfolio_current_margin_notional: Optional[float] = None
-    portfolio_maintenance_margin_notional: Optional[float] = None
-    portfolio_close_out_margin_notional: Optional[float] = None
-    margin_override: Optional[float] = None
-    lock_up_initial_margin: Optional[float] = None
-    loan_collateral_requirement: Optional[str] = None
-    position_offset_notional: Optional[float] = None
-    total_allocated_initial_margin_notional: Optional[float] = None
+    unrealized_pnl_notional: Optional[Numeric] = None
+    portfolio_initial_margin_notional: Optional[Numeric] = None
+    portfolio_current_margin_notional: Optional[Numeric] = None
+    portfolio_maintenance_margin_notional: Optional[Numeric] = None
+    portfolio_close_out_margin_notional: Optional[Numeric] = None
+    margin_override: Optional[Numeric] = None
+    lock_up_initial_margin: Optional[Numeric] = None
+    loan_collateral_requirement: Optional[Numeric] = None
+    position_offset_notional: Optional[Numeric] = None
+    total_allocated_initial_margin_notional: Optional[Numeric] = None
 
 
 @dataclass
@@ -364,25 +368,18 @@ class Position:
     symbol: str
     instrument_id: str
     instrument_uuid: str
-    vwap: str
-    net_size: str
-    buy_order_qty: str
-    sell_order_qty: str
+    vwap: Numeric
+    net_size: Numeric
+    buy_order_qty: Numeric
+    sell_order_qty: Numeric
     instrument_type: str
     side: str
-    total_entry_value: str
+    total_entry_value: Numeric
     updated_time: str
-    unrealized_pnl: str
-    unrealized_pnl_percent: str
-    realized_pnl: str
-    realized_pnl_percent: str
-
-
-@dataclass
-class PortfolioDetail:
-    summary: PortfolioSummary
-    balances: list
-    positions: list
+    unrealized_pnl: Numeric
+    unrealized_pnl_percent: Numeric
+    realized_pnl: Numeric
+    realized_pnl_percent: Numeric
 
 
 @dataclass
@@ -392,26 +389,33 @@ class PortfolioPosition:
     symbol: str
     instrument_id: str
     instrument_uuid: str
-    vwap: str
-    net_size: str
-    buy_order_size: str
-    sell_order_size: str
-    im_contribution: float
-    unrealized_pnl: str
-    mark_price: str
-    entry_vwap: str
-    index_price: str
-    initial_margin: Optional[float] = None
-    open_position_notional: Optional[str] = None
-    long_open_position_notional: Optional[str] = None
-    short_open_position_notional: Optional[str] = None
-    position_margin_override: Optional[str] = None
+    vwap: Numeric
+    net_size: Numeric
+    buy_order_size: Numeric
+    sell_order_size: Numeric
+    im_contribution: Numeric
+    unrealized_pnl: Numeric
+    mark_price: Numeric
+    entry_vwap: Numeric
+    index_price: Numeric
+    initial_margin: Optional[Numeric] = None
+    open_position_notional: Optional[Numeric] = None
+    long_open_position_notional: Optional[Numeric] = None
+    short_open_position_notional: Optional[Numeric] = None
+    position_margin_override: Optional[Numeric] = None
+
+
+@dataclass
+class PortfolioDetail:
+    summary: PortfolioSummary
+    balances: List[AssetBalance]
+    positions: List[PortfolioPosition]
 
 
 @dataclass
 class TotalOpenPositionLimit:
     total_open_position_notional_limit_enforced: bool
-    total_open_position_notional_limit: Optional[str] = None
+    total_open_position_notional_limit: Optional[Numeric] = None
 
 
 @dataclass
@@ -420,11 +424,11 @@ class PortfolioFeeRate:
     fee_tier_id: str
     is_vip_tier: bool
     fee_tier_name: str
-    maker_fee_rate: str
-    taker_fee_rate: str
+    maker_fee_rate: Numeric
+    taker_fee_rate: Numeric
     is_override: bool
-    trailing_30day_volume: Optional[str] = None
-    trailing_24hr_usdc_balance: Optional[str] = None
+    trailing_30day_volume: Optional[Numeric] = None
+    trailing_24hr_usdc_balance: Optional[Numeric] = None
 
 
 @dataclass
@@ -440,22 +444,22 @@ class PortfolioFill:
     portfolio_uuid: str
     fill_id: str
     symbol: str
-    fill_price: str
-    fill_qty: str
+    fill_price: Numeric
+    fill_qty: Numeric
     side: str
     event_time: str
     order_id: Optional[str] = None
     client_order_id: Optional[str] = None
     instrument_id: Optional[str] = None
     instrument_uuid: Optional[str] = None
-    fee: Optional[str] = None
+    fee: Optional[Numeric] = None
     liquidity_indicator: Optional[str] = None
 
 
 @dataclass
 class PortfolioFillsResult:
     pagination: PortfolioFillPaginationResult
-    results: list
+    results: List[PortfolioFill]
 
 
 @dataclass
@@ -466,22 +470,22 @@ class TransferResult:
 @dataclass
 class MarginOverrideResult:
     portfolio_id: str
-    margin_override: float
+    margin_override: Numeric
 
 
 @dataclass
 class LoanPreview:
     reject_details: Optional[str] = None
     is_valid: Optional[bool] = None
-    initial_margin_contribution: Optional[str] = None
-    initial_margin_delta: Optional[str] = None
-    portfolio_initial_margin: Optional[str] = None
-    portfolio_initial_margin_notional: Optional[str] = None
-    loan_collateral_requirement: Optional[str] = None
-    loan_collateral_requirement_delta: Optional[str] = None
-    total_loan: Optional[str] = None
-    loan_delta: Optional[str] = None
-    max_available: Optional[str] = None
+    initial_margin_contribution: Optional[Numeric] = None
+    initial_margin_delta: Optional[Numeric] = None
+    portfolio_initial_margin: Optional[Numeric] = None
+    portfolio_initial_margin_notional: Optional[Numeric] = None
+    loan_collateral_requirement: Optional[Numeric] = None
+    loan_collateral_requirement_delta: Optional[Numeric] = None
+    total_loan: Optional[Numeric] = None
+    loan_delta: Optional[Numeric] = None
+    max_available: Optional[Numeric] = None
 
 
 
@@ -489,14 +493,14 @@ class LoanPreview:
 class PositionOffset:
     primary_instrument_id: str
     secondary_instrument_id: str
-    offset: str
+    offset: Numeric
 
 
 @dataclass
 class RankingStatistic:
     rank: str
-    relative_percent: str
-    volume: str
+    relative_percent: Numeric
+    volume: Numeric
 
 
 @dataclass
@@ -527,7 +531,7 @@ class CryptoAddressResult:
 
 @dataclass
 class CounterpartyWithdrawalLimit:
-    max_ctn_withdraw_amount: str
+    max_ctn_withdraw_amount: Numeric
 
 
 @dataclass
@@ -541,7 +545,7 @@ class PortfolioInfo:
 class Transfer:
     transfer_uuid: str
     transfer_type: TransferType
-    amount: str
+    amount: Numeric
     asset: str
     status: TransferStatus
     network_name: str
@@ -570,7 +574,7 @@ class TransferPaginationResult:
 @dataclass
 class TransfersResult:
     pagination: TransferPaginationResult
-    results: list
+    results: List[Transfer]
 
 
 @dataclass
@@ -586,7 +590,7 @@ class WithdrawToCounterpartyResult:
     source_counterparty_id: str
     target_counterparty_id: str
     asset: str
-    amount: str
+    amount: Numeric
 
 
 @dataclass
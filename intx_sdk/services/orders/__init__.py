@@ -13,25 +13,50 @@
 # limitations under the License.
 
 from .service import OrdersService
+from .async_service import AsyncOrdersService
+from .cancel_all_orders import CancelAllOrdersRequest, CancelAllOrdersResponse, PortfolioCancelResult
 from .cancel_order import CancelOrderRequest, CancelOrderResponse
 from .cancel_orders import CancelOrdersRequest, CancelOrdersResponse
+from .client_order_id import ClientOrderId, ClientOrderIdGenerator, parse_client_order_id, strategy_of
 from .create_order import CreateOrderRequest, CreateOrderResponse
+from .create_orders import CreateOrdersRequest, CreateOrdersResponse, CreateOrderResult
 from .get_order_details import GetOrderDetailsRequest, GetOrderDetailsResponse
 from .list_open_orders import ListOpenOrdersRequest, ListOpenOrdersResponse
 from .modify_open_order import ModifyOpenOrderRequest, ModifyOpenOrderResponse
+from .manager import OrderManager, OrderDiff
+from .validation import OrderValidator, InstrumentRules
+from .requoter import Requoter, RequoteResult, RequoteStats
 
 __all__ = [
     "OrdersService",
+    "AsyncOrdersService",
+    "CancelAllOrdersRequest",
+    "CancelAllOrdersResponse",
+    "PortfolioCancelResult",
     "CancelOrderRequest",
     "CancelOrderResponse",
     "CancelOrdersRequest",
     "CancelOrdersResponse",
+    "ClientOrderId",
+    "ClientOrderIdGenerator",
+    "parse_client_order_id",
+    "strategy_of",
     "CreateOrderRequest",
     "CreateOrderResponse",
+    "CreateOrdersRequest",
+    "CreateOrdersResponse",
+    "CreateOrderResult",
     "GetOrderDetailsRequest",
     "GetOrderDetailsResponse",
     "ListOpenOrdersRequest",
     "ListOpenOrdersResponse",
     "ModifyOpenOrderRequest",
     "ModifyOpenOrderResponse",
+    "OrderManager",
+    "OrderDiff",
+    "OrderValidator",
+    "InstrumentRules",
+    "Requoter",
+    "RequoteResult",
+    "RequoteStats",
 ]
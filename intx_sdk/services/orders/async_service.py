@@ -0,0 +1,170 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from dataclasses import asdict
+from typing import Optional
+from intx_sdk.async_client import AsyncClient
+from intx_sdk.services.portfolios.async_service import AsyncPortfoliosService
+from intx_sdk.services.portfolios.list_portfolios import ListPortfoliosRequest
+from intx_sdk.utils import append_pagination_params, append_query_param
+from .cancel_all_orders import CancelAllOrdersRequest, CancelAllOrdersResponse, PortfolioCancelResult
+from .cancel_order import CancelOrderRequest, CancelOrderResponse
+from .cancel_orders import CancelOrdersRequest, CancelOrdersResponse
+from .create_order import CreateOrderRequest, CreateOrderResponse
+from .create_orders import CreateOrdersRequest, CreateOrdersResponse, CreateOrderResult
+from .get_order_details import GetOrderDetailsRequest, GetOrderDetailsResponse
+from .list_open_orders import ListOpenOrdersRequest, ListOpenOrdersResponse
+from .manager import OrderManager
+from .modify_open_order import ModifyOpenOrderRequest, ModifyOpenOrderResponse
+from .validation import OrderValidator
+
+
+class AsyncOrdersService:
+    def __init__(self, client: AsyncClient, validator: Optional[OrderValidator] = None,
+                 manager: Optional[OrderManager] = None):
+        self.client = client
+        # When set, create_order and modify_open_order raise PreTradeValidationError before sending
+        self.validator = validator
+        # When set, records the orders created, modified and cancelled through this service
+        self.manager = manager
+
+    async def cancel_order(self, request: CancelOrderRequest) -> CancelOrderResponse:
+        path = f"/orders/{request.id}"
+        query = f"portfolio={request.portfolio}"
+        response = await self.client.request("DELETE", path, query=query, allowed_status_codes=request.allowed_status_codes)
+        order = self.client.decoder.decode(CancelOrderResponse, response.json())
+        if self.manager is not None:
+            self.manager.forget(getattr(order, "order_id", None) or request.id)
+        return order
+
+    async def cancel_orders(self, request: CancelOrdersRequest) -> CancelOrdersResponse:
+        path = "/orders"
+        query_params = append_query_param("", 'portfolio', request.portfolio)
+        query_params = append_query_param(query_params, 'instrument', request.instrument)
+        query_params = append_query_param(query_params, 'side', request.side)
+        query_params = append_query_param(query_params, 'instrument_type', request.instrument_type)
+        # Repeating a mass cancel has the same effect, so it is retried like a safe method
+        response = await self.client.request("DELETE", path, query=query_params, allowed_status_codes=request.allowed_status_codes,
+                                             idempotent=True)
+        cancelled = CancelOrdersResponse(orders=response.json())
+        if self.manager is not None:
+            self.manager.record_cancel_orders(request, cancelled.orders)
+        return cancelled
+
+    async def cancel_all_orders(self, request: CancelAllOrdersRequest) -> CancelAllOrdersResponse:
+        """Kill switch: cancel open orders in many portfolios at once; see OrdersService.cancel_all_orders"""
+        started = time.perf_counter()
+        portfolios = request.portfolios
+        list_latency = 0.0
+        if portfolios is None:
+            response = await AsyncPortfoliosService(self.client).list_portfolios(ListPortfoliosRequest())
+            portfolios = [p.portfolio_id for p in response.portfolios]
+            list_latency = time.perf_counter() - started
+        results = [PortfolioCancelResult(portfolio=portfolio) for portfolio in portfolios]
+        if results:
+            semaphore = asyncio.Semaphore(request.max_workers or min(len(results), self.client.transport.pool_maxsize))
+
+            async def cancel(result: PortfolioCancelResult) -> None:
+                async with semaphore:
+                    cancel_started = time.perf_counter()
+                    result.attempts += 1
+                    try:
+                        result.orders = (await self.cancel_orders(CancelOrdersRequest(
+                            portfolio=result.portfolio, instrument=request.instrument, side=request.side,
+                            instrument_type=request.instrument_type))).orders
+                        result.error = None
+                    except Exception as e:
+                        result.error = e
+                    result.latency = time.perf_counter() - cancel_started
+
+            pending = results
+            for attempt in range(1, request.max_rounds + 1):
+                await asyncio.gather(*(cancel(result) for result in pending))
+                pending = [result for result in pending if not result.ok]
+                if not pending or attempt == request.max_rounds:
+                    break
+                await asyncio.sleep(self.client.retry_policy.backoff(attempt))
+        return CancelAllOrdersResponse(results=results, elapsed=time.perf_counter() - started,
+                                       list_portfolios_latency=list_latency)
+
+    async def create_order(self, request: CreateOrderRequest) -> CreateOrderResponse:
+        if self.validator is not None:
+            self.validator.validate_create(request)
+        path = "/orders"
+        body = {k: v for k, v in asdict(request).items() if v is not None and k != 'allowed_status_codes'}
+        # A client_order_id lets the exchange reject duplicates, so the order is safe to re-send
+        response = await self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes,
+                                             idempotent=bool(request.client_order_id))
+        order = self.client.decoder.decode(CreateOrderResponse, response.json())
+        if self.manager is not None:
+            self.manager.record(order)
+        return order
+
+    async def create_orders(self, request: CreateOrdersRequest) -> CreateOrdersResponse:
+        """Submit several orders concurrently and return one result per order, in input order.
+
+        At most `max_workers` orders are in flight, by default as many as the connection pool holds.
+        A failed order does not stop the others: its result carries the exception instead.
+        """
+        started = time.perf_counter()
+        if not request.orders:
+            return CreateOrdersResponse()
+        max_workers = request.max_workers or min(len(request.orders), self.client.transport.pool_maxsize)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def create(order_request: CreateOrderRequest) -> CreateOrderResult:
+            async with semaphore:
+                order_started = time.perf_counter()
+                try:
+                    order, error = await self.create_order(order_request), None
+                except Exception as e:
+                    order, error = None, e
+                return CreateOrderResult(request=order_request, order=order, error=error,
+                                         latency=time.perf_counter() - order_started)
+
+        results = await asyncio.gather(*(create(order_request) for order_request in request.orders))
+        return CreateOrdersResponse(results=list(results), elapsed=time.perf_counter() - started)
+
+    async def get_order_details(self, request: GetOrderDetailsRequest) -> GetOrderDetailsResponse:
+        path = f"/orders/{request.order_id}"
+        query_params = append_query_param("", 'portfolio', request.portfolio)
+        response = await self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
+        return self.client.decoder.decode(GetOrderDetailsResponse, response.json())
+
+    async def list_open_orders(self, request: ListOpenOrdersRequest) -> ListOpenOrdersResponse:
+        path = "/orders"
+        query_params = append_pagination_params("", request.pagination)
+        query_params = append_query_param(query_params, 'portfolio', request.portfolio)
+        query_params = append_query_param(query_params, 'instrument', request.instrument)
+        query_params = append_query_param(query_params, 'instrument_type', request.instrument_type)
+        query_params = append_query_param(query_params, 'client_order_id', request.client_order_id)
+        query_params = append_query_param(query_params, 'event_type', request.event_type)
+        query_params = append_query_param(query_params, 'order_type', request.order_type)
+        query_params = append_query_param(query_params, 'side', request.side)
+        query_params = append_query_param(query_params, 'ref_datetime', request.ref_datetime)
+        response = await self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
+        return ListOpenOrdersResponse(orders=response.json())
+
+    async def modify_open_order(self, request: ModifyOpenOrderRequest) -> ModifyOpenOrderResponse:
+        if self.validator is not None:
+            self.validator.validate_modify(request)
+        path = f"/orders/{request.id}"
+        body = {k: v for k, v in asdict(request).items() if v is not None and k not in ['allowed_status_codes', 'id']}
+        response = await self.client.request("PUT", path, body=body, allowed_status_codes=request.allowed_status_codes)
+        order = self.client.decoder.decode(ModifyOpenOrderResponse, response.json())
+        if self.manager is not None:
+            self.manager.record(order)
+        return order
@@ -0,0 +1,55 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+from intx_sdk.enums import InstrumentType, OrderSide
+
+
+@dataclass
+class CancelAllOrdersRequest:
+    portfolios: Optional[List[str]] = None
+    instrument: Optional[str] = None
+    side: Optional[OrderSide] = None
+    instrument_type: Optional[InstrumentType] = None
+    max_workers: Optional[int] = None
+    max_rounds: int = 3
+
+
+@dataclass
+class PortfolioCancelResult:
+    portfolio: str
+    orders: Any = None
+    error: Optional[Exception] = None
+    attempts: int = 0
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class CancelAllOrdersResponse:
+    results: List[PortfolioCancelResult] = field(default_factory=list)
+    elapsed: float = 0.0
+    list_portfolios_latency: float = 0.0
+
+    @property
+    def failed(self) -> List[PortfolioCancelResult]:
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def cancelled_count(self) -> int:
+        return sum(len(r.orders) for r in self.results if r.ok and isinstance(r.orders, list))
@@ -0,0 +1,131 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import re
+import socket
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional
+
+SEQUENCE_BITS = 16
+STRATEGY_PATTERN = re.compile(r"^[A-Za-z0-9_]{0,32}$")
+CLIENT_ORDER_ID_PATTERN = re.compile(r"^([A-Za-z0-9_]*)-([0-9a-f]{8})-([0-9a-f]{16})$")
+
+
+def process_prefix() -> str:
+    """8 hex characters identifying this host and process, with a random part for hosts that share names and pids"""
+    seed = f"{socket.gethostname()}:{os.getpid()}:".encode() + os.urandom(8)
+    return hashlib.blake2b(seed, digest_size=4).hexdigest()
+
+
+@dataclass(frozen=True)
+class ClientOrderId:
+    strategy: str
+    prefix: str
+    timestamp_ms: int
+    sequence: int
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp_ms / 1000, tz=timezone.utc)
+
+
+def parse_client_order_id(client_order_id: str) -> Optional[ClientOrderId]:
+    """Decode an id made by ClientOrderIdGenerator; None for ids in any other format"""
+    match = CLIENT_ORDER_ID_PATTERN.match(client_order_id or "")
+    if match is None:
+        return None
+    strategy, prefix, value = match.groups()
+    value = int(value, 16)
+    return ClientOrderId(strategy, prefix, value >> SEQUENCE_BITS, value & ((1 << SEQUENCE_BITS) - 1))
+
+
+def strategy_of(client_order_id: Optional[str]) -> Optional[str]:
+    """The strategy tag of a generated id, or None if the id was not made by ClientOrderIdGenerator"""
+    if client_order_id and len(client_order_id) >= 26 and client_order_id[-17] == "-" \
+            and client_order_id[-26] == "-":
+        return client_order_id[:-26]
+    return None
+
+
+class ClientOrderIdGenerator:
+    """Makes unique, increasing client_order_ids of the form `<strategy>-<prefix>-<value>`.
+
+    `prefix` is 8 hex characters identifying the process: derived from the host name, the pid and a
+    random part unless given (a given prefix must not be shared by two live processes), and
+    re-derived after a fork. `value` is 16 hex characters holding the millisecond timestamp and a
+    16-bit sequence number within that millisecond. Values never repeat or decrease within a
+    generator, even if the wall clock steps back or more than 65536 ids are made in one millisecond
+    (the timestamp then runs slightly ahead of the clock), so ids sort in creation order.
+
+    The strategy tag defaults to `strategy` and can be given per call; parse_client_order_id decodes
+    an id and strategy_of extracts just the tag, which OrderManager uses to index orders by strategy.
+    """
+
+    def __init__(self, strategy: str = "", prefix: Optional[str] = None,
+                 clock: Callable[[], int] = time.time_ns):
+        if prefix is not None and not re.match(r"^[0-9a-f]{8}$", prefix):
+            raise ValueError("prefix must be 8 lowercase hex characters")
+        self.strategy = strategy
+        self.fixed_prefix = prefix
+        self.prefix = prefix or process_prefix()
+        self.clock = clock
+        self.heads: Dict[str, str] = {}
+        self.last = 0
+        self.lock = threading.Lock()
+        self.head(strategy)
+        if prefix is None:
+            _derived_prefix_generators.add(self)
+
+    def __call__(self, strategy: Optional[str] = None) -> str:
+        return self.next_id(strategy)
+
+    def head(self, strategy: str) -> str:
+        head = self.heads.get(strategy)
+        if head is None:
+            if not STRATEGY_PATTERN.match(strategy):
+                raise ValueError("strategy must be at most 32 letters, digits or underscores")
+            head = self.heads[strategy] = f"{strategy}-{self.prefix}-"
+        return head
+
+    def next_id(self, strategy: Optional[str] = None) -> str:
+        head = self.head(self.strategy if strategy is None else strategy)
+        now = self.clock() // 1_000_000 << SEQUENCE_BITS
+        with self.lock:
+            value = now if now > self.last else self.last + 1
+            self.last = value
+        return f"{head}{value:016x}"
+
+    def reset_prefix(self) -> None:
+        self.prefix = process_prefix()
+        self.heads = {}
+        self.lock = threading.Lock()
+
+
+# A forked child would otherwise repeat its parent's ids
+_derived_prefix_generators: "weakref.WeakSet[ClientOrderIdGenerator]" = weakref.WeakSet()
+
+
+def _reset_after_fork() -> None:
+    for generator in list(_derived_prefix_generators):
+        generator.reset_prefix()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
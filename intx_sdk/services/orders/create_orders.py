@@ -0,0 +1,49 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+from .create_order import CreateOrderRequest, CreateOrderResponse
+
+
+@dataclass
+class CreateOrdersRequest:
+    orders: List[CreateOrderRequest]
+    max_workers: Optional[int] = None
+
+
+@dataclass
+class CreateOrderResult:
+    request: CreateOrderRequest
+    order: Optional[CreateOrderResponse] = None
+    error: Optional[Exception] = None
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class CreateOrdersResponse:
+    results: List[CreateOrderResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def orders(self) -> List[CreateOrderResponse]:
+        return [r.order for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> List[CreateOrderResult]:
+        return [r for r in self.results if not r.ok]
@@ -0,0 +1,249 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from intx_sdk.pagination import OffsetPageIterator
+from intx_sdk.services.model import Order
+from intx_sdk.utils import PaginationParams
+from .cancel_orders import CancelOrdersRequest
+from .client_order_id import strategy_of
+from .list_open_orders import ListOpenOrdersRequest
+
+DONE_STATUS = "DONE"
+
+# Compared field by field, since a create response and a listed order are different classes
+order_state = attrgetter(*(f.name for f in fields(Order)))
+
+
+def enum_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def open_orders_page(orders: Any) -> Tuple[List[Any], Optional[str], Optional[int]]:
+    """Items, ref_datetime and result_limit of a list_open_orders page, a bare list or a paginated result"""
+    if isinstance(orders, dict):
+        pagination = orders.get("pagination") or {}
+        return orders.get("results") or [], pagination.get("ref_datetime"), pagination.get("result_limit")
+    return orders or [], None, None
+
+
+@dataclass
+class OrderDiff:
+    """What a reconcile changed: orders the exchange has that were not tracked, tracked orders it no
+    longer lists as open, and tracked orders whose state differed"""
+    added: List[Order] = field(default_factory=list)
+    removed: List[Order] = field(default_factory=list)
+    changed: List[Order] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+class OrderManager:
+    """Local view of working orders, kept current by the OrdersService calls that change them.
+
+    Attach it with `client.orders.manager = OrderManager(client.orders)`: create_order,
+    modify_open_order, cancel_order and cancel_orders then record their results, and orders whose
+    status is DONE are dropped. Lookups by order_id or client_order_id are dict lookups, and orders
+    are also indexed by instrument symbol, by side, and by strategy tag for client_order_ids made
+    by ClientOrderIdGenerator. reconcile() lists the open orders on the
+    exchange (optionally for one portfolio), replaces the local view with them and returns the
+    difference; an order recorded while that listing was in flight is left as recorded, since the
+    listing may predate it. start(interval) reconciles periodically on a background thread.
+
+    With AsyncOrdersService, fetch the open orders yourself and pass them to apply_snapshot.
+    """
+
+    def __init__(self, service=None, portfolio: Optional[str] = None, page_size: int = 100):
+        self.service = service
+        self.portfolio = portfolio
+        self.page_size = page_size
+        self.orders: Dict[str, Order] = {}
+        self.by_client_order_id: Dict[str, str] = {}
+        self.by_instrument: Dict[str, Dict[str, Order]] = {}
+        self.by_side: Dict[Any, Dict[str, Order]] = {}
+        self.by_strategy: Dict[str, Dict[str, Order]] = {}
+        self.updated: Dict[str, int] = {}
+        self.sequence = 0
+        self.last_diff: Optional[OrderDiff] = None
+        self.last_error: Optional[Exception] = None
+        self.lock = threading.RLock()
+        self.stopped = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def get(self, order_id: Any) -> Optional[Order]:
+        return self.orders.get(str(order_id))
+
+    def get_by_client_order_id(self, client_order_id: str) -> Optional[Order]:
+        order_id = self.by_client_order_id.get(client_order_id)
+        return self.orders.get(order_id) if order_id is not None else None
+
+    def for_instrument(self, symbol: str) -> List[Order]:
+        return list(self.by_instrument.get(symbol, {}).values())
+
+    def for_side(self, side: Any) -> List[Order]:
+        return list(self.by_side.get(enum_value(side), {}).values())
+
+    def for_strategy(self, strategy: str) -> List[Order]:
+        return list(self.by_strategy.get(strategy, {}).values())
+
+    def open_orders(self) -> List[Order]:
+        return list(self.orders.values())
+
+    def record(self, order: Order) -> None:
+        """Track a created or modified order, or forget it if its status is DONE"""
+        if order is None or getattr(order, "order_id", None) is None:
+            return
+        with self.lock:
+            self.sequence += 1
+            self.updated[str(order.order_id)] = self.sequence
+            if enum_value(order.order_status) == DONE_STATUS:
+                self._remove(str(order.order_id))
+            else:
+                self._add(order)
+
+    def forget(self, order_id: Any) -> Optional[Order]:
+        """Stop tracking an order, given its order_id or client_order_id"""
+        with self.lock:
+            order_id = str(order_id)
+            if order_id not in self.orders:
+                order_id = self.by_client_order_id.get(order_id, order_id)
+            self.sequence += 1
+            self.updated[order_id] = self.sequence
+            return self._remove(order_id)
+
+    def record_cancel_orders(self, request: CancelOrdersRequest, cancelled: Any) -> None:
+        """Drop the orders a cancel_orders call cancelled; without an order list in the response,
+        drop the tracked orders matching the request's instrument and side"""
+        items = open_orders_page(cancelled)[0]
+        order_ids = [str(o.get("order_id") if isinstance(o, dict) else o.order_id) for o in items]
+        with self.lock:
+            if not order_ids:
+                side = enum_value(request.side)
+                order_ids = [order_id for order_id, order in self.orders.items()
+                             if request.portfolio in (str(order.portfolio_id), order.portfolio_uuid)
+                             and (request.instrument is None or request.instrument == order.symbol)
+                             and (side is None or side == enum_value(order.side))]
+            for order_id in order_ids:
+                self.forget(order_id)
+
+    def reconcile(self, portfolio: Optional[str] = None) -> OrderDiff:
+        """List the open orders on the exchange and make the local view match them"""
+        started = self.sequence
+        portfolio = portfolio or self.portfolio
+
+        def fetch_page(offset: int, ref_datetime: Optional[str]):
+            response = self.service.list_open_orders(ListOpenOrdersRequest(
+                portfolio=portfolio, ref_datetime=ref_datetime,
+                pagination=PaginationParams(result_limit=str(self.page_size), result_offset=str(offset))))
+            return open_orders_page(response.orders)
+
+        snapshot = list(OffsetPageIterator(fetch_page, self.page_size))
+        return self.apply_snapshot(snapshot, since=started, portfolio=portfolio)
+
+    def apply_snapshot(self, orders: Iterable[Any], since: Optional[int] = None,
+                       portfolio: Optional[str] = None) -> OrderDiff:
+        """Replace the local view with `orders`, the exchange's open orders, and return the difference.
+
+        `since` is the value of `sequence` when the listing started; orders recorded after that are
+        kept as recorded. With `portfolio`, only tracked orders of that portfolio can be removed.
+        """
+        decoder = self.service.client.decoder if self.service is not None else None
+        diff = OrderDiff()
+        with self.lock:
+            seen = set()
+            for order in orders:
+                if isinstance(order, dict):
+                    order = decoder.decode(Order, order) if decoder else Order(**order)
+                order_id = str(order.order_id)
+                seen.add(order_id)
+                if since is not None and self.updated.get(order_id, 0) > since:
+                    continue
+                current = self.orders.get(order_id)
+                if current is None:
+                    diff.added.append(order)
+                elif order_state(current) != order_state(order):
+                    diff.changed.append(order)
+                else:
+                    continue
+                self._add(order)
+            for order_id, order in list(self.orders.items()):
+                if order_id in seen or (since is not None and self.updated.get(order_id, 0) > since):
+                    continue
+                if portfolio is not None and portfolio not in (str(order.portfolio_id), order.portfolio_uuid):
+                    continue
+                diff.removed.append(self._remove(order_id))
+            # Sequence numbers only matter while a listing is in flight
+            self.updated = {k: v for k, v in self.updated.items() if since is not None and v > since}
+            self.last_diff = diff
+        return diff
+
+    def start(self, interval: float) -> None:
+        """Reconcile every `interval` seconds on a daemon thread until stop() is called"""
+        if self.thread and self.thread.is_alive():
+            return
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, args=(interval,), daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stopped.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def run(self, interval: float) -> None:
+        while not self.stopped.wait(interval):
+            try:
+                self.reconcile()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = e
+
+    def _add(self, order: Order) -> None:
+        order_id = str(order.order_id)
+        previous = self.orders.get(order_id)
+        if previous is not None:
+            self._unindex(order_id, previous)
+        self.orders[order_id] = order
+        if order.client_order_id:
+            self.by_client_order_id[order.client_order_id] = order_id
+        self.by_instrument.setdefault(order.symbol, {})[order_id] = order
+        self.by_side.setdefault(enum_value(order.side), {})[order_id] = order
+        strategy = strategy_of(order.client_order_id)
+        if strategy is not None:
+            self.by_strategy.setdefault(strategy, {})[order_id] = order
+
+    def _remove(self, order_id: str) -> Optional[Order]:
+        order = self.orders.pop(order_id, None)
+        if order is not None:
+            self._unindex(order_id, order)
+        return order
+
+    def _unindex(self, order_id: str, order: Order) -> None:
+        if self.by_client_order_id.get(order.client_order_id) == order_id:
+            del self.by_client_order_id[order.client_order_id]
+        for index, key in ((self.by_instrument, order.symbol), (self.by_side, enum_value(order.side)),
+                           (self.by_strategy, strategy_of(order.client_order_id))):
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(order_id, None)
+                if not bucket:
+                    del index[key]
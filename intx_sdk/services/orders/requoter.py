@@ -0,0 +1,205 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional, Tuple
+from .modify_open_order import ModifyOpenOrderRequest, ModifyOpenOrderResponse
+
+WARM_PATH = "/portfolios"
+
+
+@dataclass
+class RequoteResult:
+    """Outcome of one quote update. Times are in seconds; `queued` is the wait before it was sent"""
+    request: ModifyOpenOrderRequest
+    order: Optional[ModifyOpenOrderResponse] = None
+    error: Optional[Exception] = None
+    superseded: bool = False
+    queued: float = 0.0
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.superseded
+
+
+@dataclass
+class RequoteStats:
+    sent: int = 0
+    failed: int = 0
+    superseded: int = 0
+    in_flight: int = 0
+    mean: float = 0.0
+    p50: float = 0.0
+    p99: float = 0.0
+    max: float = 0.0
+
+
+def percentile(ordered: list, fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+class Requoter:
+    """Sends quote updates (modify_open_order) for many orders at once, keeping only the latest per order.
+
+    update() returns a Future for a RequoteResult immediately. Updates for different orders are sent
+    concurrently on up to `max_workers` threads, by default as many as the connection pool holds. At
+    most one update per order is on the wire: an update for an order with one in flight waits, and a
+    newer update for the same order replaces the waiting one, whose future resolves with
+    superseded=True without a request. So a burst of price changes sends at most two modifications.
+
+    warm() opens `max_workers` pooled connections with lightweight GETs so the first updates skip the
+    TCP and TLS handshakes; start(interval) repeats that whenever no request has been sent for
+    `interval` seconds, which should be shorter than the transport's max_idle_time when one is set.
+    Warm-up requests count against the client's rate limiter. stats() summarises the latency of the
+    last `window` updates sent.
+    """
+
+    def __init__(self, service: Any, max_workers: Optional[int] = None, window: int = 1000):
+        self.service = service
+        self.max_workers = max_workers or service.client.transport.pool_maxsize
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="requoter")
+        self.lock = threading.Lock()
+        self.in_flight: Dict[str, Future] = {}
+        self.waiting: Dict[str, Tuple[ModifyOpenOrderRequest, Future, float]] = {}
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.sent = 0
+        self.failed = 0
+        self.superseded = 0
+        self.last_sent = time.monotonic()
+        self.stopped = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.last_error: Optional[Exception] = None
+
+    def update(self, request: ModifyOpenOrderRequest) -> Future:
+        future: Future = Future()
+        now = time.perf_counter()
+        with self.lock:
+            if request.id not in self.in_flight:
+                self.in_flight[request.id] = future
+                self.executor.submit(self._send, request, future, now)
+                return future
+            replaced = self.waiting.get(request.id)
+            self.waiting[request.id] = (request, future, now)
+            if replaced is not None:
+                self.superseded += 1
+        if replaced is not None:
+            replaced[1].set_result(RequoteResult(request=replaced[0], superseded=True))
+        return future
+
+    def _send(self, request: ModifyOpenOrderRequest, future: Future, submitted: float) -> None:
+        while True:
+            started = time.perf_counter()
+            self.last_sent = time.monotonic()
+            try:
+                result = RequoteResult(request=request, order=self.service.modify_open_order(request))
+            except Exception as e:
+                result = RequoteResult(request=request, error=e)
+            result.queued = started - submitted
+            result.latency = time.perf_counter() - started
+            with self.lock:
+                self.sent += 1
+                self.failed += result.error is not None
+                self.latencies.append(result.latency)
+                # Send the newest waiting update for this order, if any, on the same thread
+                request, next_future, submitted = self.waiting.pop(request.id, (None, None, None))
+                if request is None:
+                    del self.in_flight[result.request.id]
+                else:
+                    self.in_flight[request.id] = next_future
+            future.set_result(result)
+            if request is None:
+                return
+            future = next_future
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait until every update submitted so far has been sent or superseded"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self.lock:
+                pending = list(self.in_flight.values()) + [f for _, f, _ in self.waiting.values()]
+            if not pending:
+                return
+            for future in pending:
+                future.result(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+    def stats(self) -> RequoteStats:
+        with self.lock:
+            ordered = sorted(self.latencies)
+            stats = RequoteStats(sent=self.sent, failed=self.failed, superseded=self.superseded,
+                                 in_flight=len(self.in_flight))
+        if ordered:
+            stats.mean = sum(ordered) / len(ordered)
+            stats.p50 = percentile(ordered, 0.5)
+            stats.p99 = percentile(ordered, 0.99)
+            stats.max = ordered[-1]
+        return stats
+
+    def warm(self) -> None:
+        """Open up to max_workers pooled connections by sending that many GETs concurrently"""
+        self.last_sent = time.monotonic()
+        barrier = threading.Barrier(self.max_workers)
+
+        def ping() -> None:
+            # Hold every thread until all have started, so each GET needs its own connection
+            try:
+                barrier.wait(timeout=1)
+            except threading.BrokenBarrierError:
+                pass
+            self.service.client.request("GET", WARM_PATH)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for future in [executor.submit(ping) for _ in range(self.max_workers)]:
+                future.result()
+
+    def start(self, interval: float) -> None:
+        """Warm the pool now, then again whenever no request has been sent for `interval` seconds"""
+        if self.thread and self.thread.is_alive():
+            return
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, args=(interval,), daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stopped.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def close(self) -> None:
+        self.stop()
+        self.executor.shutdown(wait=True)
+
+    def run(self, interval: float) -> None:
+        wait = 0.0
+        while not self.stopped.wait(wait):
+            idle = time.monotonic() - self.last_sent
+            if wait and idle < interval:
+                wait = interval - idle
+                continue
+            try:
+                self.warm()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = e
+            wait = interval
+
+    def __enter__(self) -> "Requoter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
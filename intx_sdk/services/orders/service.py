@@ -12,26 +12,43 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
+from typing import Optional
 from intx_sdk.client import Client
+from intx_sdk.services.portfolios.list_portfolios import ListPortfoliosRequest
+from intx_sdk.services.portfolios.service import PortfoliosService
 from intx_sdk.utils import append_pagination_params, append_query_param
+from .cancel_all_orders import CancelAllOrdersRequest, CancelAllOrdersResponse, PortfolioCancelResult
 from .cancel_order import CancelOrderRequest, CancelOrderResponse
 from .cancel_orders import CancelOrdersRequest, CancelOrdersResponse
 from .create_order import CreateOrderRequest, CreateOrderResponse
+from .create_orders import CreateOrdersRequest, CreateOrdersResponse, CreateOrderResult
 from .get_order_details import GetOrderDetailsRequest, GetOrderDetailsResponse
 from .list_open_orders import ListOpenOrdersRequest, ListOpenOrdersResponse
+from .manager import OrderManager
 from .modify_open_order import ModifyOpenOrderRequest, ModifyOpenOrderResponse
+from .validation import OrderValidator
 
 
 class OrdersService:
-    def __init__(self, client: Client):
+    def __init__(self, client: Client, validator: Optional[OrderValidator] = None,
+                 manager: Optional[OrderManager] = None):
         self.client = client
+        # When set, create_order and modify_open_order raise PreTradeValidationError before sending
+        self.validator = validator
+        # When set, records the orders created, modified and cancelled through this service
+        self.manager = manager
 
     def cancel_order(self, request: CancelOrderRequest) -> CancelOrderResponse:
         path = f"/orders/{request.id}"
         query = f"portfolio={request.portfolio}"
         response = self.client.request("DELETE", path, query=query, allowed_status_codes=request.allowed_status_codes)
-        return CancelOrderResponse(**response.json())
+        order = self.client.decoder.decode(CancelOrderResponse, response.json())
+        if self.manager is not None:
+            self.manager.forget(getattr(order, "order_id", None) or request.id)
+        return order
 
     def cancel_orders(self, request: CancelOrdersRequest) -> CancelOrdersResponse:
         path = "/orders"
@@ -39,20 +56,100 @@ class OrdersService:
         query_params = append_query_param(query_params, 'instrument', request.instrument)
         query_params = append_query_param(query_params, 'side', request.side)
         query_params = append_query_param(query_params, 'instrument_type', request.instrument_type)
-        response = self.client.request("DELETE", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return CancelOrdersResponse(orders=response.json())
+        # Repeating a mass cancel has the same effect, so it is retried like a safe method
+        response = self.client.request("DELETE", path, query=query_params, allowed_status_codes=request.allowed_status_codes,
+                                       idempotent=True)
+        cancelled = CancelOrdersResponse(orders=response.json())
+        if self.manager is not None:
+            self.manager.record_cancel_orders(request, cancelled.orders)
+        return cancelled
+
+    def cancel_all_orders(self, request: CancelAllOrdersRequest) -> CancelAllOrdersResponse:
+        """Kill switch: cancel open orders in many portfolios at once and report per portfolio.
+
+        Runs cancel_orders for every portfolio in `portfolios`, or in list_portfolios when none are
+        given, on up to `max_workers` threads (by default as many as the connection pool holds),
+        narrowed by instrument, side and instrument type when set. Portfolios whose cancel failed
+        are retried together for up to `max_rounds` rounds, waiting out the retry policy's backoff
+        between rounds, on top of the client's own per-request retries. Every portfolio gets a
+        result, in order, with the last error if it never succeeded. Latencies and elapsed time are
+        in seconds.
+        """
+        started = time.perf_counter()
+        portfolios = request.portfolios
+        list_latency = 0.0
+        if portfolios is None:
+            portfolios = [p.portfolio_id for p in PortfoliosService(self.client).list_portfolios(
+                ListPortfoliosRequest()).portfolios]
+            list_latency = time.perf_counter() - started
+        results = [PortfolioCancelResult(portfolio=portfolio) for portfolio in portfolios]
+        if results:
+            max_workers = request.max_workers or min(len(results), self.client.transport.pool_maxsize)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = results
+                for attempt in range(1, request.max_rounds + 1):
+                    list(executor.map(lambda result: self._cancel_portfolio_orders(request, result), pending))
+                    pending = [result for result in pending if not result.ok]
+                    if not pending or attempt == request.max_rounds:
+                        break
+                    time.sleep(self.client.retry_policy.backoff(attempt))
+        return CancelAllOrdersResponse(results=results, elapsed=time.perf_counter() - started,
+                                       list_portfolios_latency=list_latency)
+
+    def _cancel_portfolio_orders(self, request: CancelAllOrdersRequest, result: PortfolioCancelResult) -> None:
+        started = time.perf_counter()
+        result.attempts += 1
+        try:
+            result.orders = self.cancel_orders(CancelOrdersRequest(
+                portfolio=result.portfolio, instrument=request.instrument, side=request.side,
+                instrument_type=request.instrument_type)).orders
+            result.error = None
+        except Exception as e:
+            result.error = e
+        result.latency = time.perf_counter() - started
 
     def create_order(self, request: CreateOrderRequest) -> CreateOrderResponse:
+        if self.validator is not None:
+            self.validator.validate_create(request)
         path = "/orders"
         body = {k: v for k, v in asdict(request).items() if v is not None and k != 'allowed_status_codes'}
-        response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes)
-        return CreateOrderResponse(**response.json())
+        # A client_order_id lets the exchange reject duplicates, so the order is safe to re-send
+        response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes,
+                                       idempotent=bool(request.client_order_id))
+        order = self.client.decoder.decode(CreateOrderResponse, response.json())
+        if self.manager is not None:
+            self.manager.record(order)
+        return order
+
+    def create_orders(self, request: CreateOrdersRequest) -> CreateOrdersResponse:
+        """Submit several orders concurrently and return one result per order, in input order.
+
+        Orders are sent from up to `max_workers` threads, by default as many as the connection pool
+        holds so every call reuses a pooled connection; the client's rate limiter applies to each
+        call. A failed order does not stop the others: its result carries the exception instead.
+        Latencies and the total elapsed time are in seconds.
+        """
+        started = time.perf_counter()
+        if not request.orders:
+            return CreateOrdersResponse()
+        max_workers = request.max_workers or min(len(request.orders), self.client.transport.pool_maxsize)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self._create_order_result, request.orders))
+        return CreateOrdersResponse(results=results, elapsed=time.perf_counter() - started)
+
+    def _create_order_result(self, request: CreateOrderRequest) -> CreateOrderResult:
+        started = time.perf_counter()
+        try:
+            order, error = self.create_order(request), None
+        except Exception as e:
+            order, error = None, e
+        return CreateOrderResult(request=request, order=order, error=error, latency=time.perf_counter() - started)
 
     def get_order_details(self, request: GetOrderDetailsRequest) -> GetOrderDetailsResponse:
         path = f"/orders/{request.order_id}"
         query_params = append_query_param("", 'portfolio', request.portfolio)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return GetOrderDetailsResponse(**response.json())
+        return self.client.decoder.decode(GetOrderDetailsResponse, response.json())
 
     def list_open_orders(self, request: ListOpenOrdersRequest) -> ListOpenOrdersResponse:
         path = "/orders"
@@ -69,7 +166,12 @@ class OrdersService:
         return ListOpenOrdersResponse(orders=response.json())
 
     def modify_open_order(self, request: ModifyOpenOrderRequest) -> ModifyOpenOrderResponse:
+        if self.validator is not None:
+            self.validator.validate_modify(request)
         path = f"/orders/{request.id}"
         body = {k: v for k, v in asdict(request).items() if v is not None and k not in ['allowed_status_codes', 'id']}
         response = self.client.request("PUT", path, body=body, allowed_status_codes=request.allowed_status_codes)
-        return ModifyOpenOrderResponse(**response.json())
+        order = self.client.decoder.decode(ModifyOpenOrderResponse, response.json())
+        if self.manager is not None:
+            self.manager.record(order)
+        return order
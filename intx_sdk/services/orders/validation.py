@@ -0,0 +1,178 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Optional, Tuple
+from intx_sdk.enums import OrderType, TradingState
+from intx_sdk.errors import PreTradeValidationError
+from intx_sdk.services.model import InstrumentDetails
+from .create_order import CreateOrderRequest
+from .modify_open_order import ModifyOpenOrderRequest
+
+# Trading states in which the exchange does not accept new or modified orders
+BLOCKED_TRADING_STATES = frozenset(state.value for state in (
+    TradingState.PAUSED, TradingState.HALT, TradingState.DELISTED, TradingState.CANCEL_ONLY,
+    TradingState.TRADING_DISABLED, TradingState.CANCEL_ONLY_ENFORCED_BY_COINBASE_INTERNATIONAL_EXCHANGE,
+    TradingState.COINBASE_EXCHANGE_UNREACHABLE))
+
+
+def to_decimal(value: Any) -> Optional[Decimal]:
+    """Decimal from an API or request value (str, float, int or Decimal); None or unparseable gives None"""
+    if value is None or value.__class__ is Decimal:
+        return value
+    try:
+        return Decimal(value if value.__class__ is str else repr(value))
+    except (InvalidOperation, ValueError, TypeError):
+        return None
+
+
+@dataclass(frozen=True)
+class InstrumentRules:
+    """The order constraints of one instrument, parsed once into Decimals"""
+    symbol: str
+    trading_state: Optional[str]
+    quote_increment: Optional[Decimal]
+    base_increment: Optional[Decimal]
+    min_quantity: Optional[Decimal]
+    min_notional_value: Optional[Decimal]
+    price_band: Optional[Decimal]
+    mark_price: Optional[Decimal]
+
+    @classmethod
+    def from_instrument(cls, instrument: InstrumentDetails) -> "InstrumentRules":
+        quote = instrument.quote if isinstance(instrument.quote, dict) else {}
+        trading_state = getattr(instrument.trading_state, "value", instrument.trading_state)
+        return cls(
+            symbol=instrument.symbol,
+            trading_state=trading_state,
+            quote_increment=to_decimal(instrument.quote_increment) or None,
+            base_increment=to_decimal(instrument.base_increment) or None,
+            min_quantity=to_decimal(instrument.min_quantity),
+            min_notional_value=to_decimal(instrument.min_notional_value),
+            # The API reports the band as a fraction of the mark price, e.g. 0.05 for 5%
+            price_band=to_decimal(instrument.price_band_percent) or None,
+            mark_price=to_decimal(quote.get("mark_price")) or None,
+        )
+
+
+class OrderValidator:
+    """Checks orders against cached instrument rules before they are sent.
+
+    `instruments` is anything with a get(symbol) returning InstrumentDetails, normally an
+    InstrumentRegistry. Prices and stop prices must be multiples of quote_increment and sizes of
+    base_increment; sizes must reach min_quantity and price * size min_notional_value; limit prices
+    must be within price_band_percent of the reference price; and the instrument's trading_state
+    must accept the order: in LIMIT_ONLY only limit orders, and in POST_ONLY only post-only limit
+    orders. The reference price is the mark price cached with the instrument unless
+    `reference_price(symbol)` is given. A failing check raises PreTradeValidationError without a
+    round trip. Rules are parsed once per instrument and reparsed when the registry refreshes.
+
+    Modify requests do not name the instrument, so the validator remembers the instrument of each
+    client_order_id it validated on create; modifies of orders it has not seen are not checked
+    unless the instrument is passed explicitly.
+    """
+
+    def __init__(self, instruments, reference_price: Optional[Callable[[str], Any]] = None,
+                 max_tracked_orders: int = 100_000):
+        self.instruments = instruments
+        self.reference_price = reference_price
+        self.max_tracked_orders = max_tracked_orders
+        self.rules: Dict[str, Tuple[InstrumentDetails, InstrumentRules]] = {}
+        self.order_instruments: Dict[str, str] = {}
+        # create_orders validates from worker threads; eviction must not race on the oldest key
+        self.lock = threading.Lock()
+
+    def rules_for(self, instrument: str) -> InstrumentRules:
+        details = self.instruments.get(instrument)
+        cached = self.rules.get(instrument)
+        if cached is None or cached[0] is not details:
+            cached = (details, InstrumentRules.from_instrument(details))
+            self.rules[instrument] = cached
+        return cached[1]
+
+    def validate_create(self, request: CreateOrderRequest) -> None:
+        rules = self.rules_for(request.instrument)
+        price = self.parse(rules, "price", request.price)
+        size = self.parse(rules, "size", request.size)
+        self.check(rules, price, size, stop_prices=(request.stop_price, request.stop_limit_price))
+        self.check_order_type(rules, request)
+        if request.client_order_id:
+            with self.lock:
+                if request.client_order_id not in self.order_instruments \
+                        and len(self.order_instruments) >= self.max_tracked_orders:
+                    del self.order_instruments[next(iter(self.order_instruments))]
+                self.order_instruments[request.client_order_id] = request.instrument
+
+    def validate_modify(self, request: ModifyOpenOrderRequest, instrument: Optional[str] = None) -> None:
+        if instrument is None:
+            with self.lock:
+                instrument = self.order_instruments.get(request.client_order_id)
+        if instrument is None:
+            return
+        rules = self.rules_for(instrument)
+        price = self.parse(rules, "price", request.price)
+        size = self.parse(rules, "size", request.size)
+        self.check(rules, price, size, stop_prices=(request.stop_price,))
+
+    def check(self, rules: InstrumentRules, price: Optional[Decimal], size: Optional[Decimal],
+              stop_prices: Tuple[Any, ...] = ()) -> None:
+        if rules.trading_state in BLOCKED_TRADING_STATES:
+            self.reject(rules, "TRADING_STATE", f"trading state is {rules.trading_state}")
+        if rules.quote_increment:
+            for name, value in (("price", price),) + tuple(("stop price", self.parse(rules, "stop price", p))
+                                                           for p in stop_prices if p is not None):
+                if value is not None and value % rules.quote_increment:
+                    self.reject(rules, "PRICE_INCREMENT",
+                                f"{name} {value} is not a multiple of quote_increment {rules.quote_increment}")
+        if size is not None:
+            if rules.base_increment and size % rules.base_increment:
+                self.reject(rules, "SIZE_INCREMENT",
+                            f"size {size} is not a multiple of base_increment {rules.base_increment}")
+            if rules.min_quantity is not None and size < rules.min_quantity:
+                self.reject(rules, "MIN_QUANTITY", f"size {size} is below min_quantity {rules.min_quantity}")
+        reference = to_decimal(self.reference_price(rules.symbol)) if self.reference_price else rules.mark_price
+        notional_price = price if price is not None else reference
+        if size is not None and notional_price is not None and rules.min_notional_value is not None \
+                and size * notional_price < rules.min_notional_value:
+            self.reject(rules, "MIN_NOTIONAL",
+                        f"notional {size * notional_price} is below min_notional_value {rules.min_notional_value}")
+        if price is not None and reference is not None and rules.price_band is not None \
+                and abs(price - reference) > reference * rules.price_band:
+            self.reject(rules, "PRICE_BAND",
+                        f"price {price} is more than {rules.price_band:%} away from the reference price {reference}")
+
+    def check_order_type(self, rules: InstrumentRules, request: CreateOrderRequest) -> None:
+        # Modifies keep the resting order's type, so only creates are checked against these states
+        order_type = getattr(request.type, "value", request.type)
+        if rules.trading_state == TradingState.LIMIT_ONLY.value and order_type != OrderType.LIMIT.value:
+            self.reject(rules, "TRADING_STATE",
+                        f"trading state is {rules.trading_state}; {order_type} orders are rejected")
+        if rules.trading_state == TradingState.POST_ONLY.value and \
+                (order_type != OrderType.LIMIT.value or str(request.post_only).lower() != "true"):
+            self.reject(rules, "TRADING_STATE",
+                        f"trading state is {rules.trading_state}; only post-only limit orders are accepted")
+
+    def parse(self, rules: InstrumentRules, name: str, value: Any) -> Optional[Decimal]:
+        if value is None:
+            return None
+        number = to_decimal(value)
+        if number is None or not number.is_finite() or number <= 0:
+            self.reject(rules, "INVALID_NUMBER", f"{name} {value!r} is not a positive number")
+        return number
+
+    @staticmethod
+    def reject(rules: InstrumentRules, code: str, message: str) -> None:
+        raise PreTradeValidationError(f"{rules.symbol}: {message}", error_code=code)
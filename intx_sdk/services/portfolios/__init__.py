@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from .service import PortfoliosService
+from .async_service import AsyncPortfoliosService
 from .list_portfolios import ListPortfoliosRequest, ListPortfoliosResponse
 from .acquire_or_repay_loan import AcquireOrRepayLoanRequest, AcquireOrRepayLoanResponse
 from .create_portfolio import CreatePortfolioRequest, CreatePortfolioResponse
@@ -44,6 +45,7 @@ from .get_the_total_open_position_limit_for_portfolio import GetTheTotalOpenPosi
 
 __all__ = [
     "PortfoliosService",
+    "AsyncPortfoliosService",
     "ListPortfoliosRequest",
     "ListPortfoliosResponse",
     "AcquireOrRepayLoanRequest",
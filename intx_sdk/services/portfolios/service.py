@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from dataclasses import asdict
+from dataclasses import asdict, replace
+from typing import Optional
 from intx_sdk.client import Client
-from intx_sdk.utils import append_query_param, append_pagination_params
+from intx_sdk.utils import PaginationParams, append_query_param, append_pagination_params
+from intx_sdk.pagination import DEFAULT_PAGE_SIZE, PaginationCheckpoint, OffsetPageIterator
 from intx_sdk.services.model import (
     Portfolio,
     AssetLoan,
@@ -27,6 +29,7 @@ from intx_sdk.services.model import (
     PortfolioPosition,
     TotalOpenPositionLimit,
     PortfolioFeeRate,
+    PortfolioFill,
     PortfolioFillPaginationResult,
     PortfolioFillsResult,
     TransferResult,
@@ -71,41 +74,41 @@ class PortfoliosService:
         path = "/portfolios"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return ListPortfoliosResponse(portfolios=[Portfolio(**p) for p in data])
+        return ListPortfoliosResponse(portfolios=self.client.decoder.decode_list(Portfolio, data))
 
     def create_portfolio(self, request: CreatePortfolioRequest) -> CreatePortfolioResponse:
         path = "/portfolios"
         body = {"name": request.name}
         response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return CreatePortfolioResponse(portfolio=Portfolio(**data))
+        return CreatePortfolioResponse(portfolio=self.client.decoder.decode(Portfolio, data))
 
     def acquire_or_repay_loan(self, request: AcquireOrRepayLoanRequest) -> AcquireOrRepayLoanResponse:
         path = f"/portfolios/{request.portfolio}/loans/{request.asset}"
         body = {k: v for k, v in asdict(request).items() if v is not None and k != 'allowed_status_codes'}
         response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return AcquireOrRepayLoanResponse(loan=AssetLoan(**data))
+        return AcquireOrRepayLoanResponse(loan=self.client.decoder.decode(AssetLoan, data))
 
     def enable_disable_auto_margin(self, request: EnableDisableAutoMarginRequest) -> EnableDisableAutoMarginResponse:
         path = f"/portfolios/{request.portfolio}/auto-margin-enabled"
         body = {"enabled": request.enabled}
         response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return EnableDisableAutoMarginResponse(portfolio=Portfolio(**data))
+        return EnableDisableAutoMarginResponse(portfolio=self.client.decoder.decode(Portfolio, data))
 
     def enable_disable_cross_collateral(self, request: EnableDisableCrossCollateralRequest) -> EnableDisableCrossCollateralResponse:
         path = f"/portfolios/{request.portfolio}/cross-collateral-enabled"
         body = {"enabled": request.enabled}
         response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return EnableDisableCrossCollateralResponse(portfolio=Portfolio(**data))
+        return EnableDisableCrossCollateralResponse(portfolio=self.client.decoder.decode(Portfolio, data))
 
     def get_balance_for_portfolio_asset(self, request: GetBalanceForPortfolioAssetRequest) -> GetBalanceForPortfolioAssetResponse:
         path = f"/portfolios/{request.portfolio}/balances/{request.asset}"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return GetBalanceForPortfolioAssetResponse(balance=AssetBalance(**data))
+        return GetBalanceForPortfolioAssetResponse(balance=self.client.decoder.decode(AssetBalance, data))
 
     def get_fund_transfer_limit(self, request: GetFundTransferLimitRequest) -> GetFundTransferLimitResponse:
         path = f"/portfolios/transfer/{request.portfolio}/{request.asset}/transfer-limit"
@@ -117,31 +120,31 @@ class PortfoliosService:
         path = f"/portfolios/{request.portfolio}"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return GetPortfolioResponse(portfolio=Portfolio(**data))
+        return GetPortfolioResponse(portfolio=self.client.decoder.decode(Portfolio, data))
 
     def get_portfolio_details(self, request: GetPortfolioDetailsRequest) -> GetPortfolioDetailsResponse:
         path = f"/portfolios/{request.portfolio}/detail"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return GetPortfolioDetailsResponse(portfolio_detail=PortfolioDetail(**data))
+        return GetPortfolioDetailsResponse(portfolio_detail=self.client.decoder.decode(PortfolioDetail, data))
 
     def get_portfolio_summary(self, request: GetPortfolioSummaryRequest) -> GetPortfolioSummaryResponse:
         path = f"/portfolios/{request.portfolio}/summary"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return GetPortfolioSummaryResponse(portfolio_summary=PortfolioSummary(**data))
+        return GetPortfolioSummaryResponse(portfolio_summary=self.client.decoder.decode(PortfolioSummary, data))
 
     def get_position_for_portfolio_instrument(self, request: GetPositionForPortfolioInstrumentRequest) -> GetPositionForPortfolioInstrumentResponse:
         path = f"/portfolios/{request.portfolio}/positions/{request.instrument}"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return GetPositionForPortfolioInstrumentResponse(position=PortfolioPosition(**data))
+        return GetPositionForPortfolioInstrumentResponse(position=self.client.decoder.decode(PortfolioPosition, data))
 
     def list_portfolio_balances(self, request: ListPortfolioBalancesRequest) -> ListPortfolioBalancesResponse:
         path = f"/portfolios/{request.portfolio}/balances"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return ListPortfolioBalancesResponse(balances=[AssetBalance(**b) for b in data])
+        return ListPortfolioBalancesResponse(balances=self.client.decoder.decode_list(AssetBalance, data))
 
     def list_portfolio_fills(self, request: ListPortfolioFillsRequest) -> ListPortfolioFillsResponse:
         path = f"/portfolios/{request.portfolio}/fills"
@@ -153,13 +156,13 @@ class PortfoliosService:
         query_params = append_query_param(query_params, 'time_from', request.time_from)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return ListPortfolioFillsResponse(fills_result=PortfolioFillsResult(**data))
+        return ListPortfolioFillsResponse(fills_result=self.client.decoder.decode(PortfolioFillsResult, data))
 
     def list_portfolio_fee_rates(self, request: ListPortfolioFeeRatesRequest) -> ListPortfolioFeeRatesResponse:
         path = "/portfolios/fee-rates"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return ListPortfolioFeeRatesResponse(fee_rates=[PortfolioFeeRate(**f) for f in data])
+        return ListPortfolioFeeRatesResponse(fee_rates=self.client.decoder.decode_list(PortfolioFeeRate, data))
 
     def transfer_position(self, request: TransferPositionRequest) -> TransferPositionResponse:
         path = "/portfolios/transfer-position"
@@ -172,7 +175,7 @@ class PortfoliosService:
         }
         response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return TransferPositionResponse(transfer_result=TransferResult(**data))
+        return TransferPositionResponse(transfer_result=self.client.decoder.decode(TransferResult, data))
 
     def transfer_funds(self, request: TransferFundsRequest) -> TransferFundsResponse:
         path = "/portfolios/transfer"
@@ -184,59 +187,59 @@ class PortfoliosService:
         }
         response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return TransferFundsResponse(transfer_result=TransferResult(**data))
+        return TransferFundsResponse(transfer_result=self.client.decoder.decode(TransferResult, data))
 
     def set_margin_override(self, request: SetMarginOverrideRequest) -> SetMarginOverrideResponse:
         path = "/portfolios/margin"
         body = {k: v for k, v in asdict(request).items() if v is not None and k != 'allowed_status_codes'}
         response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return SetMarginOverrideResponse(margin_override_result=MarginOverrideResult(**data))
+        return SetMarginOverrideResponse(margin_override_result=self.client.decoder.decode(MarginOverrideResult, data))
 
     def preview_loan_update(self, request: PreviewLoanUpdateRequest) -> PreviewLoanUpdateResponse:
         path = f"/portfolios/{request.portfolio}/loans/{request.asset}/preview"
         body = {k: v for k, v in asdict(request).items() if v is not None and k not in ['portfolio', 'asset', 'allowed_status_codes']}
         response = self.client.request("POST", path, body=body, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return PreviewLoanUpdateResponse(loan_preview=LoanPreview(**data))
+        return PreviewLoanUpdateResponse(loan_preview=self.client.decoder.decode(LoanPreview, data))
 
     def patch_portfolio(self, request: PatchPortfolioRequest) -> PatchPortfolioResponse:
         path = f"/portfolios/{request.portfolio}"
         body = {k: v for k, v in asdict(request).items() if v is not None and k not in ['portfolio', 'portfolio_name', 'allowed_status_codes']}
         response = self.client.request("PATCH", path, body=body, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return PatchPortfolioResponse(portfolio=Portfolio(**data))
+        return PatchPortfolioResponse(portfolio=self.client.decoder.decode(Portfolio, data))
 
     def list_portfolio_positions(self, request: ListPortfolioPositionsRequest) -> ListPortfolioPositionsResponse:
         path = f"/portfolios/{request.portfolio}/positions"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return ListPortfolioPositionsResponse(positions=[PortfolioPosition(**p) for p in data])
+        return ListPortfolioPositionsResponse(positions=self.client.decoder.decode_list(PortfolioPosition, data))
 
     def get_asset_loan_availability(self, request: GetAssetLoanAvailabilityRequest) -> GetAssetLoanAvailabilityResponse:
         path = f"/portfolios/{request.portfolio}/loans/{request.asset}/availability"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return GetAssetLoanAvailabilityResponse(loan_availability=LoanAvailability(**data))
+        return GetAssetLoanAvailabilityResponse(loan_availability=self.client.decoder.decode(LoanAvailability, data))
 
     def get_loan_info_for_portfolio_asset(self, request: GetLoanInfoForPortfolioAssetRequest) -> GetLoanInfoForPortfolioAssetResponse:
         path = f"/portfolios/{request.portfolio}/loans/{request.asset}"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return GetLoanInfoForPortfolioAssetResponse(portfolio_loan=PortfolioLoan(**data))
+        return GetLoanInfoForPortfolioAssetResponse(portfolio_loan=self.client.decoder.decode(PortfolioLoan, data))
 
     def update_portfolio(self, request: UpdatePortfolioRequest) -> UpdatePortfolioResponse:
         path = f"/portfolios/{request.portfolio}"
         body = {"name": request.name}
         response = self.client.request("PUT", path, body=body, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return UpdatePortfolioResponse(portfolio=Portfolio(**data))
+        return UpdatePortfolioResponse(portfolio=self.client.decoder.decode(Portfolio, data))
 
     def list_open_position_limits_for_all_instruments(self, request: ListOpenPositionLimitsForAllInstrumentsRequest) -> ListOpenPositionLimitsForAllInstrumentsResponse:
         path = f"/portfolios/{request.portfolio}/position-limits/positions"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return ListOpenPositionLimitsForAllInstrumentsResponse(position_limits=[OpenPositionLimit(**pl) for pl in data])
+        return ListOpenPositionLimitsForAllInstrumentsResponse(position_limits=self.client.decoder.decode_list(OpenPositionLimit, data))
 
     def list_fills_by_portfolios(self, request: ListFillsByPortfoliosRequest) -> ListFillsByPortfoliosResponse:
         path = "/portfolios/fills"
@@ -248,22 +251,44 @@ class PortfoliosService:
         query_params = append_query_param(query_params, 'time_from', request.time_from)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return ListFillsByPortfoliosResponse(fills_result=PortfolioFillsResult(**data))
+        return ListFillsByPortfoliosResponse(fills_result=self.client.decoder.decode(PortfolioFillsResult, data))
+
+    def iter_portfolio_fills(self, request: ListPortfolioFillsRequest, page_size: int = DEFAULT_PAGE_SIZE,
+                             prefetch: bool = False,
+                             checkpoint: Optional[PaginationCheckpoint] = None) -> OffsetPageIterator[PortfolioFill]:
+        def fetch_page(offset: int, ref_datetime: Optional[str]):
+            page_request = replace(request, ref_datetime=ref_datetime or request.ref_datetime,
+                                   pagination=PaginationParams(result_limit=str(page_size), result_offset=str(offset)))
+            result = self.list_portfolio_fills(page_request).fills_result
+            return result.results, result.pagination.ref_datetime, result.pagination.result_limit
+
+        return OffsetPageIterator(fetch_page, page_size, checkpoint, prefetch)
+
+    def iter_fills_by_portfolios(self, request: ListFillsByPortfoliosRequest, page_size: int = DEFAULT_PAGE_SIZE,
+                                 prefetch: bool = False,
+                                 checkpoint: Optional[PaginationCheckpoint] = None) -> OffsetPageIterator[PortfolioFill]:
+        def fetch_page(offset: int, ref_datetime: Optional[str]):
+            page_request = replace(request, ref_datetime=ref_datetime or request.ref_datetime,
+                                   pagination=PaginationParams(result_limit=str(page_size), result_offset=str(offset)))
+            result = self.list_fills_by_portfolios(page_request).fills_result
+            return result.results, result.pagination.ref_datetime, result.pagination.result_limit
+
+        return OffsetPageIterator(fetch_page, page_size, checkpoint, prefetch)
 
     def list_active_loans_for_portfolio(self, request: ListActiveLoansForPortfolioRequest) -> ListActiveLoansForPortfolioResponse:
         path = f"/portfolios/{request.portfolio}/loans"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return ListActiveLoansForPortfolioResponse(loans=[PortfolioLoan(**l) for l in data])
+        return ListActiveLoansForPortfolioResponse(loans=self.client.decoder.decode_list(PortfolioLoan, data))
 
     def get_open_position_limits_for_portfolio_instrument(self, request: GetOpenPositionLimitsForPortfolioInstrumentRequest) -> GetOpenPositionLimitsForPortfolioInstrumentResponse:
         path = f"/portfolios/{request.portfolio}/position-limits/positions/{request.instrument}"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return GetOpenPositionLimitsForPortfolioInstrumentResponse(open_position_limit=OpenPositionLimit(**data))
+        return GetOpenPositionLimitsForPortfolioInstrumentResponse(open_position_limit=self.client.decoder.decode(OpenPositionLimit, data))
 
     def get_the_total_open_position_limit_for_portfolio(self, request: GetTheTotalOpenPositionLimitForPortfolioRequest) -> GetTheTotalOpenPositionLimitForPortfolioResponse:
         path = f"/portfolios/{request.portfolio}/position-limits"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
         data = response.json()
-        return GetTheTotalOpenPositionLimitForPortfolioResponse(total_open_position_limit=TotalOpenPositionLimit(**data))
+        return GetTheTotalOpenPositionLimitForPortfolioResponse(total_open_position_limit=self.client.decoder.decode(TotalOpenPositionLimit, data))
@@ -13,10 +13,12 @@
 # limitations under the License.
 
 from .service import PositionOffsetsService
+from .async_service import AsyncPositionOffsetsService
 from .list_position_offsets import ListPositionOffsetsRequest, ListPositionOffsetsResponse
 
 __all__ = [
     "PositionOffsetsService",
+    "AsyncPositionOffsetsService",
     "ListPositionOffsetsRequest",
     "ListPositionOffsetsResponse",
 ]
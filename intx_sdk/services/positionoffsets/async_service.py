@@ -0,0 +1,26 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from intx_sdk.async_client import AsyncClient
+from .list_position_offsets import ListPositionOffsetsRequest, ListPositionOffsetsResponse
+
+
+class AsyncPositionOffsetsService:
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def list_position_offsets(self, request: ListPositionOffsetsRequest) -> ListPositionOffsetsResponse:
+        path = "/position-offsets"
+        response = await self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
+        return self.client.decoder.decode(ListPositionOffsetsResponse, response.json())
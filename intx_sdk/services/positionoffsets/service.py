@@ -23,4 +23,4 @@ class PositionOffsetsService:
     def list_position_offsets(self, request: ListPositionOffsetsRequest) -> ListPositionOffsetsResponse:
         path = "/position-offsets"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
-        return ListPositionOffsetsResponse(**response.json())
+        return self.client.decoder.decode(ListPositionOffsetsResponse, response.json())
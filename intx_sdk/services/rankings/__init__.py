@@ -13,10 +13,12 @@
 # limitations under the License.
 
 from .service import RankingsService
+from .async_service import AsyncRankingsService
 from .get_rankings import GetRankingsRequest, GetRankingsResponse
 
 __all__ = [
     "RankingsService",
+    "AsyncRankingsService",
     "GetRankingsRequest",
     "GetRankingsResponse",
 ]
@@ -14,6 +14,7 @@
 
 from intx_sdk.client import Client
 from intx_sdk.utils import append_query_param
+from intx_sdk.services.model import Rankings
 from .get_rankings import GetRankingsRequest, GetRankingsResponse
 
 
@@ -31,4 +32,4 @@ class RankingsService:
         if request.instruments:
             query_params = append_query_param(query_params, 'instruments', request.instruments)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return GetRankingsResponse(rankings=response.json())
+        return GetRankingsResponse(rankings=self.client.decoder.decode(Rankings, response.json()))
@@ -13,8 +13,10 @@
 # limitations under the License.
 
 from .service import TransfersService
+from .async_service import AsyncTransfersService
 from .create_counterparty_id import CreateCounterpartyIdRequest, CreateCounterpartyIdResponse
 from .create_crypto_address import CreateCryptoAddressRequest, CreateCryptoAddressResponse
+from .export_transfers import ExportTransfersRequest, ExportTransfersResponse
 from .get_transfer import GetTransferRequest, GetTransferResponse
 from .list_transfers import ListTransfersRequest, ListTransfersResponse
 from .validate_counterparty_id import ValidateCounterpartyIdRequest, ValidateCounterpartyIdResponse
@@ -23,10 +25,13 @@ from .withdraw_to_crypto_address import WithdrawToCryptoAddressRequest, Withdraw
 
 __all__ = [
     "TransfersService",
+    "AsyncTransfersService",
     "CreateCounterpartyIdRequest",
     "CreateCounterpartyIdResponse",
     "CreateCryptoAddressRequest",
     "CreateCryptoAddressResponse",
+    "ExportTransfersRequest",
+    "ExportTransfersResponse",
     "GetTransferRequest",
     "GetTransferResponse",
     "ListTransfersRequest",
@@ -0,0 +1,73 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Optional, Tuple
+from intx_sdk.enums import TransferType, TransferStatus
+
+DEFAULT_EXPORT_WINDOW = timedelta(days=7)
+
+
+@dataclass
+class ExportTransfersRequest:
+    time_from: str
+    time_to: str
+    portfolios: Optional[str] = None
+    status: Optional[TransferStatus] = None
+    type: Optional[TransferType] = None
+    window: timedelta = DEFAULT_EXPORT_WINDOW
+    max_workers: int = 4
+    requests_per_second: Optional[float] = None
+    page_size: int = 100
+    allowed_status_codes: Optional[List[int]] = None
+
+
+@dataclass
+class ExportTransfersResponse:
+    transfer_count: int = 0
+    duplicate_count: int = 0
+    window_count: int = 0
+
+
+def parse_time(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def created_at_key(created_at: Optional[str]) -> Tuple[Any, ...]:
+    """Sort key for a transfer timestamp; missing or unparseable values sort last, by their raw string"""
+    if created_at:
+        try:
+            return 0, parse_time(created_at)
+        except ValueError:
+            pass
+    return 1, created_at or ""
+
+
+def format_time(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def split_time_range(time_from: str, time_to: str, window: timedelta) -> List[Tuple[str, str]]:
+    """Split [time_from, time_to] into consecutive windows of at most `window`, oldest first"""
+    if window <= timedelta(0):
+        raise ValueError("window must be positive")
+    start, end = parse_time(time_from), parse_time(time_to)
+    windows = []
+    while start < end:
+        window_end = min(start + window, end)
+        windows.append((format_time(start), format_time(window_end)))
+        start = window_end
+    return windows
@@ -12,9 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
+from typing import Callable, List, Optional, Union
 from intx_sdk.client import Client
-from intx_sdk.utils import append_pagination_params, append_query_param
+from intx_sdk.pagination import OffsetPageIterator
+from intx_sdk.rate_limit import TokenBucket
+from intx_sdk.utils import PaginationParams, append_pagination_params, append_query_param
 from intx_sdk.services.model import (
     CounterpartyIdResult,
     CryptoAddressResult,
@@ -28,6 +33,7 @@ from intx_sdk.services.model import (
 )
 from .create_counterparty_id import CreateCounterpartyIdRequest, CreateCounterpartyIdResponse
 from .create_crypto_address import CreateCryptoAddressRequest, CreateCryptoAddressResponse
+from .export_transfers import ExportTransfersRequest, ExportTransfersResponse, created_at_key, split_time_range
 from .get_transfer import GetTransferRequest, GetTransferResponse
 from .list_transfers import ListTransfersRequest, ListTransfersResponse
 from .validate_counterparty_id import ValidateCounterpartyIdRequest, ValidateCounterpartyIdResponse
@@ -54,7 +60,7 @@ class TransfersService:
     def get_transfer(self, request: GetTransferRequest) -> GetTransferResponse:
         path = f"/transfers/{request.transfer_uuid}"
         response = self.client.request("GET", path, allowed_status_codes=request.allowed_status_codes)
-        return GetTransferResponse(transfer=response.json())
+        return GetTransferResponse(transfer=self.client.decoder.decode(Transfer, response.json()))
 
     def list_transfers(self, request: ListTransfersRequest) -> ListTransfersResponse:
         path = "/transfers"
@@ -65,7 +71,76 @@ class TransfersService:
         query_params = append_query_param(query_params, 'status', request.status)
         query_params = append_query_param(query_params, 'type', request.type)
         response = self.client.request("GET", path, query=query_params, allowed_status_codes=request.allowed_status_codes)
-        return ListTransfersResponse(transfers_result=response.json())
+        return ListTransfersResponse(transfers_result=self.client.decoder.decode(TransfersResult, response.json()))
+
+    def export_transfers(self, request: ExportTransfersRequest,
+                         sink: Union[Callable[[Transfer], None], str]) -> ExportTransfersResponse:
+        """Fetch every transfer between time_from and time_to and hand them to `sink` oldest first.
+
+        The range is split into `window`-sized slices that are paged through concurrently on up to
+        `max_workers` threads, optionally throttled to `requests_per_second` across all of them.
+        Windows are emitted in order as they complete, so at most a few windows are buffered at once.
+        A transfer returned by two adjacent windows is emitted only once. `sink` is either a callable
+        receiving each Transfer or a path that the transfers are written to as JSON lines.
+        """
+        budget = TokenBucket(request.requests_per_second) if request.requests_per_second else None
+
+        def fetch_window(time_from: str, time_to: str) -> List[Transfer]:
+            def fetch_page(offset: int, ref_datetime: Optional[str]):
+                if budget:
+                    budget.acquire()
+                page_request = ListTransfersRequest(
+                    portfolios=request.portfolios, time_from=time_from, time_to=time_to,
+                    status=request.status, type=request.type,
+                    pagination=PaginationParams(result_limit=str(request.page_size), result_offset=str(offset)),
+                    allowed_status_codes=request.allowed_status_codes)
+                result = self.list_transfers(page_request).transfers_result
+                return result.results, None, result.pagination.result_limit if result.pagination else None
+
+            transfers = list(OffsetPageIterator(fetch_page, request.page_size))
+            transfers.sort(key=lambda t: created_at_key(t.created_at))
+            return transfers
+
+        if callable(sink):
+            return self._export_transfers(request, fetch_window, sink)
+        with open(sink, "wb") as f:
+            def write_line(transfer: Transfer):
+                f.write(self.client.json_codec.dumps(asdict(transfer)) + b"\n")
+            return self._export_transfers(request, fetch_window, write_line)
+
+    def _export_transfers(self, request: ExportTransfersRequest,
+                          fetch_window: Callable[[str, str], List[Transfer]],
+                          emit: Callable[[Transfer], None]) -> ExportTransfersResponse:
+        windows = iter(split_time_range(request.time_from, request.time_to, request.window))
+        result = ExportTransfersResponse()
+        previous = set()
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=request.max_workers) as executor:
+            try:
+                for window in windows:
+                    pending.append(executor.submit(fetch_window, *window))
+                    if len(pending) >= request.max_workers * 2:
+                        break
+                while pending:
+                    transfers = pending.popleft().result()
+                    result.window_count += 1
+                    window = next(windows, None)
+                    if window:
+                        pending.append(executor.submit(fetch_window, *window))
+                    # Only the window just emitted can overlap this one, so earlier uuids are dropped
+                    current = set()
+                    for transfer in transfers:
+                        if transfer.transfer_uuid in previous or transfer.transfer_uuid in current:
+                            result.duplicate_count += 1
+                            continue
+                        current.add(transfer.transfer_uuid)
+                        emit(transfer)
+                        result.transfer_count += 1
+                    previous = current
+            finally:
+                for future in pending:
+                    future.cancel()
+        return result
 
     def validate_counterparty_id(self, request: ValidateCounterpartyIdRequest) -> ValidateCounterpartyIdResponse:
         path = "/transfers/validate-counterparty-id"
@@ -0,0 +1,75 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@dataclass
+class TransportConfig:
+    """Connection pool, timeout and keep-alive settings shared by Client and AsyncClient.
+
+    Timeouts are in seconds; None disables that timeout. max_idle_time drops pooled connections
+    that have not been used for that many seconds, before the server or a middlebox does.
+    """
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    connect_timeout: Optional[float] = 10.0
+    read_timeout: Optional[float] = 30.0
+    tcp_keepalive: bool = True
+    keepalive_idle: int = 60
+    keepalive_interval: int = 15
+    keepalive_count: int = 4
+    max_idle_time: Optional[float] = None
+
+    @property
+    def timeout(self) -> Tuple[Optional[float], Optional[float]]:
+        return self.connect_timeout, self.read_timeout
+
+    def socket_options(self) -> List[Tuple[int, int, int]]:
+        options = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+        if self.tcp_keepalive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            # The tuning knobs are platform specific; skip the ones this OS does not expose
+            for name, value in (("TCP_KEEPIDLE", self.keepalive_idle),
+                                ("TCP_KEEPINTVL", self.keepalive_interval),
+                                ("TCP_KEEPCNT", self.keepalive_count)):
+                if hasattr(socket, name):
+                    options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+        return options
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    def __init__(self, transport: TransportConfig):
+        self.transport = transport
+        super().__init__(
+            pool_connections=transport.pool_connections,
+            pool_maxsize=transport.pool_maxsize,
+            pool_block=transport.pool_block,
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs["socket_options"] = self.transport.socket_options()
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+
+def configure_session(session: requests.Session, transport: TransportConfig) -> requests.Session:
+    adapter = KeepAliveHTTPAdapter(transport)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 from dataclasses import asdict, dataclass
+from enum import Enum
 from typing import Dict, Optional, Union, List
 
 
@@ -25,12 +26,14 @@ class PaginationParams:
         return asdict(self)
 
 
-def append_query_param(query_params: str, key: str, value: Optional[Union[str, List[str]]]) -> str:
+def append_query_param(query_params: str, key: str, value: Optional[Union[str, Enum, List[str]]]) -> str:
     if value:
         if isinstance(value, list):
             for v in value:
                 query_params = f"{query_params}&{key}={v}" if query_params else f"{key}={v}"
         else:
+            if isinstance(value, Enum):
+                value = value.value
             query_params = f"{query_params}&{key}={value}" if query_params else f"{key}={value}"
     return query_params
 
@@ -21,6 +21,11 @@ setup(
     install_requires=[
         'requests',
     ],
+    extras_require={
+        'async': ['aiohttp'],
+        'fast': ['orjson'],
+        'candles': ['numpy'],
+    },
     entry_points={
         'console_scripts': [
             'intx-sdk=intx_sdk.__main__:main',
@@ -0,0 +1,111 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import base64
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+from intx_sdk import AsyncIntxServicesClient
+from intx_sdk.async_client import AsyncClient, AsyncResponse
+from intx_sdk.services.portfolios import ListPortfoliosRequest
+from intx_sdk.credentials import Credentials
+from tests.test_constants import BASE_URL
+
+SIGNING_KEY = base64.b64encode(b"test_signing_key").decode()
+
+
+class FakeHttpResponse:
+    def __init__(self, status, content):
+        self.status = status
+        self.headers = {}
+        self._content = content
+
+    async def read(self):
+        return self._content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.credentials = Credentials(
+            access_key="test_key",
+            passphrase="test_passphrase",
+            signing_key=SIGNING_KEY
+        )
+
+    @patch('intx_sdk.async_client.AsyncClient.request', new_callable=AsyncMock)
+    async def test_list_portfolios_success(self, mock_request):
+        mock_request.return_value = AsyncResponse(200, {}, b'[{"portfolio_id": "id_1", "portfolio_uuid": "uuid_1", '
+                                                            b'"name": "p1", "user_uuid": "u1", "maker_fee_rate": "0", '
+                                                            b'"taker_fee_rate": "0.0002", "trading_lock": false, '
+                                                            b'"withdrawal_lock": false, "borrow_disabled": false, '
+                                                            b'"is_lsp": false, "is_default": true, '
+                                                            b'"cross_collateral_enabled": false, '
+                                                            b'"auto_margin_enabled": false, '
+                                                            b'"pre_launch_trading_enabled": false, '
+                                                            b'"position_offsets_enabled": false}]')
+        client = AsyncIntxServicesClient(self.credentials, base_url=BASE_URL)
+
+        response = await client.portfolios.list_portfolios(ListPortfoliosRequest())
+
+        self.assertEqual(len(response.portfolios), 1)
+        self.assertEqual(response.portfolios[0].portfolio_id, "id_1")
+        self.assertTrue(response.portfolios[0].is_default)
+
+    async def test_request_signs_and_reads_body(self):
+        session = MagicMock()
+        session.closed = False
+        session.request.return_value = FakeHttpResponse(200, b'{"success": true}')
+        client = AsyncClient(self.credentials, http_client=session, base_url=BASE_URL)
+
+        response = await client.request("POST", "/portfolios/transfer", body={"amount": "1"})
+
+        self.assertEqual(response.json(), {"success": True})
+        method, url = session.request.call_args.args
+        headers = session.request.call_args.kwargs["headers"]
+        self.assertEqual((method, url), ("POST", f"{BASE_URL}/portfolios/transfer"))
+        self.assertEqual(headers["CB-ACCESS-KEY"], "test_key")
+        self.assertIn("CB-ACCESS-SIGN", headers)
+
+    async def test_request_failure(self):
+        session = MagicMock()
+        session.closed = False
+        session.request.return_value = FakeHttpResponse(400, b'{"message": "bad request"}')
+        client = AsyncClient(self.credentials, http_client=session, base_url=BASE_URL)
+
+        with self.assertRaises(Exception) as context:
+            await client.request("GET", "/portfolios")
+
+        self.assertTrue('bad request' in str(context.exception))
+
+    async def test_concurrent_requests(self):
+        client = AsyncIntxServicesClient(self.credentials, base_url=BASE_URL)
+        with patch.object(AsyncClient, 'request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = AsyncResponse(200, {}, b'[]')
+            results = await asyncio.gather(*[
+                client.portfolios.list_portfolios(ListPortfoliosRequest()) for _ in range(50)
+            ])
+
+        self.assertEqual(len(results), 50)
+        self.assertEqual(mock_request.await_count, 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+import unittest
+from urllib.parse import parse_qs
+from unittest.mock import patch, MagicMock, AsyncMock
+from intx_sdk import IntxServicesClient, AsyncIntxServicesClient
+from intx_sdk.credentials import Credentials
+from intx_sdk.enums import OrderSide
+from intx_sdk.errors import ServerError
+from intx_sdk.services.orders import CancelAllOrdersRequest
+from tests.test_constants import BASE_URL
+
+
+class FakeExchange:
+    """Lists `portfolios` and cancels two orders per portfolio after a delay, failing the first `failures[p]` times"""
+
+    def __init__(self, portfolios, delay=0.02, failures=None):
+        self.portfolios = portfolios
+        self.delay = delay
+        self.failures = dict(failures or {})
+        self.cancels = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def respond(self, method, path, query="", **kwargs):
+        response = MagicMock()
+        if method == "GET":
+            response.json.return_value = [{"portfolio_id": p, "name": p} for p in self.portfolios]
+            return response
+        params = {k: v[0] for k, v in parse_qs(query).items()}
+        portfolio = params["portfolio"]
+        with self.lock:
+            self.cancels.append(params)
+            if self.failures.get(portfolio, 0) > 0:
+                self.failures[portfolio] -= 1
+                raise ServerError("unavailable", status_code=503)
+        response.json.return_value = [{"order_id": f"{portfolio}-{i}", "portfolio_id": portfolio} for i in range(2)]
+        return response
+
+    def __call__(self, method, path, query="", **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            return self.respond(method, path, query)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class TestCancelAllOrders(unittest.TestCase):
+
+    def setUp(self):
+        self.credentials = Credentials(access_key="test_key", passphrase="test_passphrase",
+                                       signing_key="test_signing_key")
+
+    def test_cancels_every_portfolio_concurrently(self):
+        exchange = FakeExchange([f"p{i}" for i in range(8)])
+        client = IntxServicesClient(self.credentials, base_url=BASE_URL)
+
+        with patch('intx_sdk.client.Client.request', side_effect=exchange):
+            report = client.orders.cancel_all_orders(CancelAllOrdersRequest(instrument="BTC-PERP", side=OrderSide.BUY))
+
+        self.assertEqual([r.portfolio for r in report.results], [f"p{i}" for i in range(8)])
+        self.assertEqual(exchange.max_in_flight, 8)
+        self.assertLess(report.elapsed, 8 * exchange.delay)
+        self.assertEqual(report.cancelled_count, 16)
+        self.assertEqual(report.failed, [])
+        self.assertTrue(all(c["instrument"] == "BTC-PERP" and c["side"] == "BUY" for c in exchange.cancels))
+        self.assertGreater(report.list_portfolios_latency, 0)
+
+    def test_failed_portfolios_are_retried_and_reported(self):
+        exchange = FakeExchange([], delay=0, failures={"a": 1, "b": 5})
+        client = IntxServicesClient(self.credentials, base_url=BASE_URL)
+        client.client.retry_policy.backoff = MagicMock(return_value=0.02)
+
+        with patch('intx_sdk.client.Client.request', side_effect=exchange) as mock_request:
+            report = client.orders.cancel_all_orders(CancelAllOrdersRequest(portfolios=["a", "b", "c"], max_rounds=3))
+
+        # Two waits between three rounds, none after the last
+        self.assertEqual([c.args for c in client.client.retry_policy.backoff.call_args_list], [(1,), (2,)])
+        self.assertGreaterEqual(report.elapsed, 0.04)
+        self.assertTrue(all(call.kwargs["idempotent"] for call in mock_request.call_args_list))
+        self.assertEqual([r.attempts for r in report.results], [2, 3, 1])
+        self.assertEqual(report.cancelled_count, 4)
+        self.assertEqual([r.portfolio for r in report.failed], ["b"])
+        self.assertIsInstance(report.failed[0].error, ServerError)
+
+    def test_async_cancel_all_orders(self):
+        exchange = FakeExchange(["a", "b", "c"], delay=0, failures={"c": 1})
+        client = AsyncIntxServicesClient(self.credentials, base_url=BASE_URL)
+        client.client.retry_policy.backoff = MagicMock(return_value=0.01)
+
+        with patch('intx_sdk.async_client.AsyncClient.request', new_callable=AsyncMock, side_effect=exchange.respond), \
+                patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            report = asyncio.run(client.orders.cancel_all_orders(CancelAllOrdersRequest(max_workers=2)))
+
+        self.assertEqual(report.cancelled_count, 6)
+        self.assertEqual([r.attempts for r in report.results], [1, 1, 2])
+        mock_sleep.assert_awaited_once_with(0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import patch, MagicMock
+import numpy as np
+from intx_sdk import IntxServicesClient
+from intx_sdk.candles import CandleArray
+from intx_sdk.credentials import Credentials
+from intx_sdk.enums import Granularity
+from intx_sdk.services.instruments import GetAggregatedCandlesRequest
+from intx_sdk.services.model import Aggregation
+from tests.test_constants import BASE_URL
+
+AGGREGATIONS = [
+    {"start": "2024-01-01T00:00:00Z", "open": "100.5", "high": "101", "low": "99", "close": "100", "volume": "3"},
+    {"start": "2024-01-01T00:01:00Z", "open": "100", "high": "102", "low": "100", "close": "101.25"},
+]
+
+
+class TestCandleArray(unittest.TestCase):
+
+    def test_from_aggregations(self):
+        candles = CandleArray.from_aggregations(AGGREGATIONS)
+
+        self.assertEqual(len(candles), 2)
+        self.assertEqual(candles.start.dtype, np.dtype("datetime64[s]"))
+        self.assertEqual(candles.start[1], np.datetime64("2024-01-01T00:01:00"))
+        np.testing.assert_array_equal(candles.open, [100.5, 100.0])
+        np.testing.assert_array_equal(candles.close, [100.0, 101.25])
+        self.assertEqual(candles.volume[0], 3.0)
+        self.assertTrue(np.isnan(candles.volume[1]))
+        np.testing.assert_array_equal(candles.epoch_seconds, [1704067200, 1704067260])
+
+    def test_accepts_aggregation_objects_and_epoch_starts(self):
+        candles = CandleArray.from_aggregations([Aggregation(start="1704067200", open="1", high="2", low="0.5",
+                                                             close="1.5", volume="10")])
+
+        self.assertEqual(candles.start[0], np.datetime64("2024-01-01T00:00:00"))
+        self.assertEqual(candles.high[0], 2.0)
+
+    def test_accepts_iterables_and_null_volumes(self):
+        candles = CandleArray.from_aggregations({**a, "volume": None} if i else a for i, a in enumerate(AGGREGATIONS))
+
+        np.testing.assert_array_equal(candles.low, [99.0, 100.0])
+        self.assertEqual(candles.volume[0], 3.0)
+        self.assertTrue(np.isnan(candles.volume[1]))
+
+    def test_round_trip_and_take(self):
+        candles = CandleArray.from_aggregations(AGGREGATIONS)
+
+        self.assertEqual(candles.to_aggregations()[1],
+                         {"start": "2024-01-01T00:01:00Z", "open": "100.0", "high": "102.0", "low": "100.0",
+                          "close": "101.25", "volume": None})
+        self.assertEqual(len(candles.take(candles.close > 100)), 1)
+        self.assertEqual(len(CandleArray.from_aggregations([])), 0)
+
+    @patch('intx_sdk.client.Client.request')
+    def test_get_aggregated_candles_array(self, mock_request):
+        credentials = Credentials(access_key="test_key", passphrase="test_passphrase", signing_key="test_signing_key")
+        client = IntxServicesClient(credentials, base_url=BASE_URL)
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"aggregations": AGGREGATIONS}
+        mock_request.return_value = mock_response
+
+        request = GetAggregatedCandlesRequest(instrument="BTC-PERP", granularity=Granularity.ONE_MINUTE,
+                                              start="2024-01-01T00:00:00Z")
+        candles = client.instruments.get_aggregated_candles_array(request)
+
+        self.assertIsInstance(candles, CandleArray)
+        self.assertEqual(len(candles), 2)
+        self.assertEqual(mock_request.call_args.args[1], "/instruments/BTC-PERP/candles")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+from urllib.parse import parse_qs
+from unittest.mock import patch, MagicMock, AsyncMock
+import numpy as np
+from intx_sdk import IntxServicesClient, AsyncIntxServicesClient
+from intx_sdk.candles import CandleArray, chunk_ranges, fetch_candle_range
+from intx_sdk.candles.timeframes import granularity_seconds, to_epoch_seconds
+from intx_sdk.credentials import Credentials
+from intx_sdk.enums import Granularity
+from intx_sdk.services.instruments import GetAggregatedCandlesRequest
+from tests.test_constants import BASE_URL
+
+T0 = 1_704_067_200  # 2024-01-01T00:00:00Z
+
+
+def bars(start, end, step=60):
+    # Like the API, include the bar starting exactly at `end`, newest first
+    starts = np.arange(to_epoch_seconds(end), to_epoch_seconds(start) - step, -step)
+    prices = starts.astype(np.float64)
+    return CandleArray(starts.astype("datetime64[s]"), prices, prices, prices, prices, np.ones(len(starts)))
+
+
+def candles_response(method, path, query="", **kwargs):
+    params = parse_qs(query)
+    response = MagicMock()
+    step = granularity_seconds(Granularity(params["granularity"][0]))
+    response.json.return_value = {"aggregations": bars(params["start"][0], params["end"][0], step).to_aggregations()}
+    return response
+
+
+class TestCandleFetcher(unittest.TestCase):
+
+    def setUp(self):
+        self.credentials = Credentials(access_key="test_key", passphrase="test_passphrase",
+                                       signing_key="test_signing_key")
+
+    def test_chunk_ranges_follow_granularity(self):
+        self.assertEqual(chunk_ranges(T0 + 30, T0 + 250 * 60, Granularity.ONE_MINUTE, max_bars=100),
+                         [(T0, T0 + 6000), (T0 + 6000, T0 + 12000), (T0 + 12000, T0 + 15000)])
+        self.assertEqual(len(chunk_ranges(T0, T0 + 86400 * 30, Granularity.ONE_DAY, max_bars=300)), 1)
+        self.assertEqual(chunk_ranges(T0, T0, Granularity.ONE_HOUR), [])
+
+    def test_stitches_chunks_into_one_contiguous_series(self):
+        candles = fetch_candle_range(bars, "2024-01-01T00:00:00Z", "2024-01-01T10:00:00Z",
+                                     Granularity.ONE_MINUTE, max_bars=45, max_workers=3)
+
+        np.testing.assert_array_equal(candles.epoch_seconds, np.arange(T0, T0 + 600 * 60, 60))
+
+    @patch('intx_sdk.client.Client.request', side_effect=candles_response)
+    def test_get_aggregated_candles_range(self, mock_request):
+        client = IntxServicesClient(self.credentials, base_url=BASE_URL)
+        request = GetAggregatedCandlesRequest(instrument="BTC-PERP", granularity=Granularity.FIVE_MINUTE,
+                                              start="2024-01-01T00:00:00Z", end="2024-01-02T00:00:00Z")
+
+        candles = client.instruments.get_aggregated_candles_range(request, max_bars=100)
+
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(len(candles), 288)
+        self.assertTrue(np.all(np.diff(candles.epoch_seconds) == 300))
+
+    def test_async_get_aggregated_candles_range(self):
+        client = AsyncIntxServicesClient(self.credentials, base_url=BASE_URL)
+        request = GetAggregatedCandlesRequest(instrument="BTC-PERP", granularity=Granularity.ONE_HOUR,
+                                              start="2024-01-01T00:00:00Z", end="2024-01-11T00:00:00Z")
+
+        with patch('intx_sdk.async_client.AsyncClient.request', new_callable=AsyncMock,
+                   side_effect=candles_response) as mock_request:
+            candles = asyncio.run(client.instruments.get_aggregated_candles_range(request, max_bars=50))
+
+        self.assertEqual(mock_request.call_count, 5)
+        self.assertEqual(len(candles), 240)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import numpy as np
+from intx_sdk.candles import CandleArray, resample, resample_all
+from intx_sdk.enums import Granularity
+
+T0 = 1_704_067_200  # 2024-01-01T00:00:00Z, a Monday
+
+
+def minute_series(start, count):
+    starts = np.arange(start, start + 60 * count, 60)
+    close = np.arange(count, dtype=np.float64)
+    return CandleArray(starts.astype("datetime64[s]"), close - 0.5, close + 1, close - 1, close, np.ones(count))
+
+
+class TestCandleResample(unittest.TestCase):
+
+    def test_ohlcv_aggregation_with_epoch_aligned_buckets(self):
+        # Starts at 00:03 so the first FIVE_MINUTE bucket (00:00) is partial
+        five = resample(minute_series(T0 + 180, 12), Granularity.FIVE_MINUTE)
+
+        np.testing.assert_array_equal(five.epoch_seconds, [T0, T0 + 300, T0 + 600])
+        np.testing.assert_array_equal(five.open, [-0.5, 1.5, 6.5])
+        np.testing.assert_array_equal(five.high, [2, 7, 12])
+        np.testing.assert_array_equal(five.low, [-1, 1, 6])
+        np.testing.assert_array_equal(five.close, [1, 6, 11])
+        np.testing.assert_array_equal(five.volume, [2, 5, 5])
+
+    def test_unsorted_input_with_holes_and_missing_volume(self):
+        candles = minute_series(T0, 10).take(np.array([9, 8, 0, 1, 2]))
+        candles.volume[:2] = np.nan
+
+        five = resample(candles, Granularity.FIVE_MINUTE)
+
+        np.testing.assert_array_equal(five.epoch_seconds, [T0, T0 + 300])
+        self.assertEqual((five.open[1], five.close[1]), (7.5, 9))
+        self.assertEqual(five.volume[0], 3)
+        self.assertTrue(np.isnan(five.volume[1]))
+
+    def test_resample_all_matches_direct_aggregation(self):
+        candles = minute_series(T0, 3 * 24 * 60)
+        derived = resample_all(candles)
+
+        self.assertEqual(set(derived), set(Granularity) - {Granularity.ONE_MINUTE})
+        day = derived[Granularity.ONE_DAY]
+        np.testing.assert_array_equal(day.epoch_seconds, [T0, T0 + 86400, T0 + 2 * 86400])
+        np.testing.assert_array_equal(day.volume, [1440, 1440, 1440])
+        self.assertEqual(len(derived[Granularity.SIX_HOUR]), 12)
+        self.assertEqual(derived[Granularity.ONE_HOUR].close[0], 59)
+
+    def test_accepts_aggregations_and_rejects_finer_targets(self):
+        aggregations = minute_series(T0, 30).to_aggregations()
+
+        self.assertEqual(len(resample(aggregations, Granularity.FIFTEEN_MINUTE)), 2)
+        with self.assertRaises(ValueError):
+            resample(aggregations, Granularity.ONE_MINUTE, source_granularity=Granularity.FIVE_MINUTE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import tempfile
+import unittest
+from urllib.parse import parse_qs
+from unittest.mock import patch, MagicMock
+import numpy as np
+from intx_sdk import IntxServicesClient
+from intx_sdk.candles import CandleArray, CandleStore
+from intx_sdk.candles.timeframes import format_epoch_seconds, to_epoch_seconds
+from intx_sdk.credentials import Credentials
+from intx_sdk.enums import Granularity
+from tests.test_constants import BASE_URL
+
+T0 = 1_704_067_200  # 2024-01-01T00:00:00Z
+MINUTE = Granularity.ONE_MINUTE
+
+
+def minute_bars(start, end):
+    starts = np.arange(to_epoch_seconds(start), to_epoch_seconds(end) + 60, 60)
+    prices = starts.astype(np.float64) - T0
+    return CandleArray(starts.astype("datetime64[s]"), prices, prices + 1, prices - 1, prices, np.ones(len(starts)))
+
+
+class TestCandleStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.now = T0 + 10 * 60 + 30
+        self.store = CandleStore(self.directory.name, clock=lambda: self.now)
+        self.fetched = []
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def fetch(self, start, end):
+        self.fetched.append((start, end))
+        return minute_bars(start, end)
+
+    def sync(self, start, end=None):
+        return self.store.sync("instruments", "BTC-PERP", MINUTE, self.fetch, start, end)
+
+    def test_fetches_only_new_complete_bars(self):
+        self.assertEqual(self.sync(T0), 10)
+        self.assertEqual(self.sync(T0), 0)
+        self.now += 5 * 60
+        self.assertEqual(self.sync(T0), 5)
+
+        self.assertEqual(self.fetched, [("2024-01-01T00:00:00Z", "2024-01-01T00:10:00Z"),
+                                        ("2024-01-01T00:10:00Z", "2024-01-01T00:15:00Z")])
+        candles = self.store.read("instruments", "BTC-PERP", MINUTE)
+        np.testing.assert_array_equal(candles.epoch_seconds, np.arange(T0, T0 + 15 * 60, 60))
+        self.assertEqual(self.store.last_start("instruments", "BTC-PERP", MINUTE),
+                         np.datetime64("2024-01-01T00:14:00"))
+
+    def test_backfills_gaps_between_synced_ranges(self):
+        self.sync(T0, T0 + 2 * 60)
+        self.sync(T0 + 6 * 60, T0 + 8 * 60)
+
+        self.assertEqual(self.store.gaps("instruments", "BTC-PERP", MINUTE, T0, T0 + 8 * 60),
+                         [(T0 + 2 * 60, T0 + 6 * 60)])
+        self.assertEqual(self.sync(T0, T0 + 8 * 60), 4)
+        self.assertEqual(self.fetched[-1], (format_epoch_seconds(T0 + 2 * 60), format_epoch_seconds(T0 + 6 * 60)))
+
+        candles = self.store.read("instruments", "BTC-PERP", MINUTE)
+        np.testing.assert_array_equal(candles.epoch_seconds, np.arange(T0, T0 + 8 * 60, 60))
+        np.testing.assert_array_equal(candles.close, np.arange(0, 8 * 60, 60))
+
+    def test_range_query_reads_from_disk(self):
+        self.sync(T0)
+
+        candles = self.store.read("instruments", "BTC-PERP", MINUTE,
+                                  start="2024-01-01T00:03:00Z", end="2024-01-01T00:05:00Z")
+
+        np.testing.assert_array_equal(candles.start, np.array(["2024-01-01T00:03:00", "2024-01-01T00:04:00"],
+                                                              dtype="datetime64[s]"))
+        self.assertEqual(len(self.store.read("index", "COIN50", MINUTE)), 0)
+
+    @patch('intx_sdk.client.Client.request')
+    def test_sync_instrument(self, mock_request):
+        def candles_response(method, path, query="", **kwargs):
+            params = parse_qs(query)
+            response = MagicMock()
+            response.json.return_value = {
+                "aggregations": minute_bars(params["start"][0], params["end"][0]).to_aggregations()}
+            return response
+
+        mock_request.side_effect = candles_response
+        credentials = Credentials(access_key="test_key", passphrase="test_passphrase", signing_key="test_signing_key")
+        client = IntxServicesClient(credentials, base_url=BASE_URL)
+
+        self.assertEqual(self.store.sync_instrument(client.instruments, "BTC-PERP", MINUTE, T0), 10)
+        self.assertEqual(mock_request.call_args.args[1], "/instruments/BTC-PERP/candles")
+        self.assertEqual(len(self.store.read("instruments", "BTC-PERP", MINUTE)), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
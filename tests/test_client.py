@@ -0,0 +1,163 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import hashlib
+import hmac
+import unittest
+from decimal import Decimal
+from enum import Enum
+from unittest.mock import MagicMock
+from intx_sdk.client import Client
+from intx_sdk.credentials import Credentials
+from intx_sdk.json_codec import JsonCodec, StdlibJsonCodec, OrjsonCodec, orjson
+from intx_sdk.transport import TransportConfig, KeepAliveHTTPAdapter
+from tests.test_constants import BASE_URL
+
+SIGNING_KEY = base64.b64encode(b"test_signing_key").decode()
+
+
+class TestClient(unittest.TestCase):
+
+    def setUp(self):
+        self.credentials = Credentials(
+            access_key="test_key",
+            passphrase="test_passphrase",
+            signing_key=SIGNING_KEY
+        )
+        self.client = Client(self.credentials, base_url=BASE_URL)
+
+    def test_sign_matches_fresh_hmac(self):
+        for message in ["1700000000GET/api/v1/portfolios", "1700000001POST/api/v1/orders{}"]:
+            expected = base64.b64encode(
+                hmac.new(b"test_signing_key", message.encode(), hashlib.sha256).digest()
+            ).decode()
+            self.assertEqual(self.client.sign(message), expected)
+
+    def test_signing_key_is_decoded_on_construction(self):
+        self.assertIsNotNone(self.client.signing_hmac)
+
+        client = Client(Credentials(access_key="test_key", passphrase="test_passphrase", signing_key="not base64!"),
+                        base_url=BASE_URL)
+
+        self.assertIsNone(client.signing_hmac)
+        with self.assertRaises(ValueError):
+            client.sign("1700000000GET/api/v1/portfolios")
+
+    def test_generate_headers_does_not_mutate_base_headers(self):
+        headers = self.client.generate_headers("GET", "/api/v1/portfolios")
+
+        self.assertEqual(headers["CB-ACCESS-KEY"], "test_key")
+        self.assertEqual(headers["CB-ACCESS-PASSPHRASE"], "test_passphrase")
+        self.assertIn("CB-ACCESS-SIGN", headers)
+        self.assertIn("CB-ACCESS-TIMESTAMP", headers)
+        self.assertNotIn("CB-ACCESS-SIGN", self.client.base_headers)
+        with self.assertRaises(TypeError):
+            self.client.base_headers["CB-ACCESS-KEY"] = "other"
+
+    def make_session(self, status_code=200, content=b'{"success": true}'):
+        session = MagicMock()
+        http_response = MagicMock()
+        http_response.status_code = status_code
+        http_response.content = content
+        session.request.return_value = http_response
+        return session
+
+    def assert_signed_body_is_sent(self, client, session):
+        response = client.request("POST", "/portfolios/transfer", body={"from": "a", "to": "b", "amount": "1"})
+
+        kwargs = session.request.call_args.kwargs
+        sent = kwargs["data"]
+        headers = kwargs["headers"]
+        self.assertIsInstance(sent, bytes)
+        self.assertNotIn("json", kwargs)
+        expected = client.sign(f"{headers['CB-ACCESS-TIMESTAMP']}POST/api/v1/portfolios/transfer".encode() + sent)
+        self.assertEqual(headers["CB-ACCESS-SIGN"], expected)
+        self.assertEqual(client.json_codec.loads(sent), {"from": "a", "to": "b", "amount": "1"})
+        self.assertEqual(response.json(), {"success": True})
+
+    def test_request_sends_signed_bytes_stdlib(self):
+        session = self.make_session()
+        client = Client(self.credentials, http_client=session, base_url=BASE_URL, json_codec=StdlibJsonCodec())
+        self.assert_signed_body_is_sent(client, session)
+
+    @unittest.skipIf(orjson is None, "orjson not installed")
+    def test_request_sends_signed_bytes_orjson(self):
+        session = self.make_session()
+        client = Client(self.credentials, http_client=session, base_url=BASE_URL, json_codec=OrjsonCodec())
+        self.assert_signed_body_is_sent(client, session)
+
+    def test_request_without_body_sends_no_data(self):
+        session = self.make_session(content=b'[]')
+        client = Client(self.credentials, http_client=session, base_url=BASE_URL)
+
+        client.request("GET", "/portfolios")
+
+        self.assertIsNone(session.request.call_args.kwargs["data"])
+
+    def test_stdlib_codec_encodes_enums_by_value(self):
+        class Side(Enum):
+            BUY = "BUY"
+
+        self.assertEqual(StdlibJsonCodec().dumps({"side": Side.BUY}), b'{"side": "BUY"}')
+
+    def test_incomplete_codec_fails_on_creation(self):
+        class LoadsOnly(JsonCodec):
+            def loads(self, data):
+                return data
+
+        with self.assertRaises(TypeError):
+            LoadsOnly()
+
+    def test_stdlib_codec_round_trips_decimals_as_strings(self):
+        codec = StdlibJsonCodec()
+
+        self.assertEqual(codec.loads(codec.dumps({"price": Decimal("60000.10")})), {"price": "60000.10"})
+
+    @unittest.skipIf(orjson is None, "orjson not installed")
+    def test_orjson_codec_round_trips_decimals_as_strings(self):
+        codec = OrjsonCodec()
+
+        self.assertEqual(codec.loads(codec.dumps({"price": Decimal("0.0001"), "size": Decimal("1E+2")})),
+                         {"price": "0.0001", "size": "1E+2"})
+
+    def test_transport_configures_session_adapters(self):
+        transport = TransportConfig(pool_connections=4, pool_maxsize=32, connect_timeout=1.5, read_timeout=7.0)
+        client = Client(self.credentials, base_url=BASE_URL, transport=transport)
+
+        adapter = client.http_client.get_adapter(BASE_URL)
+        self.assertIsInstance(adapter, KeepAliveHTTPAdapter)
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 32)
+        self.assertIn("socket_options", adapter.poolmanager.connection_pool_kw)
+        self.assertEqual(transport.timeout, (1.5, 7.0))
+
+    def test_request_passes_timeout_and_evicts_idle_connections(self):
+        session = self.make_session(content=b'[]')
+        transport = TransportConfig(connect_timeout=2.0, read_timeout=5.0, max_idle_time=0.0)
+        client = Client(self.credentials, http_client=session, base_url=BASE_URL, transport=transport)
+        adapter = MagicMock()
+        session.adapters = {"https://": adapter}
+
+        client.request("GET", "/portfolios")
+        adapter.poolmanager.clear.assert_not_called()
+        client.last_request_time -= 1
+        client.request("GET", "/portfolios")
+
+        self.assertEqual(session.request.call_args.kwargs["timeout"], (2.0, 5.0))
+        adapter.poolmanager.clear.assert_called_once()
+        session.close.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
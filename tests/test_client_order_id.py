@@ -0,0 +1,97 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+import unittest
+from intx_sdk.decoder import Decoder
+from intx_sdk.services.model import Order
+from intx_sdk.services.orders import ClientOrderIdGenerator, OrderManager, parse_client_order_id, strategy_of
+
+T0_NS = 1_704_067_200_000 * 1_000_000  # 2024-01-01T00:00:00Z
+
+
+class FakeClock:
+    def __init__(self, now_ns=T0_NS):
+        self.now_ns = now_ns
+
+    def __call__(self):
+        return self.now_ns
+
+
+class TestClientOrderIdGenerator(unittest.TestCase):
+
+    def test_ids_decode_back(self):
+        generator = ClientOrderIdGenerator("mm_btc", prefix="0badcafe", clock=FakeClock())
+
+        client_order_id = generator()
+        decoded = parse_client_order_id(client_order_id)
+
+        self.assertEqual(client_order_id, "mm_btc-0badcafe-018cc251f4000000")
+        self.assertEqual((decoded.strategy, decoded.prefix, decoded.sequence), ("mm_btc", "0badcafe", 0))
+        self.assertEqual(decoded.timestamp.isoformat(), "2024-01-01T00:00:00+00:00")
+        self.assertEqual(strategy_of(generator("hedge")), "hedge")
+        self.assertIsNone(parse_client_order_id("3f1c9a1e-uuid4-style"))
+        self.assertIsNone(strategy_of("3f1c9a1e-uuid4-style"))
+
+    def test_monotonic_when_clock_stalls_or_steps_back(self):
+        clock = FakeClock()
+        generator = ClientOrderIdGenerator(clock=clock)
+
+        ids = [generator() for _ in range(3)]
+        clock.now_ns -= 5_000_000_000
+        ids.append(generator())
+        clock.now_ns += 10_000_000_000
+        ids.append(generator())
+
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(set(ids)), 5)
+        self.assertEqual([parse_client_order_id(i).sequence for i in ids], [0, 1, 2, 3, 0])
+
+    def test_unique_across_threads(self):
+        generator = ClientOrderIdGenerator("t")
+        ids = []
+
+        def generate():
+            ids.extend(generator() for _ in range(2000))
+        threads = [threading.Thread(target=generate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(set(ids)), 8000)
+        self.assertNotEqual(ClientOrderIdGenerator().prefix, ClientOrderIdGenerator().prefix)
+
+    def test_rejects_bad_tags(self):
+        with self.assertRaises(ValueError):
+            ClientOrderIdGenerator("market-maker")
+        with self.assertRaises(ValueError):
+            ClientOrderIdGenerator()("x" * 33)
+
+    def test_order_manager_indexes_by_strategy(self):
+        generator = ClientOrderIdGenerator("mm")
+        manager = OrderManager()
+        for order_id, client_order_id in ((1, generator()), (2, generator("hedge")), (3, "manual")):
+            manager.record(Decoder().decode(Order, {"order_id": order_id, "client_order_id": client_order_id,
+                                                    "side": "BUY", "symbol": "BTC-PERP"}))
+
+        self.assertEqual([o.order_id for o in manager.for_strategy("mm")], [1])
+        manager.forget(2)
+        self.assertEqual(manager.for_strategy("hedge"), [])
+        self.assertEqual(len(manager), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import dataclasses
+import pickle
+import unittest
+from intx_sdk.services import compact_model
+from intx_sdk.services.model import Aggregation, PortfolioFill
+
+FILL = {
+    "portfolio_id": "p1",
+    "portfolio_uuid": "uuid_1",
+    "fill_id": "fill_1",
+    "symbol": "BTC-PERP",
+    "fill_price": "100",
+    "fill_qty": "1",
+    "side": "BUY",
+    "event_time": "2024-01-01T00:00:00Z",
+}
+
+
+class TestCompactModel(unittest.TestCase):
+
+    def test_every_model_has_a_slotted_variant(self):
+        self.assertEqual(len(compact_model.MODELS) + len(compact_model.RESPONSE_MODELS),
+                         len(compact_model.COMPACT_MODELS))
+        self.assertIs(compact_model.PortfolioFill, compact_model.slotted(PortfolioFill))
+
+    def test_slotted_is_cached_across_call_forms(self):
+        for frozen in (False, True):
+            forms = [compact_model.slotted(PortfolioFill, frozen), compact_model.slotted(PortfolioFill, frozen=frozen),
+                     compact_model.slotted(cls=PortfolioFill, frozen=int(frozen))]
+            if not frozen:
+                forms.append(compact_model.slotted(PortfolioFill))
+            self.assertTrue(all(cls is forms[0] for cls in forms))
+
+            fill = forms[-1](**FILL)
+            self.assertEqual(pickle.loads(pickle.dumps(fill)), fill)
+
+    def test_slotted_model_is_compatible(self):
+        fill = compact_model.PortfolioFill(**FILL)
+
+        self.assertFalse(hasattr(fill, "__dict__"))
+        self.assertEqual(dataclasses.asdict(fill), dataclasses.asdict(PortfolioFill(**FILL)))
+        self.assertIsNone(fill.fee)
+        fill.fee = "0.1"
+        self.assertEqual(dataclasses.replace(fill, fill_qty="2").fill_qty, "2")
+        self.assertEqual(repr(compact_model.Aggregation("t", "1", "2", "0", "1")),
+                         repr(Aggregation("t", "1", "2", "0", "1")))
+        self.assertEqual(pickle.loads(pickle.dumps(fill)), fill)
+        with self.assertRaises(AttributeError):
+            fill.unknown = 1
+
+    def test_frozen_variant(self):
+        frozen_fill = compact_model.slotted(PortfolioFill, frozen=True)
+        fill = frozen_fill(**FILL)
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            fill.fill_qty = "2"
+        self.assertEqual(frozen_fill.__name__, "FrozenPortfolioFill")
+        self.assertEqual(len({fill, frozen_fill(**FILL)}), 1)
+        self.assertEqual(pickle.loads(pickle.dumps(fill)), fill)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock, AsyncMock
+from intx_sdk import IntxServicesClient, AsyncIntxServicesClient
+from intx_sdk.credentials import Credentials
+from intx_sdk.enums import OrderSide, OrderType, TimeInForce
+from intx_sdk.errors import ValidationError
+from intx_sdk.services.orders import CreateOrderRequest, CreateOrderResponse, CreateOrdersRequest
+from tests.test_constants import BASE_URL
+
+
+def ladder(count):
+    return [CreateOrderRequest(client_order_id=f"ladder-{i}", side=OrderSide.BUY, size="0.01", tif=TimeInForce.GTC,
+                               instrument="BTC-PERP", type=OrderType.LIMIT, price=str(60000 - i * 10))
+            for i in range(count)]
+
+
+class FakeExchange:
+    """Answers create_order after a delay and rejects client_order_ids listed in `reject`"""
+
+    def __init__(self, delay=0.02, reject=()):
+        self.delay = delay
+        self.reject = set(reject)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, method, path, body=None, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if body["client_order_id"] in self.reject:
+                raise ValidationError("rejected", status_code=400)
+            response = MagicMock()
+            response.json.return_value = {"client_order_id": body["client_order_id"], "price": body["price"]}
+            return response
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class TestCreateOrders(unittest.TestCase):
+
+    def setUp(self):
+        self.credentials = Credentials(access_key="test_key", passphrase="test_passphrase",
+                                       signing_key="test_signing_key")
+
+    def test_orders_are_sent_concurrently_and_returned_in_order(self):
+        exchange = FakeExchange(reject=["ladder-3"])
+        client = IntxServicesClient(self.credentials, base_url=BASE_URL)
+
+        with patch('intx_sdk.client.Client.request', side_effect=exchange):
+            response = client.orders.create_orders(CreateOrdersRequest(orders=ladder(20)))
+
+        self.assertEqual([r.request.client_order_id for r in response.results], [f"ladder-{i}" for i in range(20)])
+        self.assertEqual(exchange.max_in_flight, client.client.transport.pool_maxsize)
+        self.assertLess(response.elapsed, 20 * exchange.delay)
+        self.assertEqual(len(response.orders), 19)
+        self.assertIsInstance(response.orders[0], CreateOrderResponse)
+        self.assertEqual([r.request.client_order_id for r in response.failed], ["ladder-3"])
+        self.assertIsInstance(response.failed[0].error, ValidationError)
+        self.assertTrue(all(r.latency >= exchange.delay for r in response.results))
+
+    def test_max_workers(self):
+        exchange = FakeExchange(delay=0.005)
+        client = IntxServicesClient(self.credentials, base_url=BASE_URL)
+
+        with patch('intx_sdk.client.Client.request', side_effect=exchange):
+            response = client.orders.create_orders(CreateOrdersRequest(orders=ladder(6), max_workers=2))
+
+        self.assertEqual(exchange.max_in_flight, 2)
+        self.assertEqual(len(response.orders), 6)
+
+    def test_async_create_orders(self):
+        client = AsyncIntxServicesClient(self.credentials, base_url=BASE_URL)
+        in_flight, peak = 0, 0
+
+        async def create(method, path, body=None, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if body["client_order_id"] == "ladder-0":
+                raise ValidationError("rejected", status_code=400)
+            response = MagicMock()
+            response.json.return_value = {"client_order_id": body["client_order_id"]}
+            return response
+
+        with patch('intx_sdk.async_client.AsyncClient.request', new_callable=AsyncMock, side_effect=create):
+            response = asyncio.run(client.orders.create_orders(CreateOrdersRequest(orders=ladder(8), max_workers=4)))
+
+        self.assertEqual(peak, 4)
+        self.assertEqual([r.ok for r in response.results], [False] + [True] * 7)
+        self.assertEqual(response.results[5].order.client_order_id, "ladder-5")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,247 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import dataclasses
+import pickle
+from decimal import Decimal
+import unittest
+from unittest.mock import patch, MagicMock
+from intx_sdk import IntxServicesClient
+from intx_sdk.credentials import Credentials
+from intx_sdk.decoder import Decoder, NUMERIC_DECIMAL, NUMERIC_FLOAT, UNKNOWN_IGNORE, extras_of, raw_of
+from intx_sdk.enums import OrderSide, OrderStatus
+from intx_sdk.errors import DecodeError
+from intx_sdk.services import compact_model
+from intx_sdk.services.feerates import ListFeeRateTiersRequest
+from intx_sdk.services.index import GetIndexCandlesRequest, GetIndexCompositionRequest
+from intx_sdk.services.model import FeeTier, IndexConstituent, Order, PortfolioFill, Quote, Transfer
+from intx_sdk.services.orders import GetOrderDetailsRequest, GetOrderDetailsResponse
+from intx_sdk.services.portfolios import ListPortfolioFillsResponse
+from intx_sdk.services.transfers import ListTransfersRequest
+from tests.test_constants import BASE_URL
+
+ORDER = {
+    "order_id": 1, "order_uuid": "uuid", "client_order_id": "c1", "side": "BUY", "instrument_id": 2,
+    "instrument_uuid": "i-uuid", "symbol": "BTC-PERP", "portfolio_id": 3, "portfolio_uuid": "p-uuid",
+    "type": "LIMIT", "size": "1", "tif": "GTC", "order_status": "WORKING", "leaves_qty": "1",
+    "exec_qty": "0", "avg_price": "0", "fee": "0", "post_only": False, "close_only": False, "reduce_only": False,
+}
+
+
+class TestDecoder(unittest.TestCase):
+
+    def test_unknown_keys_are_captured_or_ignored(self):
+        data = {**ORDER, "new_field": "x"}
+
+        captured = Decoder().decode(Order, data)
+        ignored = Decoder(unknown=UNKNOWN_IGNORE).decode(Order, data)
+
+        self.assertEqual(extras_of(captured), {"new_field": "x"})
+        self.assertEqual(extras_of(ignored), {})
+        self.assertEqual(captured, ignored)
+        self.assertEqual(extras_of(Decoder().decode(Order, ORDER)), {})
+
+    def test_enums_and_missing_fields(self):
+        order = Decoder().decode(Order, {**ORDER, "order_status": "PARTIALLY_FILLED"})
+        partial = Decoder().decode(Order, {k: v for k, v in ORDER.items() if k != "symbol"})
+
+        self.assertIs(order.side, OrderSide.BUY)
+        self.assertEqual(order.order_status, "PARTIALLY_FILLED")
+        self.assertIsNone(partial.symbol)
+        self.assertIsNone(partial.stp_mode)
+
+    def test_unhashable_enum_value_raises_decode_error(self):
+        with self.assertRaises(DecodeError) as context:
+            Decoder().decode(Order, {**ORDER, "side": {"value": "BUY"}})
+        self.assertIn("'side'", str(context.exception))
+        with self.assertRaises(DecodeError):
+            Decoder(lazy=True).decode(Order, {**ORDER, "side": ["BUY"]}).side
+
+    def test_nested_dataclasses(self):
+        fill = {"portfolio_id": "1", "portfolio_uuid": "u", "fill_id": "f", "symbol": "BTC-PERP",
+                "fill_price": "1", "fill_qty": "2", "side": "BUY", "event_time": "t", "venue": "x"}
+        response = Decoder().decode(ListPortfolioFillsResponse, {"fills_result": {
+            "pagination": {"result_limit": 1, "result_offset": 0, "ref_datetime": "r"}, "results": [fill]}})
+
+        self.assertEqual(response.fills_result.pagination.ref_datetime, "r")
+        self.assertIsInstance(response.fills_result.results[0], PortfolioFill)
+        self.assertEqual(response.fills_result.results[0].fill_qty, "2")
+        self.assertEqual(extras_of(response.fills_result.results[0]), {"venue": "x"})
+        self.assertEqual(Decoder().decode_list(PortfolioFill, {"unexpected": "shape"}), {"unexpected": "shape"})
+
+    def test_compact_models(self):
+        order = Decoder(compact=True).decode(Order, {**ORDER, "new_field": "x"})
+
+        self.assertIsInstance(order, compact_model.Order)
+        self.assertEqual(extras_of(order), {"new_field": "x"})
+        self.assertEqual(pickle.loads(pickle.dumps(order)), order)
+
+    def test_frozen_slotted_models(self):
+        frozen_order = compact_model.slotted(Order, frozen=True)
+
+        order = Decoder().decode(frozen_order, {**ORDER, "new_field": "x"})
+
+        self.assertIsInstance(order, frozen_order)
+        self.assertIs(order.side, OrderSide.BUY)
+        self.assertEqual(order, frozen_order(**{**Decoder().decode(Order, ORDER).__dict__}))
+        self.assertEqual(extras_of(order), {"new_field": "x"})
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            order.size = "2"
+
+    @patch('intx_sdk.client.Client.request')
+    def test_service_tolerates_new_fields(self, mock_request):
+        mock_request.return_value = MagicMock(**{"json.return_value": {**ORDER, "new_field": "x"}})
+        client = IntxServicesClient(Credentials(access_key="test_key", passphrase="test_passphrase",
+                                                signing_key="test_signing_key"), base_url=BASE_URL)
+
+        response = client.orders.get_order_details(GetOrderDetailsRequest(portfolio="p", order_id="1"))
+
+        self.assertIsInstance(response, GetOrderDetailsResponse)
+        self.assertIs(response.order_status, OrderStatus.WORKING)
+        self.assertEqual(extras_of(response), {"new_field": "x"})
+
+    @patch('intx_sdk.client.Client.request')
+    def test_service_builds_compact_response_subclasses(self, mock_request):
+        mock_request.return_value = MagicMock(**{"json.return_value": ORDER})
+        client = IntxServicesClient(Credentials(access_key="test_key", passphrase="test_passphrase",
+                                                signing_key="test_signing_key"), base_url=BASE_URL,
+                                    decoder=Decoder(compact=True))
+
+        response = client.orders.get_order_details(GetOrderDetailsRequest(portfolio="p", order_id="1"))
+
+        self.assertIsInstance(response, compact_model.GetOrderDetailsResponse)
+        self.assertIn("order_status", type(response).__slots__)
+        self.assertFalse(hasattr(response, "__dict__"))
+        self.assertEqual(pickle.loads(pickle.dumps(response)), response)
+
+    @patch('intx_sdk.client.Client.request')
+    def test_endpoints_that_returned_raw_dicts(self, mock_request):
+        client = IntxServicesClient(Credentials(access_key="test_key", passphrase="test_passphrase",
+                                                signing_key="test_signing_key"), base_url=BASE_URL)
+        mock_request.return_value = MagicMock(**{"json.return_value": {
+            "product_id": "COIN50", "divisor": "1.5", "constituents": [{"symbol": "BTC", "weight": "0.5"}]}})
+
+        composition = client.index.get_index_composition(GetIndexCompositionRequest(index="COIN50")).composition
+
+        mock_request.return_value = MagicMock(**{"json.return_value": [{"fee_tier_id": 1, "maker_fee_rate": "0.0002"}]})
+        tiers = client.feerates.list_fee_rate_tiers(ListFeeRateTiersRequest()).fee_tiers
+
+        self.assertIsInstance(composition.constituents[0], IndexConstituent)
+        self.assertEqual(composition.constituents[0].weight, "0.5")
+        self.assertIsInstance(tiers[0], FeeTier)
+        self.assertEqual(tiers[0].maker_fee_rate, "0.0002")
+
+    @patch('intx_sdk.client.Client.request')
+    def test_index_candles_use_numeric_mode(self, mock_request):
+        client = IntxServicesClient(Credentials(access_key="test_key", passphrase="test_passphrase",
+                                                signing_key="test_signing_key"), base_url=BASE_URL,
+                                    decoder=Decoder(numeric=NUMERIC_DECIMAL))
+        bar = {"start": "2024-01-01T00:00:00Z", "open": "1.5", "high": "2", "low": "1", "close": "1.75"}
+        request = GetIndexCandlesRequest(index="COIN50", granularity="ONE_HOUR", start="2024-01-01T00:00:00Z")
+
+        for payload in ({"aggregations": [bar]}, [bar]):
+            mock_request.return_value = MagicMock(**{"json.return_value": payload})
+            aggregations = client.index.get_index_candles(request).aggregations
+
+            self.assertEqual(aggregations[0].close, Decimal("1.75"))
+            self.assertIsNone(aggregations[0].volume)
+
+
+class TestNumericModes(unittest.TestCase):
+
+    def test_raw_keeps_values_as_sent(self):
+        order = Decoder().decode(Order, {**ORDER, "price": "65000.10", "size": 1.5})
+
+        self.assertEqual((order.price, order.size, order.order_id), ("65000.10", 1.5, 1))
+
+    def test_float_and_decimal(self):
+        data = {**ORDER, "price": "65000.10", "size": 0.1, "avg_price": ""}
+
+        as_float = Decoder(numeric=NUMERIC_FLOAT).decode(Order, data)
+        as_decimal = Decoder(numeric=NUMERIC_DECIMAL).decode(Order, data)
+
+        self.assertEqual((as_float.price, as_float.size, as_float.leaves_qty), (65000.1, 0.1, 1.0))
+        self.assertEqual((as_decimal.price, as_decimal.size), (Decimal("65000.10"), Decimal("0.1")))
+        self.assertEqual(as_decimal.avg_price, "")
+        self.assertIsNone(as_decimal.stop_price)
+        self.assertEqual((as_decimal.order_id, as_decimal.client_order_id), (1, "c1"))
+
+    def test_lazy_decimal(self):
+        quote = Decoder(lazy=True, numeric=NUMERIC_DECIMAL).decode(Quote, {"best_bid_price": "99.5", "timestamp": "t"})
+
+        self.assertEqual(quote.best_bid_price, Decimal("99.5"))
+        self.assertEqual(quote.timestamp, "t")
+
+    def test_rejects_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            Decoder(numeric="int")
+
+
+class TestLazyDecoder(unittest.TestCase):
+
+    def test_fields_decode_on_first_access(self):
+        data = {**ORDER, "new_field": "x"}
+        order = Decoder(lazy=True).decode(Order, data)
+
+        self.assertIsInstance(order, Order)
+        self.assertIs(raw_of(order), data)
+        self.assertEqual(vars(order), {})
+        self.assertIs(order.side, OrderSide.BUY)
+        self.assertEqual(vars(order), {"side": OrderSide.BUY})
+        self.assertIsNone(order.stp_mode)
+        self.assertEqual(extras_of(order), {"new_field": "x"})
+        self.assertEqual(dataclasses.asdict(order), dataclasses.asdict(Decoder().decode(Order, data)))
+
+    def test_pickles_as_plain_model(self):
+        order = Decoder(lazy=True).decode(Order, ORDER)
+
+        restored = pickle.loads(pickle.dumps(order))
+
+        self.assertIs(type(restored), Order)
+        self.assertEqual(restored, Decoder().decode(Order, ORDER))
+
+    def test_replace_returns_plain_model(self):
+        order = Decoder(lazy=True).decode(Order, {**ORDER, "new_field": "x"})
+
+        replaced = dataclasses.replace(order, size="2")
+
+        self.assertIs(type(replaced), Order)
+        self.assertEqual((replaced.size, replaced.side, replaced.client_order_id), ("2", OrderSide.BUY, "c1"))
+        self.assertEqual(extras_of(replaced), {})
+        self.assertEqual(order.size, "1")
+
+    @patch('intx_sdk.client.Client.request')
+    def test_list_transfers(self, mock_request):
+        transfer = {"transfer_uuid": "t1", "transfer_type": "DEPOSIT", "amount": "10", "asset": "USDC",
+                    "status": "PROCESSED", "network_name": "ethereum"}
+        mock_request.return_value = MagicMock(**{"json.return_value": {
+            "pagination": {"result_limit": 100, "result_offset": 0}, "results": [transfer]}})
+        client = IntxServicesClient(Credentials(access_key="test_key", passphrase="test_passphrase",
+                                                signing_key="test_signing_key"),
+                                    base_url=BASE_URL, decoder=Decoder(lazy=True))
+
+        results = client.transfers.list_transfers(ListTransfersRequest()).transfers_result.results
+
+        self.assertIsInstance(results[0], Transfer)
+        self.assertEqual((results[0].transfer_uuid, results[0].amount), ("t1", "10"))
+        self.assertIsNone(results[0].from_portfolio)
+
+    def test_rejects_compact(self):
+        with self.assertRaises(ValueError):
+            Decoder(lazy=True, compact=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import MagicMock
+import requests
+from intx_sdk.client import Client
+from intx_sdk.credentials import Credentials
+from intx_sdk.errors import (
+    IntxError,
+    ValidationError,
+    AuthenticationError,
+    NotFoundError,
+    RateLimitedError,
+    ServerError,
+    IntxTimeoutError,
+    IntxConnectionError,
+)
+from intx_sdk.rate_limit import RateLimitExceeded, EndpointClass
+from intx_sdk.retry import RetryPolicy
+from tests.test_constants import BASE_URL
+
+
+def http_response(status_code, content=b'{}', headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.text = content.decode()
+    response.headers = headers or {}
+    return response
+
+
+class TestErrors(unittest.TestCase):
+
+    def setUp(self):
+        credentials = Credentials(access_key="test_key", passphrase="test_passphrase", signing_key="dGVzdA==")
+        self.session = MagicMock()
+        self.client = Client(credentials, http_client=self.session, base_url=BASE_URL,
+                             retry_policy=RetryPolicy(max_attempts=1))
+
+    def raised_by(self, response):
+        self.session.request.return_value = response
+        with self.assertRaises(IntxError) as context:
+            self.client.request("GET", "/portfolios/p1")
+        return context.exception
+
+    def test_status_codes_map_to_error_classes(self):
+        cases = {
+            400: ValidationError,
+            401: AuthenticationError,
+            403: AuthenticationError,
+            404: NotFoundError,
+            422: ValidationError,
+            429: RateLimitedError,
+            500: ServerError,
+            503: ServerError,
+            418: IntxError,
+        }
+        for status_code, error_class in cases.items():
+            error = self.raised_by(http_response(status_code))
+            self.assertIs(type(error), error_class, status_code)
+            self.assertEqual(error.status_code, status_code)
+
+    def test_error_carries_parsed_body_and_request_context(self):
+        error = self.raised_by(http_response(400, b'{"title": "INVALID_REQUEST", "message": "bad size"}'))
+
+        self.assertEqual(error.error_code, "INVALID_REQUEST")
+        self.assertEqual(error.error_body, {"title": "INVALID_REQUEST", "message": "bad size"})
+        self.assertEqual((error.method, error.path), ("GET", "/portfolios/p1"))
+        self.assertGreaterEqual(error.elapsed, 0)
+        self.assertEqual(str(error), "Request failed with status 400: bad size")
+
+    def test_non_json_error_body(self):
+        error = self.raised_by(http_response(502, b'<html>Bad Gateway</html>'))
+
+        self.assertIsNone(error.error_body)
+        self.assertTrue('Bad Gateway' in str(error))
+
+    def test_rate_limited_error_exposes_retry_after(self):
+        error = self.raised_by(http_response(429, headers={"Retry-After": "2"}))
+
+        self.assertEqual(error.retry_after, 2.0)
+
+    def test_transport_failures_are_wrapped(self):
+        self.session.request.side_effect = requests.ReadTimeout("read timed out")
+        with self.assertRaises(IntxTimeoutError) as context:
+            self.client.request("GET", "/portfolios")
+        self.assertIsInstance(context.exception, TimeoutError)
+        self.assertIsNone(context.exception.status_code)
+
+        self.session.request.side_effect = requests.ConnectionError("reset")
+        with self.assertRaises(IntxConnectionError):
+            self.client.request("GET", "/portfolios")
+
+    def test_local_rate_limit_is_a_rate_limited_error(self):
+        error = RateLimitExceeded(EndpointClass.ORDER_ENTRY, 0.5)
+
+        self.assertIsInstance(error, RateLimitedError)
+        self.assertEqual(error.retry_after, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
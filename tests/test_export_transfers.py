@@ -0,0 +1,121 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs
+from unittest.mock import patch, MagicMock
+from intx_sdk import IntxServicesClient
+from intx_sdk.credentials import Credentials
+from intx_sdk.decoder import Decoder, NUMERIC_DECIMAL
+from intx_sdk.services.transfers import ExportTransfersRequest
+from intx_sdk.services.transfers.export_transfers import created_at_key, split_time_range
+from tests.test_constants import BASE_URL
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+# One transfer every 6 hours for 10 days; those at midnight fall on a window boundary
+TRANSFER_TIMES = [START + timedelta(hours=6 * i) for i in range(40)]
+
+
+def transfer(index, created_at):
+    return {
+        "transfer_uuid": f"uuid_{index}",
+        "transfer_type": "DEPOSIT",
+        "amount": "1",
+        "asset": "USDC",
+        "status": "PROCESSED",
+        "network_name": "ethereum",
+        "created_at": created_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "updated_at": created_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
+
+
+def transfers_page(method, path, query="", **kwargs):
+    params = parse_qs(query)
+    time_from = datetime.fromisoformat(params["time_from"][0].replace("Z", "+00:00"))
+    time_to = datetime.fromisoformat(params["time_to"][0].replace("Z", "+00:00"))
+    limit = int(params["result_limit"][0])
+    offset = int(params["result_offset"][0])
+    # Both bounds are inclusive, so a transfer on a window boundary is returned twice; newest first
+    matching = [transfer(i, t) for i, t in enumerate(TRANSFER_TIMES) if time_from <= t <= time_to][::-1]
+    response = MagicMock()
+    response.json.return_value = {
+        "pagination": {"result_limit": limit, "result_offset": offset},
+        "results": matching[offset:offset + limit],
+    }
+    return response
+
+
+class TestExportTransfers(unittest.TestCase):
+
+    def setUp(self):
+        credentials = Credentials(access_key="test_key", passphrase="test_passphrase", signing_key="test_signing_key")
+        self.client = IntxServicesClient(credentials, base_url=BASE_URL)
+        self.request = ExportTransfersRequest(time_from="2024-01-01T00:00:00Z", time_to="2024-01-11T00:00:00Z",
+                                              window=timedelta(days=1), max_workers=3, page_size=3)
+
+    @patch('intx_sdk.client.Client.request', side_effect=transfers_page)
+    def test_export_to_callback_in_time_order(self, mock_request):
+        transfers = []
+        response = self.client.transfers.export_transfers(self.request, transfers.append)
+
+        self.assertEqual([t.transfer_uuid for t in transfers], [f"uuid_{i}" for i in range(40)])
+        self.assertEqual(response.transfer_count, 40)
+        self.assertEqual(response.window_count, 10)
+        self.assertEqual(response.duplicate_count, 9)
+        self.assertEqual(mock_request.call_count, 20)
+
+    @patch('intx_sdk.client.Client.request', side_effect=transfers_page)
+    def test_export_to_file(self, mock_request):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "transfers.jsonl")
+            response = self.client.transfers.export_transfers(self.request, path)
+            with open(path) as f:
+                lines = [json.loads(line) for line in f]
+
+        self.assertEqual(len(lines), response.transfer_count)
+        self.assertEqual(lines[0]["transfer_uuid"], "uuid_0")
+        self.assertEqual(lines[-1]["created_at"], "2024-01-10T18:00:00Z")
+
+    @patch('intx_sdk.client.Client.request', side_effect=transfers_page)
+    def test_export_to_file_with_decimal_amounts(self, mock_request):
+        credentials = Credentials(access_key="test_key", passphrase="test_passphrase", signing_key="test_signing_key")
+        client = IntxServicesClient(credentials, base_url=BASE_URL, decoder=Decoder(numeric=NUMERIC_DECIMAL))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "transfers.jsonl")
+            response = client.transfers.export_transfers(self.request, path)
+            with open(path) as f:
+                lines = [json.loads(line) for line in f]
+
+        self.assertEqual(len(lines), response.transfer_count)
+        self.assertEqual(lines[0]["amount"], "1")
+
+    def test_created_at_key_tolerates_missing_and_bad_timestamps(self):
+        values = [None, "not a time", "2024-01-02T00:00:00Z", "2024-01-01T00:00:00Z"]
+
+        self.assertEqual(sorted(values, key=created_at_key),
+                         ["2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z", None, "not a time"])
+
+    def test_split_time_range(self):
+        windows = split_time_range("2024-01-01T00:00:00Z", "2024-01-02T12:00:00Z", timedelta(days=1))
+
+        self.assertEqual(windows, [("2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z"),
+                                   ("2024-01-02T00:00:00Z", "2024-01-02T12:00:00Z")])
+
+
+if __name__ == "__main__":
+    unittest.main()
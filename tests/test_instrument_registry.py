@@ -0,0 +1,125 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from intx_sdk import IntxServicesClient
+from intx_sdk.credentials import Credentials
+from intx_sdk.services.instruments import InstrumentRegistry
+from tests.test_constants import BASE_URL
+
+
+def instrument(instrument_id, symbol, base_increment="0.0001"):
+    return {
+        "instrument_id": instrument_id,
+        "instrument_uuid": f"uuid_{instrument_id}",
+        "symbol": symbol,
+        "type": "PERP",
+        "base_increment": base_increment,
+        "quote_increment": "0.1",
+        "min_quantity": "0.0001",
+    }
+
+
+def json_response(data):
+    response = MagicMock()
+    response.json.return_value = data
+    return response
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestInstrumentRegistry(unittest.TestCase):
+
+    def setUp(self):
+        credentials = Credentials(access_key="test_key", passphrase="test_passphrase", signing_key="test_signing_key")
+        self.client = IntxServicesClient(credentials, base_url=BASE_URL)
+        self.clock = FakeClock()
+        self.registry = InstrumentRegistry(self.client.instruments, ttl=60, clock=self.clock)
+
+    @patch('intx_sdk.client.Client.request')
+    def test_lookups_by_symbol_id_and_uuid(self, mock_request):
+        mock_request.return_value = json_response([instrument("1", "BTC-PERP"), instrument("2", "ETH-PERP")])
+
+        self.assertEqual(self.registry.get("BTC-PERP").base_increment, "0.0001")
+        self.assertEqual(self.registry.get(2).symbol, "ETH-PERP")
+        self.assertEqual(self.registry.get("uuid_1").symbol, "BTC-PERP")
+        self.assertEqual(len(self.registry.all()), 2)
+        self.assertEqual((self.registry.hits, self.registry.misses), (3, 0))
+        mock_request.assert_called_once()
+
+    @patch('intx_sdk.client.Client.request')
+    def test_unknown_instrument_is_fetched_and_cached(self, mock_request):
+        mock_request.side_effect = [json_response([instrument("1", "BTC-PERP")]),
+                                    json_response(instrument("3", "SOL-PERP"))]
+
+        self.assertEqual(self.registry.get("SOL-PERP").instrument_id, "3")
+        self.assertEqual(self.registry.get("3").symbol, "SOL-PERP")
+        self.assertEqual((self.registry.hits, self.registry.misses), (1, 1))
+        self.assertEqual(mock_request.call_args.args[1], "/instruments/SOL-PERP")
+
+    @patch('intx_sdk.client.Client.request')
+    def test_concurrent_cold_lookups_load_once(self, mock_request):
+        def slow_list(*args, **kwargs):
+            time.sleep(0.05)
+            return json_response([instrument("1", "BTC-PERP")])
+
+        mock_request.side_effect = slow_list
+        threads = [threading.Thread(target=self.registry.get, args=("BTC-PERP",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        mock_request.assert_called_once()
+        self.assertEqual((self.registry.hits, self.registry.misses), (8, 0))
+
+    @patch('intx_sdk.client.Client.request')
+    def test_stale_data_is_served_while_refreshing(self, mock_request):
+        release = threading.Event()
+        refreshed = threading.Event()
+
+        def slow_refresh(*args, **kwargs):
+            release.wait(5)
+            refreshed.set()
+            return json_response([instrument("1", "BTC-PERP", base_increment="0.01")])
+
+        mock_request.return_value = json_response([instrument("1", "BTC-PERP")])
+        self.registry.get("BTC-PERP")
+        mock_request.side_effect = slow_refresh
+        self.clock.now = 61
+
+        self.assertEqual(self.registry.get("BTC-PERP").base_increment, "0.0001")
+        self.assertEqual(self.registry.get("BTC-PERP").base_increment, "0.0001")
+        release.set()
+        refreshed.wait(5)
+        for _ in range(500):
+            if not self.registry.refreshing:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(self.registry.get("BTC-PERP").base_increment, "0.01")
+        self.assertEqual(mock_request.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
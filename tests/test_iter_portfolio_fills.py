@@ -0,0 +1,123 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+from urllib.parse import parse_qs
+from unittest.mock import patch, MagicMock, AsyncMock
+from intx_sdk import IntxServicesClient, AsyncIntxServicesClient
+from intx_sdk.credentials import Credentials
+from intx_sdk.pagination import PaginationCheckpoint
+from intx_sdk.services.model import PortfolioFill
+from intx_sdk.services.portfolios import ListPortfolioFillsRequest, ListFillsByPortfoliosRequest
+from tests.test_constants import BASE_URL
+
+TOTAL_FILLS = 7
+REF_DATETIME = "2025-01-01T00:00:00Z"
+
+
+def fill(index):
+    return {
+        "portfolio_id": "p1",
+        "portfolio_uuid": "uuid_1",
+        "fill_id": f"fill_{index}",
+        "symbol": "BTC-PERP",
+        "fill_price": "100",
+        "fill_qty": "1",
+        "side": "BUY",
+        "event_time": "2024-12-31T00:00:00Z",
+    }
+
+
+def fills_page(method, path, query="", max_limit=None, **kwargs):
+    params = parse_qs(query)
+    limit = int(params["result_limit"][0])
+    if max_limit is not None:
+        limit = min(limit, max_limit)
+    offset = int(params["result_offset"][0])
+    response = MagicMock()
+    response.json.return_value = {
+        "pagination": {"result_limit": limit, "result_offset": offset, "ref_datetime": REF_DATETIME},
+        "results": [fill(i) for i in range(offset, min(offset + limit, TOTAL_FILLS))],
+    }
+    return response
+
+
+class TestIterPortfolioFills(unittest.TestCase):
+
+    def setUp(self):
+        credentials = Credentials(access_key="test_key", passphrase="test_passphrase", signing_key="test_signing_key")
+        self.client = IntxServicesClient(credentials, base_url=BASE_URL)
+
+    @patch('intx_sdk.client.Client.request', side_effect=fills_page)
+    def test_walks_all_pages(self, mock_request):
+        fills = list(self.client.portfolios.iter_portfolio_fills(ListPortfolioFillsRequest(portfolio="p1"),
+                                                                 page_size=3))
+
+        self.assertEqual([f.fill_id for f in fills], [f"fill_{i}" for i in range(TOTAL_FILLS)])
+        self.assertTrue(all(isinstance(f, PortfolioFill) for f in fills))
+        self.assertEqual(mock_request.call_count, 3)
+        queries = [call.kwargs["query"] for call in mock_request.call_args_list]
+        self.assertNotIn("ref_datetime", queries[0])
+        self.assertTrue(all(f"ref_datetime={REF_DATETIME}" in q for q in queries[1:]))
+
+    @patch('intx_sdk.client.Client.request', side_effect=fills_page)
+    def test_prefetch_yields_same_fills(self, mock_request):
+        request = ListFillsByPortfoliosRequest(portfolios="p1")
+        fills = list(self.client.portfolios.iter_fills_by_portfolios(request, page_size=2, prefetch=True))
+
+        self.assertEqual([f.fill_id for f in fills], [f"fill_{i}" for i in range(TOTAL_FILLS)])
+        self.assertEqual(mock_request.call_count, 4)
+
+    @patch('intx_sdk.client.Client.request', side_effect=fills_page)
+    def test_resume_from_checkpoint(self, mock_request):
+        request = ListPortfolioFillsRequest(portfolio="p1")
+        iterator = self.client.portfolios.iter_portfolio_fills(request, page_size=3)
+        first = []
+        for f in iterator:
+            first.append(f.fill_id)
+            if len(first) == 4:
+                break
+
+        self.assertEqual(iterator.checkpoint, PaginationCheckpoint(result_offset=4, ref_datetime=REF_DATETIME))
+        resumed = self.client.portfolios.iter_portfolio_fills(request, page_size=3, checkpoint=iterator.checkpoint)
+        rest = [f.fill_id for f in resumed]
+
+        self.assertEqual(first + rest, [f"fill_{i}" for i in range(TOTAL_FILLS)])
+
+    @patch('intx_sdk.client.Client.request', side_effect=lambda *args, **kwargs: fills_page(*args, max_limit=2, **kwargs))
+    def test_server_side_limit_cap(self, mock_request):
+        fills = list(self.client.portfolios.iter_portfolio_fills(ListPortfolioFillsRequest(portfolio="p1"),
+                                                                 page_size=5, prefetch=True))
+
+        self.assertEqual([f.fill_id for f in fills], [f"fill_{i}" for i in range(TOTAL_FILLS)])
+        self.assertEqual(mock_request.call_count, 4)
+
+    def test_async_iterator(self):
+        credentials = Credentials(access_key="test_key", passphrase="test_passphrase", signing_key="test_signing_key")
+        client = AsyncIntxServicesClient(credentials, base_url=BASE_URL)
+
+        async def run():
+            iterator = client.portfolios.iter_portfolio_fills(ListPortfolioFillsRequest(portfolio="p1"),
+                                                              page_size=3, prefetch=True)
+            return [f.fill_id async for f in iterator]
+
+        with patch('intx_sdk.async_client.AsyncClient.request', new_callable=AsyncMock, side_effect=fills_page):
+            fill_ids = asyncio.run(run())
+
+        self.assertEqual(fill_ids, [f"fill_{i}" for i in range(TOTAL_FILLS)])
+
+
+if __name__ == "__main__":
+    unittest.main()
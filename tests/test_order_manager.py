@@ -0,0 +1,139 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from urllib.parse import parse_qs
+from intx_sdk import IntxServicesClient
+from intx_sdk.credentials import Credentials
+from intx_sdk.enums import OrderSide, OrderType, TimeInForce
+from intx_sdk.services.orders import (CancelOrderRequest, CancelOrdersRequest, CreateOrderRequest,
+                                      ModifyOpenOrderRequest, OrderManager)
+from tests.test_constants import BASE_URL
+
+
+def order(order_id, symbol="BTC-PERP", side="BUY", price="60000", status="WORKING", portfolio="p1"):
+    return {"order_id": order_id, "client_order_id": f"c{order_id}", "symbol": symbol, "side": side,
+            "price": price, "size": "1", "order_status": status, "portfolio_id": portfolio, "portfolio_uuid": portfolio}
+
+
+class FakeExchange:
+    """Serves create, modify and cancel calls and a paginated open-order listing"""
+
+    def __init__(self):
+        self.open = {}
+
+    def __call__(self, method, path, query="", body=None, **kwargs):
+        response = MagicMock()
+        params = {k: v[0] for k, v in parse_qs(query or "").items()}
+        if method == "POST":
+            order_id = len(self.open) + 100
+            self.open[order_id] = order(order_id, side=body["side"], price=body["price"])
+            response.json.return_value = self.open[order_id]
+        elif method == "PUT":
+            order_id = int(path.rsplit("/", 1)[1])
+            self.open[order_id] = {**self.open[order_id], "price": body["price"]}
+            response.json.return_value = self.open[order_id]
+        elif method == "DELETE" and path == "/orders":
+            response.json.return_value = [self.open.pop(k) for k in list(self.open)]
+        elif method == "DELETE":
+            response.json.return_value = {**self.open.pop(int(path.rsplit("/", 1)[1])), "order_status": "DONE"}
+        else:
+            offset, limit = int(params["result_offset"]), int(params["result_limit"])
+            response.json.return_value = {"pagination": {"result_offset": offset, "ref_datetime": "t"},
+                                          "results": list(self.open.values())[offset:offset + limit]}
+        return response
+
+
+class TestOrderManager(unittest.TestCase):
+
+    def setUp(self):
+        credentials = Credentials(access_key="test_key", passphrase="test_passphrase", signing_key="test_signing_key")
+        self.client = IntxServicesClient(credentials, base_url=BASE_URL)
+        self.manager = OrderManager(self.client.orders, portfolio="p1", page_size=2)
+        self.client.orders.manager = self.manager
+        self.exchange = FakeExchange()
+        patcher = patch('intx_sdk.client.Client.request', side_effect=self.exchange)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create(self, side=OrderSide.BUY, price="60000"):
+        return self.client.orders.create_order(CreateOrderRequest(
+            client_order_id="ignored", side=side, size="1", tif=TimeInForce.GTC, instrument="BTC-PERP",
+            type=OrderType.LIMIT, price=price))
+
+    def test_tracks_create_modify_and_cancel(self):
+        buy, sell = self.create(), self.create(side=OrderSide.SELL, price="61000")
+
+        self.assertIs(self.manager.get(buy.order_id), buy)
+        self.assertIs(self.manager.get_by_client_order_id(sell.client_order_id), sell)
+        self.assertEqual(self.manager.for_side(OrderSide.SELL), [sell])
+        self.assertEqual(len(self.manager.for_instrument("BTC-PERP")), 2)
+
+        self.client.orders.modify_open_order(ModifyOpenOrderRequest(
+            id=str(buy.order_id), client_order_id=buy.client_order_id, portfolio="p1", price="59000"))
+        self.assertEqual(self.manager.get(buy.order_id).price, "59000")
+        self.assertEqual(len(self.manager), 2)
+
+        self.client.orders.cancel_order(CancelOrderRequest(id=str(buy.order_id), portfolio="p1"))
+        self.assertIsNone(self.manager.get(buy.order_id))
+        self.assertEqual(self.manager.for_side(OrderSide.BUY), [])
+
+        self.client.orders.cancel_orders(CancelOrdersRequest(portfolio="p1"))
+        self.assertEqual(len(self.manager), 0)
+        self.assertEqual(self.manager.for_instrument("BTC-PERP"), [])
+
+    def test_reconcile_reports_differences(self):
+        kept, changed, removed = self.create(), self.create(), self.create()
+        self.exchange.open[changed.order_id]["price"] = "1"
+        del self.exchange.open[removed.order_id]
+        self.exchange.open[7] = order(7, symbol="ETH-PERP", side="SELL")
+
+        diff = self.manager.reconcile()
+
+        self.assertEqual([o.order_id for o in diff.added], [7])
+        self.assertEqual([o.order_id for o in diff.changed], [changed.order_id])
+        self.assertEqual([o.order_id for o in diff.removed], [removed.order_id])
+        self.assertEqual(self.manager.get(changed.order_id).price, "1")
+        self.assertEqual(self.manager.for_instrument("ETH-PERP")[0].order_id, 7)
+        self.assertIsNotNone(self.manager.get(kept.order_id))
+        self.assertFalse(self.manager.reconcile())
+
+    def test_orders_recorded_during_a_listing_are_kept(self):
+        started = self.manager.sequence
+        created = self.create()
+
+        diff = self.manager.apply_snapshot([], since=started)
+
+        self.assertEqual(diff.removed, [])
+        self.assertIsNotNone(self.manager.get(created.order_id))
+        self.assertEqual(self.manager.apply_snapshot([]).removed, [created])
+
+    def test_periodic_reconcile(self):
+        self.exchange.open[7] = order(7)
+
+        self.manager.start(0.01)
+        deadline = time.monotonic() + 5
+        while self.manager.get(7) is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.manager.stop()
+
+        self.assertIsNotNone(self.manager.get(7))
+        self.assertIsNone(self.manager.last_error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+from intx_sdk import IntxServicesClient, PreTradeValidationError
+from intx_sdk.credentials import Credentials
+from intx_sdk.decoder import Decoder
+from intx_sdk.enums import OrderSide, OrderType, TimeInForce
+from intx_sdk.services.model import InstrumentDetails
+from intx_sdk.services.orders import CreateOrderRequest, ModifyOpenOrderRequest, OrderValidator
+from tests.test_constants import BASE_URL
+
+
+class Instruments:
+    def __init__(self, *instruments):
+        self.by_symbol = {i.symbol: i for i in instruments}
+
+    def get(self, symbol):
+        return self.by_symbol[symbol]
+
+
+def instrument(**overrides):
+    return Decoder().decode(InstrumentDetails, {
+        "symbol": "BTC-PERP", "trading_state": "TRADING", "quote_increment": "0.1", "base_increment": "0.0001",
+        "min_quantity": "0.0001", "min_notional_value": "10", "price_band_percent": 0.05,
+        "quote": {"mark_price": "60000"}, **overrides})
+
+
+def order(price="60000.1", size="0.01", type=OrderType.LIMIT, **kwargs):
+    kwargs.setdefault("client_order_id", "c1")
+    return CreateOrderRequest(side=OrderSide.BUY, size=size, tif=TimeInForce.GTC,
+                              instrument="BTC-PERP", type=type, price=price, **kwargs)
+
+
+class TestOrderValidator(unittest.TestCase):
+
+    def assertRejected(self, validator, request, code):
+        with self.assertRaises(PreTradeValidationError) as context:
+            validator.validate_create(request)
+        self.assertEqual(context.exception.error_code, code)
+        self.assertIsNone(context.exception.status_code)
+
+    def test_accepts_valid_orders(self):
+        validator = OrderValidator(Instruments(instrument()))
+
+        validator.validate_create(order())
+        validator.validate_create(order(price=None, size="0.001", type=OrderType.MARKET))
+        validator.validate_create(order(price="61000", stop_price="60500.5", type=OrderType.STOP_LIMIT))
+
+    def test_rejections(self):
+        validator = OrderValidator(Instruments(instrument()))
+
+        self.assertRejected(validator, order(price="60000.05"), "PRICE_INCREMENT")
+        self.assertRejected(validator, order(stop_price="60000.01"), "PRICE_INCREMENT")
+        self.assertRejected(validator, order(size="0.00015"), "SIZE_INCREMENT")
+        self.assertRejected(validator, order(size="0.0001"), "MIN_NOTIONAL")
+        self.assertRejected(validator, order(price="70000"), "PRICE_BAND")
+        self.assertRejected(validator, order(size="abc"), "INVALID_NUMBER")
+        self.assertRejected(validator, order(price=None, size="0.0001", type=OrderType.MARKET), "MIN_NOTIONAL")
+        self.assertRejected(OrderValidator(Instruments(instrument(min_quantity="0.1"))), order(), "MIN_QUANTITY")
+        self.assertRejected(OrderValidator(Instruments(instrument(trading_state="CANCEL_ONLY"))), order(),
+                            "TRADING_STATE")
+
+    def test_reference_price_and_decimal_mode(self):
+        details = Decoder(numeric="decimal").decode(InstrumentDetails, vars(instrument()))
+        validator = OrderValidator(Instruments(details), reference_price=lambda symbol: "70000")
+
+        validator.validate_create(order(price="70000"))
+        self.assertRejected(validator, order(price="60000"), "PRICE_BAND")
+
+    def test_modify_uses_instrument_of_validated_create(self):
+        validator = OrderValidator(Instruments(instrument()))
+        modify = ModifyOpenOrderRequest(id="1", client_order_id="c1", portfolio="p", price="60000.05")
+
+        validator.validate_modify(modify)
+        validator.validate_create(order())
+        with self.assertRaises(PreTradeValidationError):
+            validator.validate_modify(modify)
+
+    def test_trading_states(self):
+        for state in ("PAUSED", "HALT", "DELISTED", "CANCEL_ONLY", "TRADING_DISABLED",
+                      "CANCEL_ONLY_ENFORCED_BY_COINBASE_INTERNATIONAL_EXCHANGE", "COINBASE_EXCHANGE_UNREACHABLE"):
+            self.assertRejected(OrderValidator(Instruments(instrument(trading_state=state))), order(), "TRADING_STATE")
+
+        limit_only = OrderValidator(Instruments(instrument(trading_state="LIMIT_ONLY")))
+        limit_only.validate_create(order())
+        self.assertRejected(limit_only, order(price=None, type=OrderType.MARKET), "TRADING_STATE")
+
+        post_only = OrderValidator(Instruments(instrument(trading_state="POST_ONLY")))
+        post_only.validate_create(order(post_only="true"))
+        self.assertRejected(post_only, order(), "TRADING_STATE")
+        self.assertRejected(post_only, order(price=None, type=OrderType.MARKET, post_only="true"), "TRADING_STATE")
+
+    def test_concurrent_creates_at_capacity(self):
+        validator = OrderValidator(Instruments(instrument()), max_tracked_orders=8)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda i: validator.validate_create(order(client_order_id=f"c{i}")), range(2000)))
+
+        self.assertEqual(len(validator.order_instruments), 8)
+
+    @patch('intx_sdk.client.Client.request')
+    def test_service_does_not_send_invalid_orders(self, mock_request):
+        mock_request.return_value = MagicMock(**{"json.return_value": {"client_order_id": "c1"}})
+        client = IntxServicesClient(Credentials(access_key="test_key", passphrase="test_passphrase",
+                                                signing_key="test_signing_key"), base_url=BASE_URL)
+        client.orders.validator = OrderValidator(Instruments(instrument()))
+
+        with self.assertRaises(PreTradeValidationError):
+            client.orders.create_order(order(price="60000.05"))
+        mock_request.assert_not_called()
+
+        client.orders.create_order(order())
+        mock_request.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import unittest
+from unittest.mock import MagicMock
+from intx_sdk.client import Client
+from intx_sdk.credentials import Credentials
+from intx_sdk.rate_limit import (
+    EndpointClass,
+    RateLimit,
+    RateLimiter,
+    RateLimitExceeded,
+    TokenBucket,
+    classify_endpoint,
+)
+from tests.test_constants import BASE_URL
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRateLimit(unittest.TestCase):
+
+    def test_classify_endpoint(self):
+        self.assertEqual(classify_endpoint("POST", "/orders"), EndpointClass.ORDER_ENTRY)
+        self.assertEqual(classify_endpoint("DELETE", "/orders/123"), EndpointClass.ORDER_ENTRY)
+        self.assertEqual(classify_endpoint("GET", "/orders"), EndpointClass.PRIVATE)
+        self.assertEqual(classify_endpoint("GET", "/portfolios"), EndpointClass.PRIVATE)
+        self.assertEqual(classify_endpoint("GET", "/instruments/BTC-PERP/quote"), EndpointClass.PUBLIC)
+
+    def test_token_bucket_refills_over_time(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+        self.assertTrue(bucket.acquire(blocking=False))
+        self.assertTrue(bucket.acquire(blocking=False))
+        self.assertFalse(bucket.acquire(blocking=False))
+        self.assertAlmostEqual(bucket.time_until_available(), 0.5)
+
+        clock.now += 0.5
+        self.assertTrue(bucket.acquire(blocking=False))
+
+    def test_token_bucket_rejects_invalid_limits(self):
+        for rate, capacity in ((0, None), (-1, 5), (10, 0.5), (10, 0)):
+            with self.assertRaises(ValueError):
+                TokenBucket(rate=rate, capacity=capacity)
+        with self.assertRaises(ValueError):
+            RateLimiter({EndpointClass.PUBLIC: RateLimit(rate=10, burst=0)})
+
+        bucket = TokenBucket(rate=0.5)
+        self.assertEqual(bucket.capacity, 1)
+        with self.assertRaises(ValueError):
+            bucket.acquire(tokens=2)
+
+    def test_blocking_acquire_is_thread_safe(self):
+        bucket = TokenBucket(rate=1000, capacity=10)
+        acquired = []
+
+        def worker():
+            for _ in range(10):
+                acquired.append(bucket.acquire())
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(acquired), 40)
+        self.assertTrue(all(acquired))
+
+    def test_async_acquire(self):
+        bucket = TokenBucket(rate=1000, capacity=1)
+
+        async def run():
+            return await asyncio.gather(*[bucket.acquire_async() for _ in range(5)])
+
+        self.assertEqual(asyncio.run(run()), [True] * 5)
+
+    def test_non_blocking_limiter_raises_before_sending(self):
+        clock = FakeClock()
+        limiter = RateLimiter({EndpointClass.ORDER_ENTRY: RateLimit(rate=1)}, blocking=False, clock=clock)
+        session = MagicMock()
+        session.request.return_value.status_code = 200
+        session.request.return_value.content = b'{}'
+        credentials = Credentials(access_key="test_key", passphrase="test_passphrase", signing_key="dGVzdA==")
+        client = Client(credentials, http_client=session, base_url=BASE_URL, rate_limiter=limiter)
+
+        client.request("POST", "/orders", body={})
+        with self.assertRaises(RateLimitExceeded) as context:
+            client.request("POST", "/orders", body={})
+        client.request("GET", "/portfolios")
+
+        self.assertEqual(context.exception.endpoint_class, EndpointClass.ORDER_ENTRY)
+        self.assertAlmostEqual(context.exception.retry_after, 1.0)
+        self.assertEqual(session.request.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from intx_sdk import IntxServicesClient
+from intx_sdk.credentials import Credentials
+from intx_sdk.errors import ValidationError
+from intx_sdk.services.orders import ModifyOpenOrderRequest, Requoter
+from tests.test_constants import BASE_URL
+
+
+def quote(order_id, price):
+    return ModifyOpenOrderRequest(id=order_id, client_order_id=f"c-{order_id}", portfolio="p", price=price)
+
+
+class FakeExchange:
+    """Answers modify_open_order after a delay, tracking concurrency overall and per order"""
+
+    def __init__(self, delay=0.02, reject_price=None):
+        self.delay = delay
+        self.reject_price = reject_price
+        self.sent = []
+        self.gets = 0
+        self.in_flight = {}
+        self.max_in_flight = 0
+        self.max_in_flight_per_order = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, method, path, body=None, **kwargs):
+        order_id = path.rsplit("/", 1)[-1]
+        with self.lock:
+            if method == "GET":
+                self.gets += 1
+            else:
+                self.sent.append((order_id, body["price"]))
+            self.in_flight[order_id] = self.in_flight.get(order_id, 0) + 1
+            self.max_in_flight = max(self.max_in_flight, sum(self.in_flight.values()))
+            self.max_in_flight_per_order = max(self.max_in_flight_per_order, self.in_flight[order_id])
+        try:
+            time.sleep(self.delay)
+            if body is not None and body["price"] == self.reject_price:
+                raise ValidationError("rejected", status_code=400)
+            response = MagicMock()
+            response.json.return_value = {"order_id": order_id, "price": body["price"] if body else None}
+            return response
+        finally:
+            with self.lock:
+                self.in_flight[order_id] -= 1
+
+
+class TestRequoter(unittest.TestCase):
+
+    def setUp(self):
+        credentials = Credentials(access_key="test_key", passphrase="test_passphrase", signing_key="test_signing_key")
+        self.client = IntxServicesClient(credentials, base_url=BASE_URL)
+
+    def test_superseded_updates_are_coalesced(self):
+        exchange = FakeExchange()
+
+        with patch('intx_sdk.client.Client.request', side_effect=exchange), Requoter(self.client.orders) as requoter:
+            futures = [requoter.update(quote("1", str(100 + i))) for i in range(5)]
+            requoter.flush(timeout=5)
+
+        results = [f.result() for f in futures]
+        self.assertEqual(exchange.sent, [("1", "100"), ("1", "104")])
+        self.assertEqual([r.superseded for r in results], [False, True, True, True, False])
+        self.assertEqual(results[-1].order.price, "104")
+        self.assertGreater(results[-1].queued, 0)
+        self.assertEqual(exchange.max_in_flight_per_order, 1)
+        self.assertEqual(requoter.stats().superseded, 3)
+
+    def test_orders_are_updated_concurrently_with_stats(self):
+        exchange = FakeExchange(reject_price="7")
+
+        with patch('intx_sdk.client.Client.request', side_effect=exchange), \
+                Requoter(self.client.orders, max_workers=4) as requoter:
+            started = time.perf_counter()
+            futures = [requoter.update(quote(str(i), str(i))) for i in range(8)]
+            requoter.flush(timeout=5)
+            elapsed = time.perf_counter() - started
+
+        self.assertEqual(exchange.max_in_flight, 4)
+        self.assertLess(elapsed, 8 * exchange.delay)
+        self.assertIsInstance(futures[7].result().error, ValidationError)
+        stats = requoter.stats()
+        self.assertEqual((stats.sent, stats.failed, stats.in_flight), (8, 1, 0))
+        self.assertGreaterEqual(stats.p50, exchange.delay)
+        self.assertLessEqual(stats.p50, stats.p99)
+        self.assertLessEqual(stats.p99, stats.max)
+
+    def test_warm_opens_one_connection_per_worker(self):
+        exchange = FakeExchange(delay=0.01)
+
+        with patch('intx_sdk.client.Client.request', side_effect=exchange), \
+                Requoter(self.client.orders, max_workers=3) as requoter:
+            requoter.start(interval=60)
+            deadline = time.monotonic() + 5
+            while exchange.gets < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            requoter.stop()
+
+        self.assertEqual(exchange.gets, 3)
+        self.assertEqual(exchange.max_in_flight, 3)
+        self.assertIsNone(requoter.last_error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+# Copyright 2025-present Coinbase Global, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest.mock import MagicMock, patch
+import requests
+from intx_sdk import IntxServicesClient
+from intx_sdk.client import Client
+from intx_sdk.credentials import Credentials
+from intx_sdk.retry import RetryPolicy, parse_retry_after
+from intx_sdk.services.orders import CreateOrderRequest, CreateOrderResponse
+from tests.test_constants import BASE_URL
+
+NO_WAIT = RetryPolicy(max_attempts=3, backoff_base=0, jitter=False)
+
+
+def http_response(status_code, content=b'{}', headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.text = content.decode()
+    response.headers = headers or {}
+    return response
+
+
+class TestRetry(unittest.TestCase):
+
+    def setUp(self):
+        self.credentials = Credentials(access_key="test_key", passphrase="test_passphrase", signing_key="dGVzdA==")
+        self.session = MagicMock()
+
+    def client(self, policy=NO_WAIT):
+        return Client(self.credentials, http_client=self.session, base_url=BASE_URL, retry_policy=policy)
+
+    def test_get_is_retried_on_transient_status(self):
+        self.session.request.side_effect = [http_response(503), http_response(502), http_response(200, b'[]')]
+
+        response = self.client().request("GET", "/portfolios")
+
+        self.assertEqual(response.json(), [])
+        self.assertEqual(self.session.request.call_count, 3)
+
+    def test_gives_up_after_max_attempts(self):
+        self.session.request.return_value = http_response(503, b'{"message": "unavailable"}')
+
+        with self.assertRaises(Exception) as context:
+            self.client().request("GET", "/portfolios")
+
+        self.assertTrue('unavailable' in str(context.exception))
+        self.assertEqual(self.session.request.call_count, 3)
+
+    def test_non_idempotent_post_is_not_retried(self):
+        self.session.request.return_value = http_response(503)
+
+        with self.assertRaises(Exception):
+            self.client().request("POST", "/portfolios/transfer", body={"amount": "1"})
+
+        self.assertEqual(self.session.request.call_count, 1)
+
+    def test_connection_errors_are_retried_for_gets(self):
+        self.session.request.side_effect = [requests.ConnectionError("reset"), http_response(200, b'[]')]
+
+        self.client().request("GET", "/portfolios")
+
+        self.assertEqual(self.session.request.call_count, 2)
+
+    def test_create_order_with_client_order_id_is_retried_and_resigned(self):
+        self.session.request.side_effect = [http_response(429, headers={"Retry-After": "0"}),
+                                            http_response(200, b'{}')]
+        services = IntxServicesClient(self.credentials, base_url=BASE_URL, retry_policy=NO_WAIT)
+        services.client.http_client = self.session
+        request = CreateOrderRequest(client_order_id="abc", side="BUY", size="1", tif="GTC",
+                                     instrument="BTC-PERP", type="LIMIT", price="100")
+
+        with patch('intx_sdk.client.time.time', side_effect=[1000.0, 1001.0]):
+            response = services.orders.create_order(request)
+
+        self.assertEqual(self.session.request.call_count, 2)
+        first, second = (call.kwargs["headers"] for call in self.session.request.call_args_list)
+        self.assertEqual((first["CB-ACCESS-TIMESTAMP"], second["CB-ACCESS-TIMESTAMP"]), ("1000", "1001"))
+        self.assertNotEqual(first["CB-ACCESS-SIGN"], second["CB-ACCESS-SIGN"])
+        self.assertIsInstance(response, CreateOrderResponse)
+
+    def test_backoff_honors_retry_after(self):
+        policy = RetryPolicy(backoff_base=0.1, backoff_max=1.0, jitter=False, max_retry_after=10)
+
+        self.assertAlmostEqual(policy.backoff(1), 0.1)
+        self.assertAlmostEqual(policy.backoff(3), 0.4)
+        self.assertAlmostEqual(policy.backoff(10), 1.0)
+        self.assertAlmostEqual(policy.backoff(1, retry_after=2.5), 2.5)
+        self.assertAlmostEqual(policy.backoff(1, retry_after=60), 10)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("3"), 3.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()